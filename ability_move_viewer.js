@@ -6,6 +6,7 @@ let movesList = [];
 let allPokemon = [];
 let moveToPokemon = new Map();
 let abilityToPokemon = new Map();
+let spriteAtlas = null;
 
 function getTypeColor(type) {
   const typeColors = {
@@ -24,6 +25,26 @@ function hexToRgb(hex) {
   return result ? `${parseInt(result[1], 16)}, ${parseInt(result[2], 16)}, ${parseInt(result[3], 16)}` : null;
 }
 
+// One Pokémon icon; drawn from the Icons sprite atlas when the build made one, so a
+// card full of icons costs a few sheet requests instead of one request per icon
+function pokemonIconHtml(p) {
+  const icons = spriteAtlas && spriteAtlas.Icons;
+  const rect = icons && icons.Sprites[p.InternalName] && icons.Sprites[p.InternalName]['0'];
+  if (!rect) {
+    return `<img src="./games/${window.game}/images/Front/${p.InternalName}.png" alt="${p.Name}" title="${p.Name}" class="pokemon-icon" data-internal-name="${p.InternalName}" onerror="this.src='./games/${window.game}/images/Front/000.png'">`;
+  }
+  const [sheetIndex, x, y, , height] = rect;
+  const sheet = icons.Sheets[sheetIndex];
+  // Icons hold their animation frames side by side; the first square frame fills the icon box
+  const scale = 40 / height;
+  const style = [
+    `background-image:url('./games/${window.game}/images/${sheet.File}')`,
+    `background-size:${sheet.Width * scale}px ${sheet.Height * scale}px`,
+    `background-position:-${x * scale}px -${y * scale}px`
+  ].join(';');
+  return `<span role="img" aria-label="${p.Name}" title="${p.Name}" class="pokemon-icon atlas-icon" data-internal-name="${p.InternalName}" style="${style}"></span>`;
+}
+
 function getPokemonForAbility(abilityName) {
   const normalizedAbility = abilityName.replace(/\s+/g, '').toLowerCase();
   const pokemonNames = Array.from(abilityToPokemon.get(normalizedAbility) || []);
@@ -40,57 +61,91 @@ loadData();
 
 async function loadData() {
   try {
-    const [a, m, p] = await Promise.all([
+    const [a, m, p, l, h] = await Promise.all([
       fetch(`./games/${window.game}/data/abilities.json`),
       fetch(`./games/${window.game}/data/moves.json`),
-      fetch(`./games/${window.game}/data/pokemon_master_evo.json`)
+      fetch(`./games/${window.game}/data/pokemon_master_evo.json`),
+      fetch(`./games/${window.game}/data/move_learners.json`),
+      fetch(`./games/${window.game}/data/ability_holders.json`)
     ]);
 
     abilitiesList = await a.json();
     movesList = await m.json();
     allPokemon = await p.json();
-
-    // Build indexes for fast lookup
-    allPokemon.forEach(p => {
-      // Abilities
-      const abilities = Array.isArray(p.Abilities) ? p.Abilities : (p.Abilities ? p.Abilities.split(',').map(a => a.trim()) : []);
-      const hidden = Array.isArray(p.HiddenAbilities) ? p.HiddenAbilities : (p.HiddenAbilities ? p.HiddenAbilities.split(',').map(a => a.trim()) : []);
-      [...abilities, ...hidden].forEach(a => {
-        const norm = a.replace(/\s+/g, '').toLowerCase();
-        if (!abilityToPokemon.has(norm)) abilityToPokemon.set(norm, new Set());
-        abilityToPokemon.get(norm).add(p.InternalName);
+    const moveLearners = l.ok ? await l.json() : null;
+    const abilityHolders = h.ok ? await h.json() : null;
+    spriteAtlas = await fetch(`./games/${window.game}/data/sprite_atlas.json`)
+      .then(res => res.ok ? res.json() : null)
+      .catch(() => null);
+
+    // Abilities: regular and hidden holders, with forms listed under their base species
+    if (abilityHolders) {
+      Object.entries(abilityHolders.Abilities).forEach(([ability, slots]) => {
+        const holders = new Set();
+        [...slots.Regular, ...slots.Hidden].forEach(ref => {
+          holders.add(abilityHolders.Species[abilityHolders.Base[ref]]);
+        });
+        abilityToPokemon.set(ability.replace(/\s+/g, '').toLowerCase(), holders);
       });
+    } else {
+      // Games built without the index: scan every Pokemon's ability slots
+      allPokemon.forEach(p => {
+        const abilities = Array.isArray(p.Abilities) ? p.Abilities : (p.Abilities ? p.Abilities.split(',').map(a => a.trim()) : []);
+        const hidden = Array.isArray(p.HiddenAbilities) ? p.HiddenAbilities : (p.HiddenAbilities ? p.HiddenAbilities.split(',').map(a => a.trim()) : []);
+        [...abilities, ...hidden].forEach(a => {
+          const norm = a.replace(/\s+/g, '').toLowerCase();
+          if (!abilityToPokemon.has(norm)) abilityToPokemon.set(norm, new Set());
+          abilityToPokemon.get(norm).add(p.InternalName);
+        });
+      });
+    }
 
-      // Moves
-      // Level up
-      if (Array.isArray(p.Moves)) {
-        for (let i = 1; i < p.Moves.length; i += 2) {
-          const norm = p.Moves[i].replace(/\s+/g, '').toLowerCase();
-          if (!moveToPokemon.has(norm)) moveToPokemon.set(norm, new Set());
-          moveToPokemon.get(norm).add(p.InternalName);
+    // Moves: the build emits learners by level-up ([species, level]), tutor and egg;
+    // forms are listed under their base species since the cards link to it
+    if (moveLearners) {
+      Object.entries(moveLearners.Moves).forEach(([move, methods]) => {
+        const learners = new Set();
+        Object.values(methods).forEach(entries => {
+          entries.forEach(entry => {
+            const ref = Array.isArray(entry) ? entry[0] : entry;
+            learners.add(moveLearners.Species[moveLearners.Base[ref]]);
+          });
+        });
+        moveToPokemon.set(move.toLowerCase(), learners);
+      });
+    } else {
+      // Games built without the index: scan every Pokemon's move lists
+      allPokemon.forEach(p => {
+        // Level up
+        if (Array.isArray(p.Moves)) {
+          for (let i = 1; i < p.Moves.length; i += 2) {
+            const norm = p.Moves[i].replace(/\s+/g, '').toLowerCase();
+            if (!moveToPokemon.has(norm)) moveToPokemon.set(norm, new Set());
+            moveToPokemon.get(norm).add(p.InternalName);
+          }
         }
-      }
-      // Tutor
-      if (Array.isArray(p.TutorMoves)) {
-        p.TutorMoves.forEach(m => {
+        // Tutor
+        if (Array.isArray(p.TutorMoves)) {
+          p.TutorMoves.forEach(m => {
+            const norm = m.replace(/\s+/g, '').toLowerCase();
+            if (!moveToPokemon.has(norm)) moveToPokemon.set(norm, new Set());
+            moveToPokemon.get(norm).add(p.InternalName);
+          });
+        }
+        // Egg
+        let eggMoves = [];
+        if (typeof p.EggMoves === 'string') {
+          eggMoves = p.EggMoves.split(',').map(m => m.trim());
+        } else if (Array.isArray(p.EggMoves)) {
+          eggMoves = p.EggMoves;
+        }
+        eggMoves.forEach(m => {
           const norm = m.replace(/\s+/g, '').toLowerCase();
           if (!moveToPokemon.has(norm)) moveToPokemon.set(norm, new Set());
           moveToPokemon.get(norm).add(p.InternalName);
         });
-      }
-      // Egg
-      let eggMoves = [];
-      if (typeof p.EggMoves === 'string') {
-        eggMoves = p.EggMoves.split(',').map(m => m.trim());
-      } else if (Array.isArray(p.EggMoves)) {
-        eggMoves = p.EggMoves;
-      }
-      eggMoves.forEach(m => {
-        const norm = m.replace(/\s+/g, '').toLowerCase();
-        if (!moveToPokemon.has(norm)) moveToPokemon.set(norm, new Set());
-        moveToPokemon.get(norm).add(p.InternalName);
       });
-    });
+    }
 
     render();
     updateTabVisibility();
@@ -204,9 +259,7 @@ function renderAbilities() {
       card.style.backgroundColor = `rgba(${hexToRgb(getTypeColor('normal'))}, 0.3)`;
 
       const pokemonList = getPokemonForAbility(a.Name);
-      const pokemonIcons = pokemonList.map(p => 
-        `<img src="./games/${window.game}/images/Front/${p.InternalName}.png" alt="${p.Name}" title="${p.Name}" class="pokemon-icon" data-internal-name="${p.InternalName}" onerror="this.src='./games/${window.game}/images/Front/000.png'">`
-      ).join('');
+      const pokemonIcons = pokemonList.map(pokemonIconHtml).join('');
 
       card.innerHTML = `
         <div class="main-info">
@@ -307,9 +360,7 @@ function renderMoves() {
         `;
 
         const pokemonList = getPokemonForMove(m.Name);
-        const pokemonIcons = pokemonList.map(p => 
-          `<img src="./games/${window.game}/images/Front/${p.InternalName}.png" alt="${p.Name}" title="${p.Name}" class="pokemon-icon" data-internal-name="${p.InternalName}" onerror="this.src='./games/${window.game}/images/Front/000.png'">`
-        ).join('');
+        const pokemonIcons = pokemonList.map(pokemonIconHtml).join('');
 
         const pokemonDiv = document.createElement('div');
         pokemonDiv.className = 'pokemon-list';
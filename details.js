@@ -1,16 +1,20 @@
-import { normalizePokemon, getInheritedEggMoves } from './utils.js';
+import { normalizePokemon, extractEggMoves, inheritedEggMovesResolver, encountersBySpecies, spriteUrl } from './utils.js';
 
 const params = new URLSearchParams(window.location.search);
 const game = params.get('game');
 const pokemonInternalName = params.get('pokemon');
 
 const pokemonDataPath = `./games/${game}/data/pokemon_master_evo.json`;
+const pokemonIndexPath = `./games/${game}/data/pokemon_index.json`;
+const pokemonShardPath = `./games/${game}/data/pokemon/${encodeURIComponent(pokemonInternalName || '')}.json`;
 const moveDataPath = `./games/${game}/data/moves.json`;
 
 let allPokemon = [];
 let allMoves = [];
 let allTypes = [];
 let allEncounters = [];
+let typeMatchups = null;
+let spriteManifest = null;
 
 let config = { excludedPokemon: [], AllowsForms: "Y" };
 let currentFormIndex = 0;
@@ -28,18 +32,56 @@ window.addEventListener('DOMContentLoaded', async () => {
       config = { excludedPokemon: [], AllowsForms: "Y" };
     }
 
-    const encounterPromise = fetch(`./games/${game}/data/encounters.json`)
-      .then(res => res.ok ? res.json() : [])
+    // Precomputed defensive profiles; without them matchups are worked out from types.json
+    const matchupsPromise = fetch(`./games/${game}/data/type_matchups.json`)
+      .then(res => res.ok ? res.json() : null)
+      .catch(() => null);
+
+    // Only this species' slice of the encounter table is needed. Species without
+    // encounters have no slice; only games built without slices at all, which
+    // have no encounters_by_species.json either, fall back to the full table
+    const speciesKey = String(pokemonInternalName || '').toUpperCase();
+    const encounterPromise = fetch(`./games/${game}/data/encounters/${speciesKey}.json`)
+      .then(res => res.ok
+        ? res.json()
+        : fetch(`./games/${game}/data/encounters_by_species.json`, { method: 'HEAD' })
+          .then(indexRes => indexRes.ok
+            ? []
+            : fetch(`./games/${game}/data/encounters.json`)
+              .then(tableRes => tableRes.ok ? tableRes.json() : [])
+              .then(encounterMaps => encountersBySpecies(encounterMaps)[speciesKey] || [])))
       .catch(() => []);
 
-    [allPokemon, allMoves, allAbilities, allTypes, allEncounters] = await Promise.all([
-      fetch(pokemonDataPath).then(res => res.json()),
+    // Which file each sprite is drawn with; without it the sprites fall back on error
+    const spriteManifestPromise = fetch(`./games/${game}/data/sprite_manifest.json`)
+      .then(res => res.ok ? res.json() : null)
+      .catch(() => null);
+
+    // This species' shard and the card index, which is enough to draw its evolution
+    // family; games built without them load the full records instead
+    const pokemonPromise = Promise.all([
+      fetch(pokemonShardPath).then(res => res.ok ? res.json() : null),
+      fetch(pokemonIndexPath).then(res => res.ok ? res.json() : null)
+    ])
+      .catch(() => [null, null])
+      .then(([shard, index]) => shard && index
+        ? index.map(p => p.InternalName === shard.InternalName ? shard : p)
+        : fetch(pokemonDataPath).then(res => res.json()));
+
+    [allPokemon, allMoves, allAbilities, allTypes, allEncounters, typeMatchups, spriteManifest] = await Promise.all([
+      pokemonPromise,
       fetch(moveDataPath).then(res => res.json()),
       fetch(`./games/${game}/data/abilities.json`).then(res => res.json()),
       fetch(`./games/${game}/data/types.json`).then(res => res.json()),
-      encounterPromise
+      encounterPromise,
+      matchupsPromise,
+      spriteManifestPromise
     ]);
 
+    allAbilities.forEach(a => {
+      if (a && a.Name) abilityByName.set(normalizeAbilityName(a.Name), a);
+    });
+
     allPokemon = allPokemon.filter(
       p => !config.excludedPokemon.includes(p.InternalName)
     );
@@ -48,18 +90,12 @@ window.addEventListener('DOMContentLoaded', async () => {
       allPokemon.forEach(p => { p.Forms = []; });
     }
 
-    allPokemon = allPokemon.map(pokemon => {
-      const inheritedMoves = getInheritedEggMoves(pokemon, allPokemon);
-      const ownEggMoves = Array.isArray(pokemon.EggMoves)
-        ? pokemon.EggMoves.map(m => m.trim()).filter(Boolean)
-        : typeof pokemon.EggMoves === 'string'
-          ? pokemon.EggMoves.split(',').map(m => m.trim()).filter(Boolean)
-          : [];
-      return {
-        ...pokemon,
-        EggMoves: [...new Set([...ownEggMoves, ...inheritedMoves])]
-      };
-    });
+    // Egg moves inherited from prevolutions are resolved by the pipeline
+    const inheritedEggMoves = inheritedEggMovesResolver(allPokemon);
+    allPokemon = allPokemon.map(pokemon => ({
+      ...pokemon,
+      EggMoves: [...new Set([...extractEggMoves(pokemon), ...inheritedEggMoves(pokemon)])]
+    }));
 
     if (!pokemonInternalName) {
       document.getElementById('main-container').innerHTML = '<p>No Pokémon specified.</p>';
@@ -93,6 +129,8 @@ window.addEventListener('DOMContentLoaded', async () => {
 });
 
 let allAbilities = [];
+// Abilities keyed by normalized name, filled once the data has loaded
+const abilityByName = new Map();
 
 function getTypeColor(type) {
   const typeColors = {
@@ -128,38 +166,28 @@ function renderEncounters(pokemon) {
   const container = document.getElementById('encounters-container');
   if (!container) return;
 
-  const lookupName = String(pokemon.InternalName).trim().toUpperCase();
   const matches = [];
-
-  allEncounters.forEach(map => {
-    const mapMatches = [];
-    const encounters = map.Encounters || {};
-
-    Object.entries(encounters).forEach(([encounterType, encounterData]) => {
-      const encounterRate = encounterData.Rate;
-      const pokemonList = Array.isArray(encounterData.Pokemon) ? encounterData.Pokemon : [];
-
-      pokemonList.forEach(entry => {
-        if (String(entry.Species).trim().toUpperCase() === lookupName) {
-          mapMatches.push({
-            type: encounterType,
-            rate: encounterRate,
-            chance: entry.Chance || 0,
-            level: entry.Level,
-            minLevel: entry.MinLevel,
-            maxLevel: entry.MaxLevel
-          });
-        }
-      });
-    });
-
-    if (mapMatches.length) {
-      matches.push({
-        mapName: map.MapName || map.MapID || 'Unknown Location',
-        mapID: map.MapID || '',
-        encounters: mapMatches
-      });
+  const matchesByMap = new Map();
+
+  // allEncounters is the species' slice of encounters_by_species, already sorted by MapID
+  allEncounters.forEach(location => {
+    const mapKey = `${location.MapID}|${location.MapName}`;
+    if (!matchesByMap.has(mapKey)) {
+      const map = {
+        mapName: location.MapName || location.MapID || 'Unknown Location',
+        mapID: location.MapID || '',
+        encounters: []
+      };
+      matchesByMap.set(mapKey, map);
+      matches.push(map);
     }
+    matchesByMap.get(mapKey).encounters.push({
+      type: location.Method,
+      rate: location.Rate,
+      chance: location.Chance || 0,
+      minLevel: location.MinLevel,
+      maxLevel: location.MaxLevel
+    });
   });
 
   if (!matches.length) {
@@ -185,11 +213,11 @@ function renderEncounters(pokemon) {
     `;
 
     map.encounters.forEach(enc => {
-      const levelDisplay = enc.minLevel != null && enc.maxLevel != null
-        ? `${enc.minLevel}-${enc.maxLevel}`
-        : enc.level != null
-          ? `${enc.level}`
-          : '-';
+      const levelDisplay = enc.minLevel == null
+        ? '-'
+        : enc.minLevel === enc.maxLevel
+          ? `${enc.minLevel}`
+          : `${enc.minLevel}-${enc.maxLevel}`;
 
       html += `
         <div class="encounter-type-block">
@@ -319,10 +347,12 @@ function normalizeAbilityName(name) {
   return name ? String(name).replace(/\s+/g, '').toLowerCase() : '';
 }
 
+function findAbility(name) {
+  return abilityByName.get(normalizeAbilityName(name));
+}
+
 function isKnownAbilityName(name) {
-  if (!name) return false;
-  const normalized = normalizeAbilityName(name);
-  return allAbilities.some(a => a && a.Name && normalizeAbilityName(a.Name) === normalized);
+  return Boolean(name) && abilityByName.has(normalizeAbilityName(name));
 }
 
 function parseAbilityField(field) {
@@ -343,6 +373,14 @@ function parseHiddenAbilityField(field) {
 }
 
 function setSpriteImage(img, spriteType, baseInternalName, formIndex) {
+  const form = formIndex > 0 && currentRawPokemon ? (currentRawPokemon.Forms || [])[formIndex - 1] : null;
+  const resolvedUrl = spriteUrl(spriteManifest, game, spriteType, (form && form.InternalName) || baseInternalName);
+  if (resolvedUrl) {
+    img.onerror = null;
+    img.src = resolvedUrl;
+    return;
+  }
+
   const suffix = formIndex > 0 ? `_${formIndex}` : '';
   const candidate = `./games/${game}/images/${spriteType}/${baseInternalName}${suffix}.png`;
 
@@ -431,9 +469,7 @@ function renderMainInfo(pokemon, selectedFormIndex = 0) {
   let html = `<div class="abilities-title">Abilities:</div>`;
   html += `<ul class="abilities-list">`;
   abilities.forEach(a => {
-    const ab = allAbilities.find(x =>
-      x.Name && normalizeAbilityName(x.Name) === normalizeAbilityName(a)
-    );
+    const ab = findAbility(a);
     const abilityName = ab ? ab.Name : a;
     const abilityUrl = `ability_move_viewer.html?game=${game}&ability=${encodeURIComponent(abilityName)}`;
     html += `<li class="ability"><span class="ability-name">${abilityName}</span><button type="button" class="ability-redirect-button" data-url="${abilityUrl}" title="View ability details">↗</button>${ab && ab.Description ? `: <span class="ability-desc">${ab.Description}</span>` : ''}</li>`;
@@ -444,9 +480,7 @@ function renderMainInfo(pokemon, selectedFormIndex = 0) {
     html += `<div class="abilities-title">Hidden Ability:</div>`;
     html += `<ul class="abilities-list">`;
     hiddenAbilities.forEach(a => {
-      const ab = allAbilities.find(x =>
-        x.Name && normalizeAbilityName(x.Name) === normalizeAbilityName(a)
-      );
+      const ab = findAbility(a);
       const abilityName = ab ? ab.Name : a;
       const abilityUrl = `ability_move_viewer.html?game=${game}&ability=${encodeURIComponent(abilityName)}`;
       html += `<li class="ability"><span class="ability-name">${abilityName}</span><button type="button" class="ability-redirect-button" data-url="${abilityUrl}" title="View ability details">↗</button>: <span class="ability-desc">${ab ? ab.Description : 'No description.'}</span></li>`;
@@ -488,7 +522,8 @@ function renderMainInfo(pokemon, selectedFormIndex = 0) {
       if (pokemon.Type2 && pokemon.Type2 !== pokemon.Type1) types.push(pokemon.Type2);
     }
 
-    const effectiveness = getTypeEffectiveness(types);
+    const form = selectedFormIndex > 0 ? currentRawPokemon?.Forms?.[selectedFormIndex - 1] : null;
+    const effectiveness = getTypeEffectiveness(types, form ? form.InternalName : pokemon.InternalName);
 
     effectivenessContainer.innerHTML = `
       <div class="type-effectiveness-card">
@@ -554,7 +589,7 @@ function renderForms(pokemon) {
     const formCard = document.createElement('div');
     formCard.className = 'form-card';
 
-    const formImage = createFormImage(baseInternalName, idx + 1, pokemon.Forms.length, game);
+    const formImage = createFormImage(baseInternalName, idx + 1, pokemon.Forms.length, game, form.InternalName);
     formCard.appendChild(formImage);
 
     const formTitle = document.createElement('h3');
@@ -975,9 +1010,14 @@ function renderFullInfo(pokemon) {
   `;
 }
 
-function createFormImage(baseInternalName, formIndex, maxForms, game) {
+function createFormImage(baseInternalName, formIndex, maxForms, game, formInternalName) {
   const image = new Image();
   image.className = 'pokemon-image';
+  const resolvedUrl = formInternalName && spriteUrl(spriteManifest, game, 'Front', formInternalName);
+  if (resolvedUrl) {
+    image.src = resolvedUrl;
+    return image;
+  }
   let currentIndex = formIndex;
 
   const tryNext = () => {
@@ -1020,30 +1060,36 @@ function setupTabs() {
   });
 }
 
-function getTypeEffectiveness(types) {
+function getTypeEffectiveness(types, internalName) {
   const effectiveness = {};
+  const profile = typeMatchups && typeMatchups.Profiles[internalName];
 
-  types.forEach(type => {
-    const typeObj = allTypes.find(t => t.Name === type);
-    if (!typeObj) return;
-
-    (typeObj.Weaknesses || []).forEach(t => {
-      if (effectiveness[t] !== 0) {
-        effectiveness[t] = (effectiveness[t] || 1) * 2;
-      }
+  if (profile) {
+    typeMatchups.Types.forEach((type, i) => {
+      if (profile[i] !== 1) effectiveness[type] = profile[i];
     });
+  } else {
+    types.forEach(type => {
+      const typeObj = allTypes.find(t => t.Name === type);
+      if (!typeObj) return;
 
-    (typeObj.Resistances || []).forEach(t => {
-      if (effectiveness[t] !== 0) {
-        effectiveness[t] = (effectiveness[t] || 1) * 0.5;
-      }
-    });
+      (typeObj.Weaknesses || []).forEach(t => {
+        if (effectiveness[t] !== 0) {
+          effectiveness[t] = (effectiveness[t] || 1) * 2;
+        }
+      });
 
-    (typeObj.Immunities || []).forEach(t => {
-      effectiveness[t] = 0;
-    });
+      (typeObj.Resistances || []).forEach(t => {
+        if (effectiveness[t] !== 0) {
+          effectiveness[t] = (effectiveness[t] || 1) * 0.5;
+        }
+      });
 
-  });
+      (typeObj.Immunities || []).forEach(t => {
+        effectiveness[t] = 0;
+      });
+    });
+  }
 
   const weaknesses = [];
   const resistances = [];
@@ -1,40 +1,44 @@
 import os
 import json
 import re
-from compare_abilities import check_abilities
+from pbs_tokenizer import iter_sections
+from record_fingerprints import verify_entry
 
 class AbilitiesParser:
     def normalize_name(self, name):
         """Normalize the name by stripping spaces and converting to lowercase."""
         return re.sub(r'[^a-z0-9]', '', name.strip().lower())
 
-    def parse_abilities(self, input_file, output_file):
-        """Parse abilities from a text file and save to a JSON file."""
-        with open(input_file, 'r') as file:
-            data = file.read().strip().split('#-------------------------------')
+    def build_abilities(self, sections, mismatches=None):
+        """Build the abilities list from tokenized PBS sections.
 
+        When a mismatches list is passed, each ability is verified against its
+        section as it is built, in the form it is serialized to, and any
+        differing fields are appended to it.
+        """
         abilities_list = []
 
-        for entry in data:
-            if not entry.strip():
+        for header, entries in sections:
+            if not header.endswith(']'):
                 continue
 
             ability_data = {}
-            lines = entry.strip().split('\n')
-            ability_name = None
+            ability_name = header[1:-1].strip()
+            ability_data['Name'] = ability_name  # Keep raw name
+
+            for key, value in entries:
+                ability_data[key] = value
 
-            for line in lines:
-                if line.startswith('[') and line.endswith(']'):
-                    ability_name = line[1:-1].strip()
-                    ability_data['Name'] = ability_name  # Keep raw name
-                    continue
+            if mismatches is not None:
+                mismatches.extend(verify_entry(ability_name, entries, ability_data))
 
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    ability_data[key.strip()] = value.strip()
+            abilities_list.append(ability_data)
 
-            if ability_name:
-                abilities_list.append(ability_data)
+        return abilities_list
+
+    def parse_abilities(self, input_file, output_file, mismatches=None):
+        """Parse abilities from a text file and save to a JSON file."""
+        abilities_list = self.build_abilities(iter_sections(input_file), mismatches)
 
         # Write the abilities list to a JSON file
         with open(output_file, 'w') as json_file:
@@ -51,18 +55,20 @@ class AbilitiesParser:
                 print(f"Abilities file not found for game: {game_name}")
                 continue
 
-            # Parse and save abilities
-            self.parse_abilities(abilities_txt_file, abilities_json_file)
-
-            # Compare abilities and check for mismatches
-            mismatches = check_abilities(abilities_txt_file, abilities_json_file)
-            if mismatches:
-                print(f"Mismatches found for game: {game_name}")
-                for mismatch in mismatches:
-                    ability_name, key, txt_value, json_value = mismatch
-                    print(f"- {ability_name}: {key} differs (txt: {txt_value}, json: {json_value})")
-            else:
-                print(f"No mismatches found for game: {game_name}")
+            # Parse, verify and save abilities in one pass
+            mismatches = []
+            self.parse_abilities(abilities_txt_file, abilities_json_file, mismatches)
+            self.report_mismatches(game_name, mismatches)
+
+    def report_mismatches(self, game_name, mismatches):
+        """Print the txt/json mismatches found for a game."""
+        if mismatches:
+            print(f"Mismatches found for game: {game_name}")
+            for mismatch in mismatches:
+                ability_name, key, txt_value, json_value = mismatch
+                print(f"- {ability_name}: {key} differs (txt: {txt_value}, json: {json_value})")
+        else:
+            print(f"No mismatches found for game: {game_name}")
 
 if __name__ == '__main__':
     parser = AbilitiesParser()
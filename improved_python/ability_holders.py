@@ -0,0 +1,57 @@
+import json
+import os
+from record_fingerprints import normalize_name
+from species_refs import number_species, split_field
+
+class AbilityHoldersIndexer:
+    """Builds the ability→Pokémon index from abilities.json and the evolved Pokémon data.
+
+    Every ability in abilities.json is keyed by its Name and lists the
+    species numbers holding it as a regular or a hidden ability, numbered as
+    in the move learners index. A form is listed for the slots it overrides;
+    otherwise it has the abilities of its base species. Ability references
+    not found in abilities.json are left out.
+    """
+
+    def build_index(self, abilities, pokedex_data):
+        species, bases, records = number_species(pokedex_data)
+        names = {normalize_name(ability['Name']): ability['Name'] for ability in abilities if ability.get('Name')}
+        holders = {name: {'Regular': [], 'Hidden': []} for name in names.values()}
+
+        def add(slot, values, ref):
+            for value in split_field(values):
+                name = names.get(normalize_name(value))
+                # Numbers only grow, so a repeat can only be the last entry
+                if name and holders[name][slot][-1:] != [ref]:
+                    holders[name][slot].append(ref)
+
+        for ref, record, is_form in records:
+            add('Regular', record.get('Abilities'), ref)
+            # Older records keep the hidden ability under the singular key. Forms
+            # parsed before parse_forms was fixed hold any other field there, so
+            # only their HiddenAbilities is read
+            hidden = record.get('HiddenAbilities')
+            if not is_form:
+                hidden = hidden or record.get('HiddenAbility')
+            add('Hidden', hidden, ref)
+
+        return {'Species': species, 'Base': bases, 'Abilities': holders}
+
+    def process_multiple_games(self, game_names, base_dir='games'):
+        for game_name in game_names:
+            data_dir = os.path.join(base_dir, game_name, 'data')
+            abilities_path = os.path.join(data_dir, 'abilities.json')
+            pokemon_path = os.path.join(data_dir, 'pokemon_master_evo.json')
+            if not os.path.exists(abilities_path) or not os.path.exists(pokemon_path):
+                print(f"Abilities or evolution Pokémon file not found for game: {game_name}")
+                continue
+            with open(abilities_path, 'r') as file:
+                abilities = json.load(file)
+            with open(pokemon_path, 'r') as file:
+                pokedex_data = json.load(file)
+            with open(os.path.join(data_dir, 'ability_holders.json'), 'w') as file:
+                json.dump(self.build_index(abilities, pokedex_data), file, indent=4)
+            print(f"Ability holders index written for game: {game_name}")
+
+if __name__ == '__main__':
+    AbilityHoldersIndexer().process_multiple_games(['ss2'])
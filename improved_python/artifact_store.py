@@ -0,0 +1,117 @@
+import gzip
+import json
+import os
+
+try:
+    import brotli
+except ImportError:  # optional, .br siblings are skipped without it and emit() warns once
+    brotli = None
+
+class ArtifactStore:
+    """In-process cache of pipeline artifacts keyed by (game, artifact).
+
+    Stages hand their parsed objects to the store and later stages read them
+    back directly instead of re-reading files. Nothing is written until emit()
+    is called, which serializes every artifact put since the last emit.
+
+    By default artifacts are emitted for production: minified JSON plus .gz
+    and .br siblings for the web server to hand out. debug=True writes the
+    old indent=4 JSON instead and removes any stale compressed siblings.
+    """
+
+    def __init__(self, base_dir='games', debug=False):
+        self.base_dir = base_dir
+        self.debug = debug
+        self._artifacts = {}
+        self._dump_options = {}
+        # Insertion-ordered set of the keys to write on the next emit
+        self._pending = {}
+        self._warned_brotli = False
+
+    def path(self, game, artifact):
+        """Return the JSON path an artifact is emitted to; artifact names may contain a subdirectory."""
+        return os.path.join(self.base_dir, game, 'data', f'{artifact}.json')
+
+    def put(self, game, artifact, data, emit=True, **dump_options):
+        """Store an artifact and, unless emit is False, schedule it for the next emit."""
+        key = (game, artifact)
+        self._artifacts[key] = data
+        self._dump_options[key] = dump_options
+        if emit:
+            self._pending[key] = None
+
+    def get(self, game, artifact):
+        """Return an artifact, falling back to its emitted JSON from a previous run."""
+        key = (game, artifact)
+        if key not in self._artifacts:
+            file_path = self.path(game, artifact)
+            if not os.path.exists(file_path):
+                return None
+            with open(file_path, 'r', encoding='utf-8') as file:
+                self._artifacts[key] = json.load(file)
+        return self._artifacts[key]
+
+    def export(self, game, artifacts=None):
+        """Return (artifact, data, emit, dump_options) for a game's artifacts held in memory.
+
+        Without an artifacts list every artifact put for the game is exported,
+        leaving out the ones only loaded from disk.
+        """
+        if artifacts is None:
+            artifacts = [artifact for artifact_game, artifact in self._dump_options if artifact_game == game]
+        exported = []
+        for artifact in artifacts:
+            key = (game, artifact)
+            if key in self._artifacts:
+                exported.append((artifact, self._artifacts[key], key in self._pending, self._dump_options.get(key, {})))
+        return exported
+
+    def names(self, game):
+        """Return the names of a game's artifacts held in memory."""
+        return [artifact for artifact_game, artifact in self._artifacts if artifact_game == game]
+
+    def pending(self, game=None):
+        """Return the (game, artifact) keys the next emit writes, in order, optionally only for one game."""
+        return [key for key in self._pending if game is None or key[0] == game]
+
+    def __contains__(self, key):
+        return key in self._artifacts
+
+    @property
+    def compressed_formats(self):
+        """The precompressed siblings emit() writes next to each JSON file."""
+        if self.debug:
+            return []
+        return ['gz', 'br'] if brotli else ['gz']
+
+    def emit(self):
+        """Write every pending artifact to disk and return the written JSON paths."""
+        if self._pending and not self.debug and brotli is None and not self._warned_brotli:
+            print("Warning: brotli is not installed, so no .br files are written (pip install brotli)")
+            self._warned_brotli = True
+        written = []
+        for game, artifact in self._pending:
+            file_path = self.path(game, artifact)
+            options = {'indent': 4} if self.debug else {'separators': (',', ':')}
+            options.update(self._dump_options[(game, artifact)])
+            payload = json.dumps(self._artifacts[(game, artifact)], **options).encode('utf-8')
+            self._write(file_path, payload)
+            written.append(file_path)
+        self._pending = {}
+        return written
+
+    def _write(self, file_path, payload):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as file:
+            file.write(payload)
+        siblings = {
+            file_path + '.gz': lambda: gzip.compress(payload, compresslevel=9, mtime=0),
+            file_path + '.br': lambda: brotli.compress(payload) if brotli else None,
+        }
+        for sibling_path, compress in siblings.items():
+            compressed = None if self.debug else compress()
+            if compressed is not None:
+                with open(sibling_path, 'wb') as file:
+                    file.write(compressed)
+            elif os.path.exists(sibling_path):
+                os.remove(sibling_path)
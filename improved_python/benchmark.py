@@ -0,0 +1,222 @@
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from data_orchestration import DataOrchestrator, FilePaths, STAGES, missing_requirements
+from pbs_tokenizer import iter_sections
+from parse_pokemon import PokemonParser
+from parse_forms import FormsParser
+from combine_pokemon import PokemonCombiner
+from moves_to_json import MovesParser
+from abilities_to_json import AbilitiesParser
+from encounters_to_json import EncountersParser
+from types_to_json import TypesParser
+from trainers_to_json import TrainersParser
+from evos import Evolution
+from stage_metrics import count_records
+from synthetic_pbs import SyntheticCorpus
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+GAME = 'synthetic'
+
+def measure(run, setup=None):
+    """Time run() without tracing, then run it again under tracemalloc for its peak.
+
+    setup() is called before each run, untimed, and its result passed to run().
+    Returns (seconds, cpu_seconds, peak_bytes, result).
+    """
+    args = setup() if setup else ()
+    gc.collect()
+    started, cpu_started = time.perf_counter(), time.process_time()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run(*args)
+    seconds, cpu_seconds = time.perf_counter() - started, time.process_time() - cpu_started
+
+    args = setup() if setup else ()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            run(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return seconds, cpu_seconds, peak, result
+
+def json_size(data):
+    return len(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+
+class Benchmark:
+    """Benchmarks every parser class and every DataOrchestrator stage on a synthetic corpus."""
+
+    def __init__(self, base_dir):
+        self.base_dir = base_dir
+        self.data_dir = os.path.join(base_dir, GAME, 'data')
+
+    def txt(self, name):
+        return os.path.join(self.data_dir, name)
+
+    def file_bytes(self, *names):
+        return sum(os.path.getsize(self.txt(name)) for name in names)
+
+    def result(self, seconds, cpu_seconds, peak, sections, size):
+        return {
+            'seconds': round(seconds, 4),
+            'cpu_seconds': round(cpu_seconds, 4),
+            'peak_mb': round(peak / 1e6, 2),
+            'sections': sections,
+            'sections_per_sec': round(sections / seconds, 1) if seconds else None,
+            'mb_per_sec': round(size / 1e6 / seconds, 2) if seconds else None,
+        }
+
+    def parser_benchmarks(self):
+        """Return {name: (files, setup, run)}; run returns the parsed records."""
+        pokemon_txt = self.txt('pokemon.txt')
+        forms_txt = self.txt('pokemon_forms.txt')
+        with contextlib.redirect_stdout(io.StringIO()):
+            base_pokemon = FormsParser().load_base_pokemon_data(pokemon_txt)
+            pokemon = PokemonParser().parse_pokemon(pokemon_txt)
+            forms = FormsParser().parse_forms(forms_txt, base_pokemon)
+            master = PokemonCombiner().merge_records(GAME, pokemon, forms)
+
+        def run_evolution(data):
+            evolution = Evolution(None, None, data)
+            return evolution.build_evolution_data(evolution.generate_evolution_dict())
+
+        return {
+            'PokemonParser': (['pokemon.txt'], None, lambda: PokemonParser().parse_pokemon(pokemon_txt)),
+            'FormsParser': (['pokemon_forms.txt'], None, lambda: FormsParser().parse_forms(forms_txt, base_pokemon)),
+            'MovesParser': (['moves.txt'], None, lambda: MovesParser().build_moves(iter_sections(self.txt('moves.txt')), [])),
+            'AbilitiesParser': (['abilities.txt'], None,
+                                lambda: AbilitiesParser().build_abilities(iter_sections(self.txt('abilities.txt')), [])),
+            'EncountersParser': (['encounters.txt'], None, lambda: EncountersParser().load_encounters(self.txt('encounters.txt'))),
+            'TypesParser': (['types.txt'], None, lambda: TypesParser().load_types(self.txt('types.txt'))),
+            'TrainersParser': (['trainers.txt'], None, lambda: TrainersParser().load_trainers(self.txt('trainers.txt'))),
+            'PokemonCombiner': ([], lambda: (pokemon, forms), lambda base, form: PokemonCombiner().merge_records(GAME, base, form)),
+            'Evolution': ([], lambda: (master,), run_evolution),
+        }
+
+    def run_parsers(self):
+        results = {}
+        for name, (files, setup, run) in self.parser_benchmarks().items():
+            seconds, cpu_seconds, peak, records = measure(run, setup)
+            size = self.file_bytes(*files) if files else json_size(setup())
+            results[f'parser:{name}'] = self.result(seconds, cpu_seconds, peak, count_records(records) or 0, size)
+        return results
+
+    def run_stages(self):
+        paths = FilePaths(base_dir=self.base_dir)
+        paths.games = [GAME]
+        orchestrator = DataOrchestrator(paths, force=True)
+        store = orchestrator.store
+        results = {}
+        for stage, spec in STAGES.items():
+            if missing_requirements(stage):
+                continue
+            seconds, cpu_seconds, peak, _ = measure(lambda: orchestrator.run_stages([stage]))
+            files = [name for name in spec['files'] if os.path.exists(self.txt(name))]
+            size = self.file_bytes(*files) + sum(json_size(store.get(GAME, artifact)) for artifact in spec['artifacts'])
+            if spec['outputs']:
+                output = spec['outputs'][0]
+                records = count_records(store.get(GAME, output), output) or 0
+            else:
+                # Stages such as export_excel only write files into the game's folder
+                records = len([name for name in spec.get('written', [])
+                               if os.path.exists(os.path.join(self.base_dir, GAME, name))])
+            results[f'stage:{stage}'] = self.result(seconds, cpu_seconds, peak, records, size)
+
+        pending = [entry for entry in store.export(GAME) if entry[2]]
+
+        def reschedule():
+            # emit() clears its queue, so queue the same artifacts again before each run
+            for artifact, data, _, dump_options in pending:
+                store.put(GAME, artifact, data, **dump_options)
+            return ()
+
+        seconds, cpu_seconds, peak, _ = measure(store.emit, reschedule)
+        results['stage:emit'] = self.result(seconds, cpu_seconds, peak, len(pending),
+                                            sum(json_size(entry[1]) for entry in pending))
+        return results
+
+def run_benchmarks(scales, seed=0, stages=True, parsers=True):
+    """Generate a corpus per scale and return {'<scale>x': {benchmark: result}}."""
+    report = {}
+    for scale in scales:
+        with tempfile.TemporaryDirectory() as base_dir:
+            SyntheticCorpus(scale, seed).write_game(base_dir, GAME)
+            benchmark = Benchmark(base_dir)
+            results = {}
+            if parsers:
+                results.update(benchmark.run_parsers())
+            if stages:
+                results.update(benchmark.run_stages())
+            report[f'{scale:g}x'] = results
+    return report
+
+def compare_to_baseline(report, baseline, tolerance=0.25, noise_seconds=0.01):
+    """Return (scale, benchmark, metric, baseline, current) for every result worse than tolerance allows.
+
+    Timings that moved by less than noise_seconds are never counted.
+    """
+    regressions = []
+    for scale, results in report.items():
+        for name, result in results.items():
+            previous = baseline.get(scale, {}).get(name)
+            if not previous:
+                continue
+            for metric in ('seconds', 'peak_mb'):
+                if not previous.get(metric) or result[metric] <= previous[metric] * (1 + tolerance):
+                    continue
+                if metric == 'seconds' and result[metric] - previous[metric] < noise_seconds:
+                    continue
+                regressions.append((scale, name, metric, previous[metric], result[metric]))
+    return regressions
+
+def print_report(report, baseline):
+    for scale, results in report.items():
+        print(f"\n{scale} corpus")
+        print(f"  {'benchmark':34} {'seconds':>9} {'sections/s':>12} {'MB/s':>8} {'peak MB':>9} {'vs base':>8}")
+        for name, result in results.items():
+            previous = baseline.get(scale, {}).get(name, {}).get('seconds')
+            change = f"{(result['seconds'] / previous - 1) * 100:+.0f}%" if previous else '-'
+            print(f"  {name:34} {result['seconds']:9.3f} {result['sections_per_sec'] or 0:12.0f} "
+                  f"{result['mb_per_sec'] or 0:8.2f} {result['peak_mb']:9.2f} {change:>8}")
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description="Benchmark the parsers and pipeline stages on a synthetic corpus.")
+    arg_parser.add_argument('--scales', type=float, nargs='+', default=[1, 10, 100],
+                            help="corpus sizes as multiples of the ss2 data")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--baseline', default=BASELINE_FILE, help="stored results to compare against")
+    arg_parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    arg_parser.add_argument('--tolerance', type=float, default=0.25,
+                            help="fraction a benchmark may get slower or bigger before it counts as a regression")
+    arg_parser.add_argument('--output', help="also write the results to this JSON file")
+    args = arg_parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+    report = run_benchmarks(args.scales, args.seed)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=4)
+    if args.save_baseline:
+        baseline.update(report)
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=4)
+        print(f"\nBaseline saved to {args.baseline}")
+    else:
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        for scale, name, metric, previous, current in regressions:
+            print(f"Regression at {scale}: {name} {metric} {previous} -> {current}")
+        if regressions:
+            raise SystemExit(1)
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+
+MANIFEST_FILE = 'build_manifest.json'
+
+def hash_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+def hash_artifact(data):
+    """Hash a parsed artifact by its canonical JSON form."""
+    return hash_bytes(json.dumps(data, sort_keys=True).encode('utf-8'))
+
+class BuildManifest:
+    """Per-game record of what each pipeline stage was last built from.
+
+    The manifest lives next to the game's data/ directory and stores, for every
+    stage, the hashes of its input files, upstream artifacts and code, plus the
+    hashes of the artifacts it produced. A stage whose recorded inputs and code
+    still match can be skipped. Stages may also keep build state here that the
+    site never reads, such as the sources record of the sprite variants.
+    """
+
+    def __init__(self, base_dir, game):
+        self.path = os.path.join(base_dir, game, MANIFEST_FILE)
+        self.files = {}
+        self.stages = {}
+        self.state = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as file:
+                    data = json.load(file)
+                self.files = data.get('files', {})
+                self.stages = data.get('stages', {})
+                self.state = data.get('state', {})
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"Warning: Ignoring unreadable build manifest {self.path} - {e}")
+
+    def file_hash(self, file_path, name=None):
+        """Return the content hash of a file, reusing the recorded hash if size and mtime are unchanged.
+
+        Files are recorded under their base name unless another name is given.
+        """
+        if not os.path.exists(file_path):
+            return None
+        stat = os.stat(file_path)
+        name = name or os.path.basename(file_path)
+        cached = self.files.get(name)
+        if cached and cached['size'] == stat.st_size and cached['mtime_ns'] == stat.st_mtime_ns:
+            return cached['sha256']
+        with open(file_path, 'rb') as file:
+            digest = hash_bytes(file.read())
+        self.files[name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+        return digest
+
+    def folder_hash(self, folder_path):
+        """Return one hash over the names and contents of the files directly inside a folder.
+
+        Each file is recorded under its path relative to the game directory,
+        so unchanged files are not read again.
+        """
+        if not os.path.isdir(folder_path):
+            return None
+        digest = hashlib.sha256()
+        for file_name in sorted(os.listdir(folder_path)):
+            file_path = os.path.join(folder_path, file_name)
+            if os.path.isfile(file_path):
+                digest.update(f'{file_name}\0{self.relative_hash(file_path)}\0'.encode('utf-8'))
+        return digest.hexdigest()
+
+    def relative_hash(self, file_path):
+        """Return file_hash() of a file recorded under its path relative to the game directory."""
+        relative = os.path.relpath(file_path, os.path.dirname(self.path)).replace(os.sep, '/')
+        return self.file_hash(file_path, relative)
+
+    def output_hash(self, artifact):
+        """Return the recorded hash of an artifact produced by any stage."""
+        for record in self.stages.values():
+            if artifact in record.get('outputs', {}):
+                return record['outputs'][artifact]
+        return None
+
+    def is_current(self, stage, inputs, code):
+        record = self.stages.get(stage)
+        return record is not None and record.get('code') == code and record.get('inputs') == inputs
+
+    def record(self, stage, inputs, code, outputs):
+        self.stages[stage] = {'code': code, 'inputs': inputs, 'outputs': outputs}
+
+    def record_emitted(self, stage, file_path):
+        """Remember the hash of a file emitted for a stage's latest build."""
+        record = self.stages.get(stage)
+        if record is not None:
+            relative = os.path.relpath(file_path, os.path.dirname(self.path)).replace(os.sep, '/')
+            record.setdefault('emitted', {})[relative] = self.relative_hash(file_path)
+
+    def emitted_intact(self, stage):
+        """Whether every file emitted for a stage's latest build still exists with its recorded hash."""
+        record = self.stages.get(stage) or {}
+        game_dir = os.path.dirname(self.path)
+        return all(self.relative_hash(os.path.join(game_dir, relative)) == digest
+                   for relative, digest in record.get('emitted', {}).items())
+
+    def save(self):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump({'files': self.files, 'stages': self.stages, 'state': self.state}, file, indent=4, sort_keys=True)
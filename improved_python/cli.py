@@ -0,0 +1,103 @@
+import argparse
+import os
+import sys
+
+# Only the modules a command needs are imported, inside that command
+
+def build(args):
+    from data_orchestration import DataOrchestrator, FilePaths
+
+    paths = FilePaths(base_dir=args.base_dir, games=args.games)
+    orchestrator = DataOrchestrator(paths, force=args.force, debug_json=args.debug_json,
+                                    trace_memory=args.trace_memory, profile_dir=args.profile)
+    result = orchestrator.run_all(jobs=args.jobs, report_path=args.report, stages=args.stages,
+                                  validate=not args.no_validate)
+    failed = [call for call in orchestrator.report.calls if call['status'] == 'failed']
+    return 1 if failed or (result is not None and not result.wasSuccessful()) else 0
+
+def validate(args):
+    from data_orchestration import FilePaths
+    from unit_tests import run_suite
+
+    games = FilePaths(base_dir=args.base_dir, games=args.games).games
+    tests = None if args.all else ['TestCompareData']
+    result = run_suite(jobs=args.jobs, games=games, base_dir=args.base_dir, tests=tests)
+    return 0 if result.wasSuccessful() else 1
+
+def export_excel(args):
+    if args.pbs_dir:
+        from pokedexcel import main as build_workbook
+
+        print(f"Workbook written to {build_workbook(args.pbs_dir, args.output)}")
+        return 0
+
+    from data_orchestration import STAGES, DataOrchestrator, FilePaths
+
+    # The workbook is built from the parsed artifacts, which are brought up to date first
+    paths = FilePaths(base_dir=args.base_dir, games=args.games)
+    orchestrator = DataOrchestrator(paths, force=args.force)
+    orchestrator.run_all(jobs=args.jobs, stages=STAGES['export_excel']['depends'] + ['export_excel'], validate=False)
+    failed = [call for call in orchestrator.report.calls if call['status'] == 'failed']
+    return 1 if failed else 0
+
+def list_targets(args):
+    from data_orchestration import STAGES, discover_games, missing_requirements
+
+    print("Games:")
+    for game in discover_games(args.base_dir):
+        print(f"  {game}")
+    print("Stages:")
+    for stage, spec in STAGES.items():
+        depends = f" (after {', '.join(spec['depends'])})" if spec['depends'] else ''
+        missing = missing_requirements(stage)
+        unavailable = f" [needs {', '.join(missing)}]" if missing else ''
+        print(f"  {stage}{depends}{unavailable}")
+    return 0
+
+def stage_names():
+    from data_orchestration import STAGES
+    return list(STAGES)
+
+def make_parser():
+    arg_parser = argparse.ArgumentParser(description="Build, check and export the site data for the fan games.")
+    arg_parser.add_argument('--base-dir', default='games', help="folder holding one directory per game (default: games)")
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', help="build the JSON data, skipping stages whose inputs are unchanged")
+    build_parser.add_argument('--games', nargs='+', help="games to build (default: every folder with a data/ directory)")
+    build_parser.add_argument('--stages', nargs='+', choices=stage_names(), metavar='STAGE',
+                              help="stages to run (default: all); see the list command")
+    build_parser.add_argument('--force', action='store_true', help="rebuild every stage even if its inputs are unchanged")
+    build_parser.add_argument('--jobs', type=int, default=1, help="number of worker processes to run stages on")
+    build_parser.add_argument('--debug-json', action='store_true', help="write indented JSON without .gz/.br siblings")
+    build_parser.add_argument('--report', help="where to write the JSON run report (default: <base-dir>/build_report.json)")
+    build_parser.add_argument('--trace-memory', action='store_true', help="record each stage's tracemalloc peak (slower)")
+    build_parser.add_argument('--profile', metavar='DIR', help="write a cProfile dump per stage call into DIR")
+    build_parser.add_argument('--no-validate', action='store_true', help="don't run the test suite after a rebuild")
+    build_parser.set_defaults(handler=build)
+
+    validate_parser = commands.add_parser('validate', help="check the built JSON against the PBS sources")
+    validate_parser.add_argument('--games', nargs='+', help="games to check (default: all)")
+    validate_parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="number of games checked at once")
+    validate_parser.add_argument('--all', action='store_true', help="run the whole unit test suite, not just the data checks")
+    validate_parser.set_defaults(handler=validate)
+
+    excel_parser = commands.add_parser('export-excel', help="write each game's pokedexCEL workbook")
+    excel_source = excel_parser.add_mutually_exclusive_group()
+    excel_source.add_argument('--games', nargs='+', help="games to export, into <base-dir>/<game>/ (default: all)")
+    excel_source.add_argument('--pbs-dir', help="write one workbook straight from the PBS files in this folder")
+    excel_parser.add_argument('--output', default='pokedexCEL.xlsx', help="workbook written with --pbs-dir")
+    excel_parser.add_argument('--force', action='store_true', help="export even if the game's data is unchanged")
+    excel_parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help="number of games exported at once")
+    excel_parser.set_defaults(handler=export_excel)
+
+    list_parser = commands.add_parser('list', help="show the games found and the pipeline stages")
+    list_parser.set_defaults(handler=list_targets)
+    return arg_parser
+
+def main(argv=None):
+    args = make_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
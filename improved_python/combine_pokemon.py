@@ -20,66 +20,11 @@ class PokemonCombiner:
             with open(form_file_path, 'r') as form_file:
                 form_data = json.load(form_file)
 
-            merged_pokemon = {}
-
-            #
-            print(f"Base data structure for {game_name}:")
-            for base_pokemon in base_data:
-                print(base_pokemon)
-                break
-
-            # Iterate through base Pokémon data and add to merged_pokemon dictionary
-            for base_pokemon in base_data:
-                try:
-                    base_name = base_pokemon["InternalName"]
-                    merged_pokemon[base_name] = base_pokemon
-                except KeyError:
-                    print(f"Warning: 'InternalName' not found in this base entry: {base_pokemon}")
-            form_counters = {}
-
-            for form in form_data:
-                base_name = form["BaseName"]
-
-                if base_name in merged_pokemon:
-                    if "BaseStats" not in form:
-                        print(f"Warning: 'BaseStats' not found in form for {base_name} - skipping form.")
-                        continue
-
-                    form_data_copy = form.copy()
-
-                    # Determine internal name based on form type
-                    form_name_lower = form.get("FormName", "").lower()
-
-                    #if "anomaly" in form_name_lower:
-                    #    internal_name = f"{base_name}_2"
-                    if "mega" in form_name_lower:
-                        internal_name = f"{base_name}_1"
-                    else:
-                        # Start generic form counter at 1 if not already
-                        if base_name not in form_counters:
-                            form_counters[base_name] = 1
-
-                        # Skip _1 if mega already used it
-                        while f"{base_name}_{form_counters[base_name]}" in [
-                            f.get("InternalName", "") for f in merged_pokemon[base_name].get("Forms", [])
-                        ]:
-                            form_counters[base_name] += 1
-
-                        internal_name = f"{base_name}_{form_counters[base_name]}"
-                        form_counters[base_name] += 1
-
-                    form_data_copy["InternalName"] = internal_name
-
-                    # Add the form to the base Pokémon
-                    merged_pokemon[base_name].setdefault("Forms", [])
-                    merged_pokemon[base_name]["Forms"].append(form_data_copy)
-                else:
-                    print(f"Warning: Base name {base_name} not found in base data.")
-
+            merged_pokemon = self.merge_records(game_name, base_data, form_data)
 
             # Write the merged Pokémon data to a new JSON file
             with open(merged_file_path, 'w') as merged_file:
-                json.dump(list(merged_pokemon.values()), merged_file, indent=4)
+                json.dump(merged_pokemon, merged_file, indent=4)
 
             print(f"Merge completed and saved to {merged_file_path}")
 
@@ -88,6 +33,69 @@ class PokemonCombiner:
         except json.JSONDecodeError as e:
             print(f"Error: Failed to decode JSON - {e}")
 
+    def merge_records(self, game_name, base_data, form_data):
+        """Merge parsed base Pokémon and form records into the master list."""
+        merged_pokemon = {}
+
+        #
+        print(f"Base data structure for {game_name}:")
+        for base_pokemon in base_data:
+            print(base_pokemon)
+            break
+
+        # Iterate through base Pokémon data and add to merged_pokemon dictionary
+        for base_pokemon in base_data:
+            try:
+                base_name = base_pokemon["InternalName"]
+                # Copy so the parsed base records can still be emitted without Forms
+                merged_pokemon[base_name] = dict(base_pokemon)
+            except KeyError:
+                print(f"Warning: 'InternalName' not found in this base entry: {base_pokemon}")
+
+        # Group forms by species in one pass, keeping their file order
+        forms_by_species = {}
+        for form in form_data:
+            base_name = form["BaseName"]
+            if base_name in merged_pokemon:
+                forms_by_species.setdefault(base_name, []).append(form)
+            else:
+                print(f"Warning: Base name {base_name} not found in base data.")
+
+        for base_name, forms in forms_by_species.items():
+            used_ids = {f.get("InternalName", "") for f in merged_pokemon[base_name].get("Forms", [])}
+            form_counter = 1
+
+            for form in forms:
+                if "BaseStats" not in form:
+                    print(f"Warning: 'BaseStats' not found in form for {base_name} - skipping form.")
+                    continue
+
+                form_data_copy = form.copy()
+
+                # Determine internal name based on form type
+                form_name_lower = form.get("FormName", "").lower()
+
+                #if "anomaly" in form_name_lower:
+                #    internal_name = f"{base_name}_2"
+                if "mega" in form_name_lower:
+                    internal_name = f"{base_name}_1"
+                else:
+                    # Generic forms count up from _1, skipping IDs already taken (e.g. by a mega)
+                    while f"{base_name}_{form_counter}" in used_ids:
+                        form_counter += 1
+
+                    internal_name = f"{base_name}_{form_counter}"
+                    form_counter += 1
+
+                form_data_copy["InternalName"] = internal_name
+                used_ids.add(internal_name)
+
+                # Add the form to the base Pokémon
+                merged_pokemon[base_name].setdefault("Forms", [])
+                merged_pokemon[base_name]["Forms"].append(form_data_copy)
+
+        return list(merged_pokemon.values())
+
     def process_multiple_games(self, game_names):
         for game_name in game_names:
             self.merge_pokemon_data(game_name)
@@ -1,5 +1,6 @@
 import json
 import re
+from pbs_tokenizer import iter_sections
 
 def normalize_name(name):
     """Normalize the name by stripping spaces and converting to lowercase."""
@@ -9,34 +10,19 @@ def normalize_value(value):
     """Normalize the value for comparison by stripping spaces and special characters."""
     return normalize_name(value) if isinstance(value, str) else value
 
-def load_abilities_txt(file_path):
-    """Load abilities from the txt file and return a dictionary."""
+def build_abilities_txt(sections):
+    """Build a dictionary of raw ability attributes from tokenized PBS sections."""
     abilities_dict = {}
-    with open(file_path, 'r') as file:
-        data = file.read().strip().split('#-------------------------------')
-    
-    for entry in data:
-        if not entry.strip():
-            continue
-        
-        ability_data = {}
-        lines = entry.strip().split('\n')
-        ability_name = None
-        
-        for line in lines:
-            if '[' in line and ']' in line:
-                ability_name = normalize_name(line[1:-1])  # Extract ability name
-                continue
-            
-            if '=' in line and ability_name:
-                key, value = line.split('=', 1)
-                ability_data[key.strip()] = value.strip()
-        
-        if ability_name:
-            abilities_dict[ability_name] = ability_data
+    for header, entries in sections:
+        ability_name = normalize_name(header[1:-1])  # Extract ability name
+        abilities_dict[ability_name] = dict(entries)
     
     return abilities_dict
 
+def load_abilities_txt(file_path):
+    """Load abilities from the txt file and return a dictionary."""
+    return build_abilities_txt(iter_sections(file_path))
+
 def load_abilities_json(file_path):
     """Load abilities from the JSON file and return a dictionary."""
     with open(file_path, 'r') as json_file:
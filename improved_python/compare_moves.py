@@ -1,5 +1,6 @@
 import json
 import re
+from pbs_tokenizer import iter_sections
 
 def normalize_name(name):
     """Normalize the name by stripping spaces and converting to lowercase."""
@@ -16,34 +17,19 @@ def normalize_value(value):
         return normalize_name(value)
     return value  # Return as-is for non-string and non-list values
 
-def load_moves_txt(file_path):
-    """Load moves from the txt file and return a dictionary."""
+def build_moves_txt(sections):
+    """Build a dictionary of raw move attributes from tokenized PBS sections."""
     moves_dict = {}
-    with open(file_path, 'r') as file:
-        data = file.read().strip().split('#-------------------------------')
-    
-    for entry in data:
-        if not entry.strip():
-            continue
-        
-        move_data = {}
-        lines = entry.strip().split('\n')
-        move_name = None
-        
-        for line in lines:
-            if '[' in line and ']' in line:
-                move_name = normalize_name(line[1:-1])  # Extract move name
-                continue
-            
-            if '=' in line and move_name:
-                key, value = line.split('=', 1)
-                move_data[key.strip()] = value.strip()
-        
-        if move_name:
-            moves_dict[move_name] = move_data
+    for header, entries in sections:
+        move_name = normalize_name(header[1:-1])  # Extract move name
+        moves_dict[move_name] = dict(entries)
     
     return moves_dict
 
+def load_moves_txt(file_path):
+    """Load moves from the txt file and return a dictionary."""
+    return build_moves_txt(iter_sections(file_path))
+
 def load_moves_json(file_path):
     """Load moves from the JSON file and return a dictionary."""
     with open(file_path, 'r') as json_file:
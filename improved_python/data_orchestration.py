@@ -1,76 +1,674 @@
+import hashlib
+import importlib.util
 import os
-from parse_pokemon import PokemonParser
-from parse_forms import FormsParser
-from combine_pokemon import PokemonCombiner
-from moves_to_json import MovesParser
-from abilities_to_json import AbilitiesParser
-from encounters_to_json import EncountersParser
-from evos import Evolution
-from unit_tests import unittest
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from artifact_store import ArtifactStore
+from build_manifest import BuildManifest, hash_artifact
+from stage_metrics import REPORT_FILE, CallMetrics, RunReport, count_records, file_size
+
+def discover_games(base_dir="games"):
+    """Return the game folders under base_dir that have a data/ directory, sorted by name."""
+    if not os.path.isdir(base_dir):
+        return []
+    return sorted(name for name in os.listdir(base_dir) if os.path.isdir(os.path.join(base_dir, name, 'data')))
 
 class FilePaths:
-    def __init__(self, base_dir="games"):
+    def __init__(self, base_dir="games", games=None):
         self.base_dir = base_dir
-        self.games = ['ss2','soothe']  # Add more as needed
+        self.games = list(games) if games else discover_games(base_dir)
+
+# Inputs, outputs and code of every stage, used to decide what needs rebuilding
+# and in which order stages may run. 'outputs' are the artifacts a stage emits; an
+# entry ending in '/*' stands for every artifact under that directory, such as
+# the per-species shards. 'files' are PBS sources in the game's data/
+# directory, 'artifacts' are hashed upstream outputs, 'reads' are in-memory
+# artifacts a stage uses when available, 'depends' are the stages that must
+# finish first and 'modules' are the sources whose changes invalidate the stage.
+# 'requires' lists optional packages; without them the stage is skipped.
+# 'images' are folders in the game's images/ directory whose files are inputs.
+# 'written' are files a stage writes into the game's folder besides its artifacts;
+# a stage is only up to date while they exist. 'state' are artifacts a stage keeps
+# for its next build; they are saved in the build manifest instead of data/.
+# 'transient' are artifacts a stage only hands to later stages in memory, such as
+# the base data parse_forms 'reads'. They are never emitted, hashed or saved, so a
+# stage reading one must rebuild it itself when an earlier run produced it.
+COMMON_MODULES = ['data_orchestration', 'artifact_store', 'pbs_tokenizer']
+
+STAGES = {
+    'parse_pokemon': {'files': ['pokemon.txt'], 'artifacts': [], 'depends': [],
+                      'outputs': ['pokemon'], 'transient': ['pokemon_base'],
+                      'modules': ['parse_pokemon', 'parse_forms']},
+    'parse_forms': {'files': ['pokemon.txt', 'pokemon_forms.txt'], 'artifacts': [], 'depends': ['parse_pokemon'],
+                    'reads': ['pokemon_base'], 'outputs': ['pokemon_forms'],
+                    'modules': ['parse_forms']},
+    'combine_pokemon': {'files': [], 'artifacts': ['pokemon', 'pokemon_forms'], 'depends': ['parse_pokemon', 'parse_forms'],
+                        'outputs': ['pokemon_master'],
+                        'modules': ['combine_pokemon']},
+    'parse_moves': {'files': ['moves.txt'], 'artifacts': [], 'depends': [],
+                    'outputs': ['moves'],
+                    'modules': ['moves_to_json', 'record_fingerprints']},
+    'parse_abilities': {'files': ['abilities.txt'], 'artifacts': [], 'depends': [],
+                        'outputs': ['abilities'],
+                        'modules': ['abilities_to_json', 'record_fingerprints']},
+    'parse_encounters': {'files': ['encounters.txt'], 'artifacts': [], 'depends': [],
+                         'outputs': ['encounters', 'encounters_by_species', 'encounters/*'],
+                         'modules': ['encounters_to_json']},
+    'generate_evolutions': {'files': [], 'artifacts': ['pokemon_master'], 'depends': ['combine_pokemon'],
+                            'outputs': ['pokemon_master_evo'],
+                            'modules': ['evos']},
+    'generate_pokemon_shards': {'files': [], 'artifacts': ['pokemon_master_evo'], 'depends': ['generate_evolutions'],
+                                'outputs': ['pokemon_index', 'pokemon/*'],
+                                'modules': ['shard_pokemon']},
+    'generate_move_learners': {'files': [], 'artifacts': ['pokemon_master_evo'], 'depends': ['generate_evolutions'],
+                               'outputs': ['move_learners'],
+                               'modules': ['move_learners', 'species_refs']},
+    'generate_ability_holders': {'files': [], 'artifacts': ['abilities', 'pokemon_master_evo'],
+                                 'depends': ['parse_abilities', 'generate_evolutions'],
+                                 'outputs': ['ability_holders'],
+                                 'modules': ['ability_holders', 'species_refs', 'record_fingerprints']},
+    'generate_search_index': {'files': [], 'artifacts': ['pokemon_master_evo', 'moves', 'abilities'],
+                              'depends': ['generate_evolutions', 'parse_moves', 'parse_abilities'],
+                              'outputs': ['search_index'],
+                              'modules': ['search_index']},
+    'generate_types': {'files': ['types.txt'], 'artifacts': [], 'depends': [],
+                       'outputs': ['types'],
+                       'modules': ['types_to_json']},
+    'generate_type_chart': {'files': [], 'artifacts': ['types'], 'depends': ['generate_types'],
+                            'outputs': ['type_chart'],
+                            'modules': ['type_chart', 'species_refs'], 'requires': ['numpy']},
+    'generate_type_matchups': {'files': [], 'artifacts': ['type_chart', 'pokemon_master_evo', 'abilities'],
+                               'depends': ['generate_type_chart', 'generate_evolutions', 'parse_abilities'],
+                               'outputs': ['type_matchups'],
+                               'modules': ['type_matchups', 'type_chart', 'species_refs', 'record_fingerprints'],
+                               'requires': ['numpy']},
+    'generate_trainers': {'files': ['trainers.txt'], 'artifacts': [], 'depends': [],
+                          'outputs': ['trainers'],
+                          'modules': ['trainers_to_json']},
+    'generate_sprite_atlas': {'files': [], 'artifacts': [], 'depends': [], 'images': ['Icons', 'Types', 'Items'],
+                              'outputs': ['sprite_atlas'],
+                              'modules': ['sprite_atlas'], 'requires': ['PIL']},
+    'generate_sprite_variants': {'files': [], 'artifacts': [], 'depends': [],
+                                 'images': ['Front', 'Back', 'Front shiny', 'Back shiny', 'Trainers', 'Items'],
+                                 'outputs': ['sprite_variants'], 'state': ['sprite_variant_sources'],
+                                 'modules': ['sprite_variants'], 'requires': ['PIL']},
+    'generate_sprite_manifest': {'files': [], 'artifacts': ['pokemon_master_evo', 'trainers'],
+                                 'depends': ['generate_evolutions', 'generate_trainers'],
+                                 'images': ['Front', 'Back', 'Front shiny', 'Back shiny', 'Trainers'],
+                                 'outputs': ['sprite_manifest'],
+                                 'modules': ['sprite_manifest']},
+    'export_excel': {'files': ['pokemon.txt', 'moves.txt'],
+                     'artifacts': ['pokemon', 'moves', 'abilities', 'encounters_by_species'],
+                     'depends': ['parse_pokemon', 'parse_moves', 'parse_abilities', 'parse_encounters'],
+                     'outputs': [], 'written': ['pokedexCEL.xlsx'],
+                     'modules': ['pokedexcel', 'move_learners', 'species_refs'], 'requires': ['openpyxl']},
+}
+
+def missing_requirements(stage):
+    """Return the optional packages a stage needs that are not installed."""
+    return [package for package in STAGES[stage].get('requires', []) if importlib.util.find_spec(package) is None]
+
+def _run_stage_task(base_dir, game_name, stage, upstream, trace_memory=False, profile_dir=None):
+    """Run one (game, stage) pair in a worker process and return what it produced and its metrics."""
+    paths = FilePaths(base_dir=base_dir)
+    paths.games = [game_name]
+    orchestrator = DataOrchestrator(paths, trace_memory=trace_memory, profile_dir=profile_dir)
+    for artifact, data in upstream.items():
+        orchestrator.store.put(game_name, artifact, data, emit=False)
+    built, metrics = orchestrator._call_stage(game_name, stage)
+    produced = [entry for entry in orchestrator.store.export(game_name) if entry[0] not in upstream]
+    return built, produced, metrics
 
 class DataOrchestrator:
-    def __init__(self, paths: FilePaths):
+    def __init__(self, paths: FilePaths, store: ArtifactStore = None, force=False, debug_json=False,
+                 trace_memory=False, profile_dir=None):
         self.paths = paths
+        # Parsed artifacts are shared between stages and only written by emit()
+        self.store = store or ArtifactStore(base_dir=paths.base_dir, debug=debug_json)
+        self.force = force
+        self.manifests = {}
+        self.rebuilt = []
+        # (game, artifact) -> the stage that put it, so emitted bytes are reported per stage
+        self.producers = {}
+        self._code_hashes = {}
+        # Every stage call is measured; memory tracing and profiling are opt-in
+        self.trace_memory = trace_memory
+        self.profile_dir = profile_dir
+        self.report = RunReport(force=force, debug_json=self.store.debug, trace_memory=trace_memory,
+                                compressed=self.store.compressed_formats)
 
-    def parse_pokemon(self):
+    def _txt_path(self, game_name, name):
+        return os.path.join(self.paths.base_dir, game_name, 'data', f'{name}.txt')
+
+    def _manifest(self, game_name):
+        if game_name not in self.manifests:
+            self.manifests[game_name] = BuildManifest(self.paths.base_dir, game_name)
+        return self.manifests[game_name]
+
+    def _code_hash(self, stage):
+        if stage not in self._code_hashes:
+            module_dir = os.path.dirname(os.path.abspath(__file__))
+            digest = hashlib.sha256()
+            # Switching between debug and production JSON must rewrite the outputs
+            digest.update(b'debug' if self.store.debug else b'production')
+            for module in COMMON_MODULES + STAGES[stage]['modules']:
+                with open(os.path.join(module_dir, f'{module}.py'), 'rb') as file:
+                    digest.update(file.read())
+            self._code_hashes[stage] = digest.hexdigest()
+        return self._code_hashes[stage]
+
+    def _stage_inputs(self, game_name, stage):
+        manifest = self._manifest(game_name)
+        spec = STAGES[stage]
+        inputs = {}
+        for name in spec['files']:
+            inputs[name] = manifest.file_hash(os.path.join(self.paths.base_dir, game_name, 'data', name))
+        for artifact in spec['artifacts']:
+            inputs[artifact] = manifest.output_hash(artifact)
+        for folder in spec.get('images', []):
+            inputs[f'images/{folder}'] = manifest.folder_hash(os.path.join(self.paths.base_dir, game_name, 'images', folder))
+        return inputs
+
+    def _check_stage(self, game_name, stage):
+        """Return (up_to_date, inputs, code) for one game's stage."""
+        inputs = self._stage_inputs(game_name, stage)
+        code = self._code_hash(stage)
+        outputs_exist = (all(os.path.exists(self.store.path(game_name, artifact))
+                             for artifact in STAGES[stage]['outputs'] if not artifact.endswith('/*'))
+                         and all(os.path.exists(os.path.join(self.paths.base_dir, game_name, file_name))
+                                 for file_name in STAGES[stage].get('written', [])))
+        manifest = self._manifest(game_name)
+        # Emitted files are compared with the hashes recorded when they were written,
+        # so a deleted or edited shard rebuilds its stage
+        up_to_date = (not self.force and outputs_exist and manifest.is_current(stage, inputs, code)
+                      and manifest.emitted_intact(stage))
+        return up_to_date, inputs, code
+
+    def _output_data(self, game_name, artifact):
+        """Return an output's data; a '/*' entry gives {name: data} of every artifact under its directory."""
+        if artifact.endswith('/*'):
+            prefix = artifact[:-1]
+            return {name: self.store.get(game_name, name) for name in self.store.names(game_name) if name.startswith(prefix)}
+        return self.store.get(game_name, artifact)
+
+    def _call_stage(self, game_name, stage):
+        """Run one game's stage builder under CallMetrics and return (built, metrics)."""
+        profile_path = os.path.join(self.profile_dir, f'{stage}-{game_name}.prof') if self.profile_dir else None
+        with CallMetrics(self.trace_memory, profile_path) as metrics:
+            built = getattr(self, f'_{stage}_game')(game_name)
+        return built, metrics.as_dict()
+
+    def _finish_stage(self, game_name, stage, inputs, code, built, produced=(), metrics=None):
+        for artifact, data, emit, dump_options in produced:
+            self.store.put(game_name, artifact, data, emit=emit, **dump_options)
+        for key in self.store.pending(game_name):
+            self.producers.setdefault(key, stage)
+        if built:
+            for artifact in STAGES[stage].get('state', []):
+                self._manifest(game_name).state[artifact] = self.store.get(game_name, artifact)
+        bytes_read = sum(file_size(os.path.join(self.paths.base_dir, game_name, 'data', name)) for name in STAGES[stage]['files'])
+        records = {}
+        if built:
+            outputs = {artifact: self._output_data(game_name, artifact) for artifact in STAGES[stage]['outputs']}
+            output_hashes = {artifact: hash_artifact(data) for artifact, data in outputs.items()}
+            self._manifest(game_name).record(stage, inputs, code, output_hashes)
+            self.rebuilt.append((game_name, stage))
+            records = {artifact: count_records(data, artifact) for artifact, data in outputs.items()}
+        self.report.add(game_name, stage, 'built' if built else 'failed', metrics, bytes_read=bytes_read, records=records)
+
+    def run_stages(self, stages, jobs=1):
+        """Run the given stages for every game in dependency order.
+
+        Every (game, stage) pair becomes a task that is started as soon as the
+        stages it depends on have finished for that game. With jobs > 1 the
+        tasks run on a process pool; up-to-date tasks are skipped either way.
+        """
+        order = {stage: index for index, stage in enumerate(STAGES)}
+        pending = {(game_name, stage) for game_name in self.paths.games for stage in stages}
+        depends = {
+            task: {(task[0], dep) for dep in STAGES[task[1]]['depends'] if dep in stages}
+            for task in pending
+        }
+        finished = set()
+        running = {}
+        pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+        try:
+            while pending or running:
+                ready = sorted((task for task in pending if depends[task] <= finished),
+                               key=lambda task: (order[task[1]], self.paths.games.index(task[0])))
+                for task in ready:
+                    pending.remove(task)
+                    game_name, stage = task
+                    missing = missing_requirements(stage)
+                    if missing:
+                        print(f"Skipping {stage} for game: {game_name} (needs {', '.join(missing)})")
+                        self.report.add(game_name, stage, 'unavailable')
+                        finished.add(task)
+                        continue
+                    up_to_date, inputs, code = self._check_stage(game_name, stage)
+                    if up_to_date:
+                        print(f"Skipping {stage} for game: {game_name} (up to date)")
+                        self.report.add(game_name, stage, 'skipped')
+                        finished.add(task)
+                    elif pool is None:
+                        built, metrics = self._call_stage(game_name, stage)
+                        self._finish_stage(game_name, stage, inputs, code, built, metrics=metrics)
+                        finished.add(task)
+                    else:
+                        spec = STAGES[stage]
+                        upstream = {
+                            artifact: self.store.get(game_name, artifact)
+                            for artifact in spec['artifacts'] + spec.get('reads', [])
+                            if (game_name, artifact) in self.store
+                        }
+                        future = pool.submit(_run_stage_task, self.paths.base_dir, game_name, stage, upstream,
+                                             self.trace_memory, self.profile_dir)
+                        running[future] = (task, inputs, code)
+                if ready:
+                    # Skipped or in-process tasks may have unblocked others
+                    continue
+                if not running:
+                    raise RuntimeError(f"Unresolvable stage dependencies: {sorted(pending)}")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    (game_name, stage), inputs, code = running.pop(future)
+                    built, produced, metrics = future.result()
+                    self._finish_stage(game_name, stage, inputs, code, built, produced, metrics)
+                    finished.add((game_name, stage))
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+    # Stage builders import their parsers themselves so running one stage only loads its modules
+
+    def _parse_pokemon_game(self, game_name):
+        from pbs_tokenizer import iter_sections
+        from parse_pokemon import PokemonParser
+        from parse_forms import FormsParser
+        print(f"Processing game: {game_name}")
+        pokemon_txt_file = self._txt_path(game_name, 'pokemon')
+        if not os.path.exists(pokemon_txt_file):
+            print(f"Pokémon file not found for game: {game_name}")
+            return False
         parser = PokemonParser()
-        parser.process_pokemon_data(self.paths.games, base_dir=self.paths.base_dir)
+        forms_parser = FormsParser()
+        # One pass over pokemon.txt feeds both the records and the base data forms inherit
+        pokemon_list = []
+        base_pokemon = {}
+        for header, entries in iter_sections(pokemon_txt_file):
+            pokemon_list.append(parser.parse_section(header, entries))
+            base_data = forms_parser.parse_base_section(entries)
+            if base_data.get('InternalName'):
+                base_pokemon[base_data['InternalName']] = base_data
+        self.store.put(game_name, 'pokemon', pokemon_list)
+        self.store.put(game_name, 'pokemon_base', base_pokemon, emit=False)
+        print(f"Pokémon data converted for game: {game_name}")
+        return True
 
-    def parse_forms(self):
+    def _parse_forms_game(self, game_name):
+        from parse_forms import FormsParser
+        print(f"Processing forms for game: {game_name}")
+        base_file = self._txt_path(game_name, 'pokemon')
+        forms_file = self._txt_path(game_name, 'pokemon_forms')
+        if not os.path.exists(base_file):
+            print(f"Base Pokémon file not found for game: {game_name}")
+            return False
+        if not os.path.exists(forms_file):
+            print(f"Forms file not found for game: {game_name}")
+            return False
         parser = FormsParser()
-        parser.process_forms_data(self.paths.games, base_dir=self.paths.base_dir)
+        base_pokemon = self.store.get(game_name, 'pokemon_base')
+        if base_pokemon is None:
+            base_pokemon = parser.load_base_pokemon_data(base_file)
+        self.store.put(game_name, 'pokemon_forms', parser.parse_forms(forms_file, base_pokemon))
+        print(f"Forms data converted for game: {game_name}")
+        return True
 
-    def combine_pokemon(self):
+    def _combine_pokemon_game(self, game_name):
+        from combine_pokemon import PokemonCombiner
+        base_data = self.store.get(game_name, 'pokemon')
+        form_data = self.store.get(game_name, 'pokemon_forms')
+        if base_data is None or form_data is None:
+            print(f"Error: Pokémon or forms data not found for game: {game_name}")
+            return False
         combiner = PokemonCombiner(base_dir=self.paths.base_dir)
-        combiner.process_multiple_games(self.paths.games)
+        self.store.put(game_name, 'pokemon_master', combiner.merge_records(game_name, base_data, form_data))
+        print(f"Merge completed for game: {game_name}")
+        return True
 
-    def parse_moves(self):
+    def _parse_moves_game(self, game_name):
+        from pbs_tokenizer import iter_sections
+        from moves_to_json import MovesParser
+        print(f"Processing moves for game: {game_name}")
+        moves_txt_file = self._txt_path(game_name, 'moves')
+        if not os.path.exists(moves_txt_file):
+            print(f"Moves file not found for game: {game_name}")
+            return False
         parser = MovesParser()
-        parser.process_moves_data(self.paths.games, base_dir=self.paths.base_dir)
+        # Verify each move against its section while streaming the file once
+        mismatches = []
+        moves_list = parser.build_moves(iter_sections(moves_txt_file), mismatches)
+        self.store.put(game_name, 'moves', moves_list)
+        parser.report_mismatches(game_name, mismatches)
+        return True
 
-    def parse_abilities(self):
+    def _parse_abilities_game(self, game_name):
+        from pbs_tokenizer import iter_sections
+        from abilities_to_json import AbilitiesParser
+        print(f"Processing abilities for game: {game_name}")
+        abilities_txt_file = self._txt_path(game_name, 'abilities')
+        if not os.path.exists(abilities_txt_file):
+            print(f"Abilities file not found for game: {game_name}")
+            return False
         parser = AbilitiesParser()
-        parser.process_abilities_data(self.paths.games, base_dir=self.paths.base_dir)
+        mismatches = []
+        abilities_list = parser.build_abilities(iter_sections(abilities_txt_file), mismatches)
+        self.store.put(game_name, 'abilities', abilities_list)
+        parser.report_mismatches(game_name, mismatches)
+        return True
 
-    def parse_encounters(self):
+    def _parse_encounters_game(self, game_name):
+        from encounters_to_json import EncountersParser
+        print(f"Processing encounters for game: {game_name}")
+        encounters_txt_file = self._txt_path(game_name, 'encounters')
+        if not os.path.exists(encounters_txt_file):
+            print(f"Encounters file not found for game: {game_name}")
+            return False
         parser = EncountersParser()
-        parser.process_encounters_data(self.paths.games, base_dir=self.paths.base_dir)
+        all_maps = parser.load_encounters(encounters_txt_file)
+        self.store.put(game_name, 'encounters', all_maps)
+        # The full index for list views, plus one small slice per species for the details page
+        species_index = parser.build_species_index(all_maps)
+        self.store.put(game_name, 'encounters_by_species', species_index)
+        parser.remove_stale_slices(os.path.join(self.paths.base_dir, game_name, 'data', 'encounters'), species_index)
+        for species, locations in species_index.items():
+            self.store.put(game_name, f'encounters/{species}', locations)
+        print(f"Finished processing: {game_name}")
+        return True
 
-    def generate_evolutions(self):
-        Evolution.process_multiple_games(self.paths.games, base_dir=self.paths.base_dir)
+    def _generate_evolutions_game(self, game_name):
+        from evos import Evolution
+        pokedex_data = self.store.get(game_name, 'pokemon_master')
+        if pokedex_data is None:
+            print(f"Base merged Pokémon file not found for game: {game_name}")
+            return False
+        pokedex = Evolution(self.store.path(game_name, 'pokemon_master'),
+                            self.store.path(game_name, 'pokemon_master_evo'),
+                            pokedex_data=pokedex_data)
+        evos_dict = pokedex.generate_evolution_dict()
+        self.store.put(game_name, 'pokemon_master_evo', pokedex.build_evolution_data(evos_dict))
+        print(f"Evolution data processed for game: {game_name}")
+        return True
 
-    def generate_types(self):
+    def _generate_pokemon_shards_game(self, game_name):
+        from shard_pokemon import PokemonSharder
+        pokedex_data = self.store.get(game_name, 'pokemon_master_evo')
+        if pokedex_data is None:
+            print(f"Evolution Pokémon file not found for game: {game_name}")
+            return False
+        sharder = PokemonSharder()
+        self.store.put(game_name, 'pokemon_index', sharder.build_index(pokedex_data))
+        shards = sharder.build_shards(pokedex_data)
+        sharder.remove_stale_shards(os.path.join(self.paths.base_dir, game_name, 'data', 'pokemon'), shards)
+        for internal_name, pokemon in shards.items():
+            self.store.put(game_name, f'pokemon/{internal_name}', pokemon)
+        print(f"Pokémon index and {len(shards)} shards generated for game: {game_name}")
+        return True
+
+    def _generate_move_learners_game(self, game_name):
+        from move_learners import MoveLearnersIndexer
+        pokedex_data = self.store.get(game_name, 'pokemon_master_evo')
+        if pokedex_data is None:
+            print(f"Evolution Pokémon file not found for game: {game_name}")
+            return False
+        index = MoveLearnersIndexer().build_index(pokedex_data)
+        self.store.put(game_name, 'move_learners', index)
+        print(f"Move learners index of {len(index['Moves'])} moves generated for game: {game_name}")
+        return True
+
+    def _generate_ability_holders_game(self, game_name):
+        from ability_holders import AbilityHoldersIndexer
+        abilities = self.store.get(game_name, 'abilities')
+        pokedex_data = self.store.get(game_name, 'pokemon_master_evo')
+        if abilities is None or pokedex_data is None:
+            print(f"Abilities or evolution Pokémon file not found for game: {game_name}")
+            return False
+        index = AbilityHoldersIndexer().build_index(abilities, pokedex_data)
+        self.store.put(game_name, 'ability_holders', index)
+        print(f"Ability holders index of {len(index['Abilities'])} abilities generated for game: {game_name}")
+        return True
+
+    def _generate_search_index_game(self, game_name):
+        from search_index import SearchIndexBuilder
+        pokedex_data = self.store.get(game_name, 'pokemon_master_evo')
+        if pokedex_data is None:
+            print(f"Evolution Pokémon file not found for game: {game_name}")
+            return False
+        moves = self.store.get(game_name, 'moves') or []
+        abilities = self.store.get(game_name, 'abilities') or []
+        index = SearchIndexBuilder().build_index(pokedex_data, moves, abilities)
+        self.store.put(game_name, 'search_index', index)
+        print(f"Search index of {len(index['Documents'])} entries generated for game: {game_name}")
+        return True
+
+    def _generate_types_game(self, game_name):
         from types_to_json import TypesParser
+        print(f"Processing types for game: {game_name}")
         parser = TypesParser()
-        parser.process_types_data(self.paths.games, base_dir=self.paths.base_dir)
+        try:
+            self.store.put(game_name, 'types', parser.load_types(self._txt_path(game_name, 'types')))
+            print(f"Successfully processed types for game: {game_name}")
+            return True
+        except FileNotFoundError:
+            print(f"Types file not found for game: {game_name}")
+        except Exception as e:
+            print(f"An error occurred while processing types for game {game_name}: {e}")
+        return False
 
-    def generate_trainers(self):
+    def _generate_type_chart_game(self, game_name):
+        from type_chart import TypeChart
+        types_list = self.store.get(game_name, 'types')
+        if types_list is None:
+            print(f"Types file not found for game: {game_name}")
+            return False
+        chart = TypeChart.from_types(types_list)
+        self.store.put(game_name, 'type_chart', chart.to_artifact())
+        print(f"Type chart of {len(chart.types)} types generated for game: {game_name}")
+        return True
+
+    def _generate_type_matchups_game(self, game_name):
+        from type_chart import TypeChart
+        from type_matchups import MatchupProfiler
+        chart = self.store.get(game_name, 'type_chart')
+        pokedex_data = self.store.get(game_name, 'pokemon_master_evo')
+        if chart is None or pokedex_data is None:
+            print(f"Type chart or evolution Pokémon file not found for game: {game_name}")
+            return False
+        # Ability immunities are applied when the game has an abilities.json
+        profiler = MatchupProfiler(TypeChart.from_artifact(chart), self.store.get(game_name, 'abilities'))
+        matchups = profiler.build_profiles(pokedex_data)
+        self.store.put(game_name, 'type_matchups', matchups)
+        print(f"Type matchups of {len(matchups['Profiles'])} Pokémon generated for game: {game_name}")
+        return True
+
+    def _generate_trainers_game(self, game_name):
         from trainers_to_json import TrainersParser
+        print(f"Processing trainers for game: {game_name}")
+        trainers_txt_file = self._txt_path(game_name, 'trainers')
+        if not os.path.exists(trainers_txt_file):
+            print(f"Trainers file not found for game: {game_name}")
+            return False
         parser = TrainersParser()
-        parser.process_trainers_data(self.paths.games, base_dir=self.paths.base_dir)
-
-    def run_tests(self):
-        print("\nRunning unit tests...")
-        unittest.main(module='unit_tests', exit=False)
-
-    def run_all(self):
-        self.parse_pokemon()
-        self.parse_forms()
-        self.combine_pokemon()
-        self.parse_moves()
-        self.parse_abilities()
-        self.parse_encounters()
-        self.generate_evolutions()
-        self.generate_types()
-        self.generate_trainers()
-        self.run_tests()
+        self.store.put(game_name, 'trainers', parser.load_trainers(trainers_txt_file), ensure_ascii=False)
+        print(f"Trainers data converted for game: {game_name}")
+        return True
+
+    def _generate_sprite_atlas_game(self, game_name):
+        from sprite_atlas import SpriteAtlasPacker
+        atlases = SpriteAtlasPacker().build_atlases(os.path.join(self.paths.base_dir, game_name, 'images'))
+        self.store.put(game_name, 'sprite_atlas', atlases)
+        sheets = sum(len(atlas['Sheets']) for atlas in atlases.values())
+        print(f"Sprite atlases of {sheets} sheets generated for game: {game_name}")
+        return True
+
+    def _generate_sprite_variants_game(self, game_name):
+        from sprite_variants import SpriteTranscoder
+        # Sprites unchanged since the last build keep their encoded files
+        previous = self._manifest(game_name).state.get('sprite_variant_sources')
+        manifest, sources = SpriteTranscoder().build_variants(
+            os.path.join(self.paths.base_dir, game_name, 'images'), previous)
+        self.store.put(game_name, 'sprite_variants', manifest)
+        self.store.put(game_name, 'sprite_variant_sources', sources, emit=False)
+        sprites = sum(len(entries) for entries in manifest['Folders'].values())
+        print(f"Sprite variants of {sprites} sprites generated for game: {game_name}")
+        return True
+
+    def _generate_sprite_manifest_game(self, game_name):
+        from sprite_manifest import SpriteManifestBuilder
+        pokedex_data = self.store.get(game_name, 'pokemon_master_evo')
+        if pokedex_data is None:
+            print(f"Evolution Pokémon file not found for game: {game_name}")
+            return False
+        manifest = SpriteManifestBuilder().build_manifest(
+            os.path.join(self.paths.base_dir, game_name, 'images'), pokedex_data, self.store.get(game_name, 'trainers'))
+        self.store.put(game_name, 'sprite_manifest', manifest)
+        for folder, entry in manifest['Folders'].items():
+            if entry['Missing']:
+                print(f"Warning: {len(entry['Missing'])} {folder} sprites missing for game: {game_name} - "
+                      f"{', '.join(entry['Missing'])}")
+        print(f"Sprite manifest of {len(manifest['Folders'])} folders generated for game: {game_name}")
+        return True
+
+    def _export_excel_game(self, game_name):
+        from pbs_tokenizer import iter_sections
+        from pokedexcel import WORKBOOK_FILE, PokedexWorkbookWriter, display_names
+        pokemon_data = self.store.get(game_name, 'pokemon')
+        if pokemon_data is None:
+            print(f"Pokémon file not found for game: {game_name}")
+            return False
+        # The records keep upper-cased names, so the names the game shows are read from the sections
+        names = {}
+        for name in ('pokemon', 'moves'):
+            txt_file = self._txt_path(game_name, name)
+            names[name] = display_names(iter_sections(txt_file)) if os.path.exists(txt_file) else {}
+        writer = PokedexWorkbookWriter(self.store.get(game_name, 'moves') or [],
+                                       self.store.get(game_name, 'abilities') or [],
+                                       self.store.get(game_name, 'encounters_by_species'),
+                                       names['pokemon'], names['moves'])
+        writer.write_workbook(pokemon_data, os.path.join(self.paths.base_dir, game_name, WORKBOOK_FILE))
+        print(f"Workbook of {len(pokemon_data)} Pokémon exported for game: {game_name}")
+        return True
+
+    def parse_pokemon(self):
+        self.run_stages(['parse_pokemon'])
+
+    def parse_forms(self):
+        self.run_stages(['parse_forms'])
+
+    def combine_pokemon(self):
+        self.run_stages(['combine_pokemon'])
+
+    def parse_moves(self):
+        self.run_stages(['parse_moves'])
+
+    def parse_abilities(self):
+        self.run_stages(['parse_abilities'])
+
+    def parse_encounters(self):
+        self.run_stages(['parse_encounters'])
+
+    def generate_evolutions(self):
+        self.run_stages(['generate_evolutions'])
+
+    def generate_pokemon_shards(self):
+        self.run_stages(['generate_pokemon_shards'])
+
+    def generate_move_learners(self):
+        self.run_stages(['generate_move_learners'])
+
+    def generate_ability_holders(self):
+        self.run_stages(['generate_ability_holders'])
+
+    def generate_search_index(self):
+        self.run_stages(['generate_search_index'])
+
+    def generate_types(self):
+        self.run_stages(['generate_types'])
+
+    def generate_type_chart(self):
+        self.run_stages(['generate_type_chart'])
+
+    def generate_type_matchups(self):
+        self.run_stages(['generate_type_matchups'])
+
+    def generate_trainers(self):
+        self.run_stages(['generate_trainers'])
+
+    def generate_sprite_atlas(self):
+        self.run_stages(['generate_sprite_atlas'])
+
+    def generate_sprite_variants(self):
+        self.run_stages(['generate_sprite_variants'])
+
+    def generate_sprite_manifest(self):
+        self.run_stages(['generate_sprite_manifest'])
+
+    def export_excel(self):
+        self.run_stages(['export_excel'])
+
+    def emit(self):
+        """Write every artifact produced so far, then the build manifests that describe them."""
+        profile_path = os.path.join(self.profile_dir, 'emit.prof') if self.profile_dir else None
+        pending = self.store.pending()
+        with CallMetrics(self.trace_memory, profile_path) as metrics:
+            written = self.store.emit()
+        stage_bytes = {}
+        for (game_name, artifact), path in zip(pending, written):
+            files = [file_path for file_path in (path, path + '.gz', path + '.br') if os.path.exists(file_path)]
+            producer = (game_name, self.producers.get((game_name, artifact)))
+            stage_bytes[producer] = stage_bytes.get(producer, 0) + sum(file_size(file_path) for file_path in files)
+            if producer[1] is not None:
+                for file_path in files:
+                    self._manifest(game_name).record_emitted(producer[1], file_path)
+        for (game_name, stage), size in stage_bytes.items():
+            if stage is not None:
+                self.report.add_bytes_written(game_name, stage, size)
+        self.report.add(None, 'emit', 'built', metrics.as_dict(), bytes_written=sum(stage_bytes.values()),
+                        records={'files': len(written)})
+        for manifest in self.manifests.values():
+            manifest.save()
+        print(f"Wrote {len(written)} data files")
+
+    def run_tests(self, jobs=1):
+        from unit_tests import run_suite
+        print("\nValidating data...")
+        # Only the data checks, as `cli.py validate` runs by default; they read
+        # this run's artifacts from the store instead of the emitted JSON
+        return run_suite(store=self.store, jobs=jobs, games=self.paths.games, tests=['TestCompareData'])
+
+    def write_report(self, report_path=None):
+        """Print the slowest stages and save the run report, by default next to the game folders."""
+        report_path = report_path or os.path.join(self.paths.base_dir, REPORT_FILE)
+        self.report.print_summary()
+        self.report.save(report_path)
+        print(f"Run report written to {report_path}")
+
+    def run_all(self, jobs=1, report_path=None, stages=None, validate=True):
+        """Build the given stages (all by default), emit, report and validate if anything changed.
+
+        Returns the test result when the suite ran, otherwise None.
+        """
+        self.run_stages(list(stages or STAGES), jobs=jobs)
+        self.emit()
+        self.write_report(report_path)
+        if not self.rebuilt:
+            print("Everything is up to date.")
+        elif validate:
+            return self.run_tests(jobs=jobs)
+        return None
 
 if __name__ == "__main__":
-    paths = FilePaths(base_dir="games")
-    orchestrator = DataOrchestrator(paths)
-    orchestrator.run_all()
\ No newline at end of file
+    import sys
+    from cli import main
+
+    # Kept for existing scripts: same as `cli.py build`
+    sys.exit(main(['build'] + sys.argv[1:]))
\ No newline at end of file
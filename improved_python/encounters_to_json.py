@@ -1,29 +1,21 @@
 import os
 import json
 import re
+from pbs_tokenizer import iter_raw_sections
 
 class EncountersParser:
-    def parse_encounters(self, input_file, output_file):
-        """Parse encounters from a text file and write to JSON."""
-        with open(input_file, 'r') as file:
-            data = file.read().strip().split('#-------------------------------')
-
+    def load_encounters(self, input_file):
+        """Parse encounters from a text file into a list of maps."""
         all_maps = []
 
-        for entry in data:
-            if not entry.strip():
-                continue
-
-            lines = entry.strip().splitlines()
-            map_id, map_name = self._parse_map_header(lines[0])
+        for header, lines in iter_raw_sections(input_file):
+            map_id, map_name = self._parse_map_header(header)
 
             encounters = {}
             current_type = None
 
-            for line in lines[1:]:
+            for line in lines:
                 line = line.strip()
-                if not line:
-                    continue
 
                 if re.match(r'^[A-Za-z]+(Day|Night|Morning)?(,\d+)?$', line):
                     parts = line.split(',')
@@ -63,8 +55,51 @@ class EncountersParser:
                 'Encounters': encounters
             })
 
+        return all_maps
+
+    def build_species_index(self, all_maps):
+        """Map every species to the places it can be found, sorted by MapID.
+
+        Each location lists the map, encounter method and area rate, the slot
+        chance and a level range (MinLevel equals MaxLevel for fixed levels).
+        Species are keyed by their upper-cased internal name.
+        """
+        index = {}
+        for map_data in sorted(all_maps, key=lambda entry: self._map_sort_key(entry['MapID'])):
+            for method, details in map_data['Encounters'].items():
+                for slot in details['Pokemon']:
+                    index.setdefault(slot['Species'].upper(), []).append({
+                        'MapID': map_data['MapID'],
+                        'MapName': map_data['MapName'],
+                        'Method': method,
+                        'Rate': details['Rate'],
+                        'Chance': slot['Chance'],
+                        'MinLevel': slot.get('MinLevel', slot.get('Level')),
+                        'MaxLevel': slot.get('MaxLevel', slot.get('Level')),
+                    })
+        return index
+
+    def remove_stale_slices(self, slice_dir, species_names):
+        """Delete per-species slices (and compressed siblings) for species no longer encountered."""
+        if not os.path.isdir(slice_dir):
+            return
+        for file_name in os.listdir(slice_dir):
+            if file_name.split('.json', 1)[0] not in species_names:
+                os.remove(os.path.join(slice_dir, file_name))
+
+    def parse_encounters(self, input_file, output_file, index_file=None):
+        """Parse encounters from a text file and write to JSON, with the species index if asked."""
+        all_maps = self.load_encounters(input_file)
+
         with open(output_file, 'w') as json_file:
             json.dump(all_maps, json_file, indent=4)
+        if index_file:
+            with open(index_file, 'w') as json_file:
+                json.dump(self.build_species_index(all_maps), json_file, indent=4)
+
+    def _map_sort_key(self, map_id):
+        # Numeric IDs sort by value; the "UNKNOWN" fallback goes last
+        return (0, int(map_id)) if map_id.isdigit() else (1, 0)
 
     def _parse_map_header(self, header_line):
         """Extract map ID and name from header line."""
@@ -78,12 +113,13 @@ class EncountersParser:
             print(f"Processing encounters for game: {game_name}")
             encounters_txt_file = os.path.join(base_dir, game_name, 'data', 'encounters.txt')
             encounters_json_file = os.path.join(base_dir, game_name, 'data', 'encounters.json')
+            index_json_file = os.path.join(base_dir, game_name, 'data', 'encounters_by_species.json')
 
             if not os.path.exists(encounters_txt_file):
                 print(f"Encounters file not found for game: {game_name}")
                 continue
 
-            self.parse_encounters(encounters_txt_file, encounters_json_file)
+            self.parse_encounters(encounters_txt_file, encounters_json_file, index_json_file)
             print(f"Finished processing: {game_name}")
 
 if __name__ == '__main__':
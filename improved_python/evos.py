@@ -2,80 +2,308 @@ import json
 import os
 
 class Evolution:
-    def __init__(self, json_path, new_json_path):
+    def __init__(self, json_path, new_json_path, pokedex_data=None):
         self.json_path = json_path
         self.new_json_path = new_json_path
-        with open(self.json_path, 'r') as file:
-            self.pokedex_data = json.load(file)
+        if pokedex_data is None:
+            with open(self.json_path, 'r') as file:
+                pokedex_data = json.load(file)
+        self.pokedex_data = pokedex_data
         self.evos_dict = {}
         self.method_dict = {}
+        # InternalName -> first record with that name, and the evolution
+        # adjacency lists filled in lazily as the graph is walked
+        self.pokemon_index = {}
+        for pokemon in pokedex_data:
+            self.pokemon_index.setdefault(pokemon['InternalName'], pokemon)
+        self.evolution_graph = {}
 
     def find_evolutions(self, base_pokemon):
         """Return a list of all possible evolutions for a given Pokémon."""
-        base_pokemon = base_pokemon.upper()
-        pokemon_row = next((pokemon for pokemon in self.pokedex_data if pokemon['InternalName'] == base_pokemon), None)
+        evo_list = []
+        for evo_name, evo_method in self.evolution_methods(base_pokemon):
+            self.method_dict[evo_name] = evo_method
+            evo_list.append(evo_name)
+        return evo_list
+
+    def evolution_methods(self, base_pokemon):
+        """Return the (evolution, method) pairs listed on a Pokémon's row, without recording them."""
+        pokemon_row = self.pokemon_index.get(base_pokemon.upper())
         if pokemon_row and 'Evolutions' in pokemon_row and pokemon_row['Evolutions']:
             evolutions = pokemon_row['Evolutions'].split(',')
-            evo_list = []
-            for i in range(0, len(evolutions), 3):
-                if i + 2 < len(evolutions):
-                    evo_name = evolutions[i].strip()
-                    evo_method = evolutions[i + 2].strip()
-                    self.method_dict[evo_name] = evo_method
-                    evo_list.append(evo_name)
-            return evo_list
+            return [(evolutions[i].strip(), evolutions[i + 2].strip())
+                    for i in range(0, len(evolutions), 3) if i + 2 < len(evolutions)]
         return []
 
-    def get_evolution_line(self, pokemon, visited=None):
-        """Recursively get all Pokémon in the evolution line, including branches."""
-        if visited is None:
-            visited = set()
-        pokemon = pokemon.upper()
-        if pokemon in visited:
-            return []
-        visited.add(pokemon)
-        evolutions = self.find_evolutions(pokemon)
-        if not evolutions:
-            return [pokemon]
-        lines = []
-        for evo in evolutions:
-            sub_line = self.get_evolution_line(evo, visited.copy())
-            lines.append([pokemon] + sub_line)
-        # Flatten and deduplicate
-        flat = []
-        for line in lines:
-            for p in line:
-                if p not in flat:
-                    flat.append(p)
-        return flat
+    def get_evolutions(self, pokemon):
+        """Return the evolutions of a Pokémon from the adjacency lists, parsing its row once."""
+        if pokemon not in self.evolution_graph:
+            self.evolution_graph[pokemon] = [evo.upper() for evo, _ in self.evolution_methods(pokemon)]
+        return self.evolution_graph[pokemon]
+
+    def get_evolution_line(self, pokemon):
+        """Get all Pokémon in the evolution line, including branches, in depth-first order."""
+        line = []
+        visited = set()
+        stack = [pokemon.upper()]
+        while stack:
+            pokemon = stack.pop()
+            if pokemon in visited:
+                continue
+            visited.add(pokemon)
+            line.append(pokemon)
+            stack.extend(reversed(self.get_evolutions(pokemon)))
+        return line
 
     def generate_evolution_dict(self):
         for pokemon in self.pokedex_data:
             evolution_list = self.get_evolution_line(pokemon['InternalName'])
             self.evos_dict[pokemon['InternalName']] = evolution_list
         self.update_evolution_lines(self.evos_dict)
+        self.update_method_dict()
         return self.evos_dict
 
+    def evolution_families(self):
+        """Split the evolution graph into connected families, each listed from its first Pokédex entry."""
+        neighbours = {}
+        for pokemon in self.pokedex_data:
+            name = pokemon['InternalName'].upper()
+            neighbours.setdefault(name, set())
+            for evo in self.get_evolutions(name):
+                neighbours[name].add(evo)
+                neighbours.setdefault(evo, set()).add(name)
+        families = []
+        seen = set()
+        for name in neighbours:
+            if name in seen:
+                continue
+            seen.add(name)
+            family = [name]
+            for member in family:
+                for other in neighbours[member]:
+                    if other not in seen:
+                        seen.add(other)
+                        family.append(other)
+            families.append(family)
+        return families
+
+    def has_cycle(self, family):
+        """Whether the evolutions between the members of a family form a cycle."""
+        done = set()
+        for start in family:
+            if start in done:
+                continue
+            path = {start}
+            stack = [(start, iter(self.get_evolutions(start)))]
+            while stack:
+                current, evolutions = stack[-1]
+                for evo in evolutions:
+                    if evo in path:
+                        return True
+                    if evo not in done:
+                        path.add(evo)
+                        stack.append((evo, iter(self.get_evolutions(evo))))
+                        break
+                else:
+                    stack.pop()
+                    path.discard(current)
+                    done.add(current)
+        return False
+
+    def parse_order(self, pokemon):
+        """Pokémon whose rows the per-species walk from the given one parses, ordered by their last parse, latest first.
+
+        The walk re-enters a Pokémon along every path reaching it. Without a
+        cycle the last of those is the one a depth-first pass over the
+        evolutions in reverse finds first, so every Pokémon is visited once.
+        """
+        order = []
+        seen = {pokemon}
+        stack = [(pokemon, iter(reversed(self.get_evolutions(pokemon))))]
+        while stack:
+            current, evolutions = stack[-1]
+            for evo in evolutions:
+                if evo not in seen:
+                    seen.add(evo)
+                    stack.append((evo, iter(reversed(self.get_evolutions(evo)))))
+                    break
+            else:
+                stack.pop()
+                order.append(current)
+        return order
+
+    def reaches(self, start, target, blocked):
+        """Whether the target can be reached from start without passing through a blocked Pokémon."""
+        seen = {start}
+        pending = [start]
+        while pending:
+            current = pending.pop()
+            if current == target:
+                return True
+            for evo in self.get_evolutions(current):
+                if evo not in seen and evo not in blocked:
+                    seen.add(evo)
+                    pending.append(evo)
+        return False
+
+    def last_path(self, pokemon, target):
+        """Evolution indices along the last path the per-species walk from a Pokémon takes to the target.
+
+        The walk only stops at Pokémon already on its path, so the last path
+        is the greatest one by index that never repeats a Pokémon: at each step
+        it takes the last evolution the target is still reachable from.
+        """
+        indices = []
+        current = pokemon
+        on_path = {pokemon}
+        while current != target:
+            evolutions = self.get_evolutions(current)
+            for index in reversed(range(len(evolutions))):
+                evo = evolutions[index]
+                if evo not in on_path and self.reaches(evo, target, on_path):
+                    break
+            indices.append(index)
+            current = evo
+            on_path.add(evo)
+        return indices
+
+    def cyclic_parse_order(self, pokemon):
+        """parse_order for a family with a cycle, where the walk can reach a Pokémon along paths the pass above skips."""
+        reachable = [pokemon]
+        seen = {pokemon}
+        for current in reachable:
+            for evo in self.get_evolutions(current):
+                if evo not in seen:
+                    seen.add(evo)
+                    reachable.append(evo)
+        return sorted(reachable, key=lambda target: self.last_path(pokemon, target), reverse=True)
+
+    def update_method_dict(self):
+        """Record, for each evolution, the method of the row that the per-species walks parse last.
+
+        Each species' walk parses every row in its line and later parses
+        overwrite earlier ones, so per family the walks are replayed from the
+        last species back and the first method found for an evolution is kept.
+        """
+        family_of = {}
+        families = self.evolution_families()
+        for position, family in enumerate(families):
+            for name in family:
+                family_of[name] = position
+        roots = [[] for _ in families]
+        walked = set()
+        for pokemon in reversed(self.pokedex_data):
+            root = pokemon['InternalName'].upper()
+            if root not in walked:
+                walked.add(root)
+                roots[family_of[root]].append(root)
+        methods = {}
+        for family, family_roots in zip(families, roots):
+            walk = self.cyclic_parse_order if self.has_cycle(family) else self.parse_order
+            for root in family_roots:
+                for parent in walk(root):
+                    for evo_name, evo_method in reversed(self.evolution_methods(parent)):
+                        methods.setdefault(evo_name, evo_method)
+        self.method_dict = methods
+
     def update_evolution_lines(self, dictionary):
-        for key, value in list(dictionary.items()):
-            if value is None:
+        """Point every entry at the line of the first entry whose line contains it.
+
+        Entries are resolved in order and an entry already resolved is searched
+        through the line it now shares, exactly like a front-to-back scan of the
+        dictionary per entry. Which lines hold each name is indexed up front so
+        each entry only looks at its own family.
+        """
+        keys = list(dictionary)
+        for key in keys:
+            if dictionary[key] is None:
                 dictionary[key] = []
-            result_key = self.search(dictionary, key)
-            if result_key:
-                dictionary[key] = dictionary[result_key]
+        holders = {}
+        for position, key in enumerate(keys):
+            for name in dictionary[key]:
+                holders.setdefault(name, []).append(position)
+        # owner[i] is the position whose original line entry i now shares;
+        # first_sharer[o] is the first resolved entry sharing o's line
+        owner = {}
+        first_sharer = {}
+        for position, key in enumerate(keys):
+            candidates = [first_sharer[o] for o in holders.get(key, ()) if o in first_sharer]
+            unresolved = next((o for o in holders.get(key, ()) if o >= position), None)
+            if unresolved is not None:
+                candidates.append(unresolved)
+            if candidates:
+                found = min(candidates)
+                dictionary[key] = dictionary[keys[found]]
+                owner[position] = found if found >= position else owner[found]
             else:
-                if key not in dictionary[key]:
-                    dictionary[key].append(key)
+                dictionary[key].append(key)
+                owner[position] = position
+            first_sharer.setdefault(owner[position], position)
 
-    def search(self, values, searchFor):
-        for k, v_list in values.items():
-            if v_list is not None and searchFor in v_list:
-                return k
-        return None
+    @staticmethod
+    def egg_moves(record):
+        value = record.get('EggMoves')
+        items = value if isinstance(value, list) else str(value or '').split(',')
+        return [move.strip() for move in items if move and move.strip()]
 
-    def update_json(self, evolution_dict):
+    def build_parent_map(self):
+        """Map every evolution target to the (name, record) of each Pokémon evolving into it.
+
+        Names are upper-cased on both sides, as evolution targets do not always
+        match the case of the InternalName they point at.
+        """
+        parents = {}
+        for pokemon in self.pokedex_data:
+            evolutions = [item.strip() for item in (pokemon.get('Evolutions') or '').split(',')]
+            for target in evolutions[0::3]:
+                if target:
+                    parents.setdefault(target.upper(), []).append((pokemon['InternalName'].upper(), pokemon))
+        return parents
+
+    def inherited_egg_moves(self, parents, pokemon):
+        """Egg moves of every Pokémon the given one evolves from, nearest ancestors first."""
+        inherited = {}
+        visited = set()
+        stack = [pokemon.upper()]
+        while stack:
+            current = stack.pop()
+            for parent, parent_row in parents.get(current, []):
+                if parent in visited:
+                    continue
+                visited.add(parent)
+                inherited.update(dict.fromkeys(self.egg_moves(parent_row)))
+                stack.append(parent)
+        return list(inherited)
+
+    def add_inherited_egg_moves(self, pokemon, parents):
+        """Store the egg moves inherited from prevolutions on a record and its forms.
+
+        Moves the record already lists are left out. A form only gets the field
+        when it overrides EggMoves; otherwise it has its base species' moves.
+        """
+        inherited = self.inherited_egg_moves(parents, pokemon['InternalName'])
+        own = set(self.egg_moves(pokemon))
+        moves = [move for move in inherited if move not in own]
+        if moves:
+            pokemon['InheritedEggMoves'] = moves
+        if inherited and any('EggMoves' in form for form in pokemon.get('Forms', [])):
+            forms = []
+            for form in pokemon['Forms']:
+                if 'EggMoves' in form:
+                    form_own = set(self.egg_moves(form))
+                    form_moves = [move for move in inherited if move not in form_own]
+                    if form_moves:
+                        form = dict(form, InheritedEggMoves=form_moves)
+                forms.append(form)
+            pokemon['Forms'] = forms
+
+    def build_evolution_data(self, evolution_dict):
+        """Return copies of the Pokédex records with EvolutionLine and InheritedEggMoves filled in."""
+        parents = self.build_parent_map()
         updated_pokedex_data = []
         for pokemon in self.pokedex_data:
+            pokemon = dict(pokemon)
+            self.add_inherited_egg_moves(pokemon, parents)
             internal_name = pokemon['InternalName']
             evolution_line = evolution_dict.get(internal_name)
             if evolution_line and len(evolution_line) > 1:
@@ -93,6 +321,10 @@ class Evolution:
                         evolution_line_str += ', '
                 pokemon['EvolutionLine'] = evolution_line_str
             updated_pokedex_data.append(pokemon)
+        return updated_pokedex_data
+
+    def update_json(self, evolution_dict):
+        updated_pokedex_data = self.build_evolution_data(evolution_dict)
         with open(self.new_json_path, 'w') as file:
             json.dump(updated_pokedex_data, file, indent=4)
 
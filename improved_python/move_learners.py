@@ -0,0 +1,62 @@
+import json
+import os
+from species_refs import number_species, split_field
+
+LEARN_METHODS = ['Level', 'Tutor', 'Egg']
+
+def level_up_moves(value):
+    """Pair up a flat [level, move, level, move, ...] field into (level, move) tuples."""
+    items = split_field(value)
+    pairs = []
+    for level, move in zip(items[0::2], items[1::2]):
+        pairs.append((int(level) if level.isdigit() else level, move))
+    return pairs
+
+class MoveLearnersIndexer:
+    """Builds the move→learners index from the evolved Pokémon data.
+
+    Species and forms are numbered once in 'Species' (with 'Base' giving the
+    number of each entry's base species) and every move lists the numbers
+    that learn it by level-up (with the level), tutor or egg. A form is only
+    listed for the learn methods it overrides; otherwise it learns what its
+    base species does.
+    """
+
+    def build_index(self, pokedex_data):
+        species, bases, records = number_species(pokedex_data)
+        moves = {}
+        seen = set()
+
+        def add(move, method, entry):
+            key = (move, method, tuple(entry) if isinstance(entry, list) else entry)
+            if key not in seen:
+                seen.add(key)
+                moves.setdefault(move, {}).setdefault(method, []).append(entry)
+
+        for ref, record, _ in records:
+            if record.get('Moves'):
+                for level, move in level_up_moves(record['Moves']):
+                    add(move, 'Level', [ref, level])
+            for method, field in (('Tutor', 'TutorMoves'), ('Egg', 'EggMoves')):
+                for move in split_field(record.get(field)):
+                    add(move, method, ref)
+
+        ordered = {move: {method: moves[move][method] for method in LEARN_METHODS if method in moves[move]}
+                   for move in sorted(moves)}
+        return {'Species': species, 'Base': bases, 'Moves': ordered}
+
+    def process_multiple_games(self, game_names, base_dir='games'):
+        for game_name in game_names:
+            data_dir = os.path.join(base_dir, game_name, 'data')
+            json_path = os.path.join(data_dir, 'pokemon_master_evo.json')
+            if not os.path.exists(json_path):
+                print(f"Evolution Pokémon file not found for game: {game_name}")
+                continue
+            with open(json_path, 'r') as file:
+                pokedex_data = json.load(file)
+            with open(os.path.join(data_dir, 'move_learners.json'), 'w') as file:
+                json.dump(self.build_index(pokedex_data), file, indent=4)
+            print(f"Move learners index written for game: {game_name}")
+
+if __name__ == '__main__':
+    MoveLearnersIndexer().process_multiple_games(['ss2'])
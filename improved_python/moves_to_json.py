@@ -1,42 +1,45 @@
 import os
 import json
-from compare_moves import check_moves
+from pbs_tokenizer import iter_sections
+from record_fingerprints import verify_entry
 
 class MovesParser:
-    def parse_moves(self, input_file, output_file):
-        """Parse moves from a text file and save to a JSON file."""
-        with open(input_file, 'r') as file:
-            data = file.read().strip().split('#-------------------------------')
+    def build_moves(self, sections, mismatches=None):
+        """Build the moves list from tokenized PBS sections.
 
+        When a mismatches list is passed, each move is verified against its
+        section as it is built, in the form it is serialized to, and any
+        differing fields are appended to it.
+        """
         moves_list = []
 
-        for entry in data:
-            if not entry.strip():
-                continue
-
+        for header, entries in sections:
             move_data = {}
-            lines = entry.strip().split('\n')
-
-            for line in lines:
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
 
-                    # Special processing for specific fields
-                    if key in ['Power', 'Accuracy', 'TotalPP', 'Priority', 'EffectChance']:
-                        value = int(value)
-                    elif key == 'Flags':
-                        value = value.split(',')
-                        value = [v.strip() for v in value if v.strip()]
-                    move_data[key] = value
+            for key, value in entries:
+                # Special processing for specific fields
+                if key in ['Power', 'Accuracy', 'TotalPP', 'Priority', 'EffectChance']:
+                    value = int(value)
+                elif key == 'Flags':
+                    value = value.split(',')
+                    value = [v.strip() for v in value if v.strip()]
+                move_data[key] = value
 
             # Extract the move name from the header
-            move_name = lines[0][1:-1].strip()  # Remove brackets and strip
+            move_name = header[1:-1].strip()  # Remove brackets and strip
             move_data['Name'] = move_name
 
+            if mismatches is not None:
+                mismatches.extend(verify_entry(move_name, entries, move_data))
+
             moves_list.append(move_data)
 
+        return moves_list
+
+    def parse_moves(self, input_file, output_file, mismatches=None):
+        """Parse moves from a text file and save to a JSON file."""
+        moves_list = self.build_moves(iter_sections(input_file), mismatches)
+
         # Write the moves list to a JSON file
         with open(output_file, 'w') as json_file:
             json.dump(moves_list, json_file, indent=4)
@@ -52,18 +55,20 @@ class MovesParser:
                 print(f"Moves file not found for game: {game_name}")
                 continue
 
-            # Parse and save moves
-            self.parse_moves(moves_txt_file, moves_json_file)
+            # Parse, verify and save moves in one pass
+            mismatches = []
+            self.parse_moves(moves_txt_file, moves_json_file, mismatches)
+            self.report_mismatches(game_name, mismatches)
 
-            # Compare moves and check for mismatches
-            mismatches = check_moves(moves_txt_file, moves_json_file)
-            if mismatches:
-                print(f"Mismatches found for game: {game_name}")
-                for mismatch in mismatches:
-                    move_name, key, txt_value, json_value = mismatch
-                    print(f"- {move_name}: {key} differs (txt: {txt_value}, json: {json_value})")
-            else:
-                print(f"No mismatches found for game: {game_name}")
+    def report_mismatches(self, game_name, mismatches):
+        """Print the txt/json mismatches found for a game."""
+        if mismatches:
+            print(f"Mismatches found for game: {game_name}")
+            for mismatch in mismatches:
+                move_name, key, txt_value, json_value = mismatch
+                print(f"- {move_name}: {key} differs (txt: {txt_value}, json: {json_value})")
+        else:
+            print(f"No mismatches found for game: {game_name}")
 
 if __name__ == '__main__':
     parser = MovesParser()
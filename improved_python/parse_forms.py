@@ -1,96 +1,73 @@
 import json
 import os
+from pbs_tokenizer import iter_sections
 
 class FormsParser:
     def __init__(self):
         pass
 
+    def parse_base_section(self, entries):
+        """Pick the fields forms inherit from a tokenized base Pokémon section."""
+        pokemon_data = {}
+        
+        for key, value in entries:
+            if key in ['InternalName', 'Types', 'BaseStats', 'Height', 'Weight', 'Abilities']:
+                if key == 'Types':
+                    types = value.split(',')
+                    pokemon_data['Type1'] = types[0]
+                    if len(types) > 1:
+                        pokemon_data['Type2'] = types[1]
+                elif key == 'BaseStats':
+                    value = value.split(',')
+                elif key in ['Height', 'Weight']:
+                    value = float(value)
+                pokemon_data[key] = value
+        
+        return pokemon_data
+
     def load_base_pokemon_data(self, base_file):
         """Load the base Pokémon data into a dictionary."""
-        with open(base_file, 'r') as file:
-            data = file.read().strip().split('#-------------------------------')
-        
         base_pokemon = {}
         
-        for entry in data:
-            if not entry.strip():
-                continue
-            
-            pokemon_data = {}
-            lines = entry.strip().split('\n')
-            
-            for line in lines:
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key in ['InternalName', 'Types', 'BaseStats', 'Height', 'Weight', 'Abilities']:
-                        if key == 'Types':
-                            types = value.split(',')
-                            pokemon_data['Type1'] = types[0]
-                            if len(types) > 1:
-                                pokemon_data['Type2'] = types[1]
-                        elif key == 'BaseStats':
-                            value = value.split(',')
-                        elif key in ['Height', 'Weight']:
-                            value = float(value)
-                        pokemon_data[key] = value
-
+        for _, entries in iter_sections(base_file):
+            pokemon_data = self.parse_base_section(entries)
             internal_name = pokemon_data.get('InternalName')
             if internal_name:
                 base_pokemon[internal_name] = pokemon_data
         
         return base_pokemon
 
-    def convert_forms_to_json(self, forms_file, output_file, base_pokemon):
-        """Convert the forms data to JSON, merging with base Pokémon data."""
-        with open(forms_file, 'r') as file:
-            data = file.read().strip().split('#-------------------------------')
-        
+    def parse_forms(self, forms_file, base_pokemon):
+        """Parse the forms data into a list, merging with base Pokémon data."""
         forms_list = []
         
-        for entry in data:
-            if not entry.strip():
-                continue
-            
+        for header, entries in iter_sections(forms_file):
             form_data = {'BaseName': '', 'FormName': ''}
-            lines = entry.strip().split('\n')
-            base_pokemon_key = None
-            form_number = None
             
-            for line in lines:
-                if '[' in line and ']' in line:
-                    header = line.strip('[]')
-                    base_pokemon_key, *form_info = header.split(',')
-                    form_data['BaseName'] = base_pokemon_key.strip()
-                    form_number = form_info[0].strip() if form_info else None
-                    continue
-                
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key == 'FormName':
-                        form_data['FormName'] = value
-                    elif key in ['InternalName', 'Types', 'Type1', 'Type2', 'BaseStats', 'Height', 'Weight', 'Moves', 'TutorMoves', 'EggMoves', 'Abilities', 'HiddenAbility', 'HiddenAbilities']:
-                        if key == 'Types':
-                            types = value.split(',')
-                            form_data['Type1'] = types[0]
-                            if len(types) > 1:
-                                form_data['Type2'] = types[1]
-                        elif key == 'Type1':
-                            form_data['Type1'] = value[0]
-                        elif key == 'Type2':
-                            form_data['Type2'] = value[1]
-                        elif key == 'BaseStats':
-                            value = value.split(',')
-                        elif key in ['Height', 'Weight']:
-                            value = float(value)
-                        elif key == 'HiddenAbility' or 'HiddenAbilities':
-                            form_data['HiddenAbility'] = value
-                        form_data[key] = value
+            base_pokemon_key, *form_info = header.strip('[]').split(',')
+            form_data['BaseName'] = base_pokemon_key.strip()
+            form_number = form_info[0].strip() if form_info else None
+            
+            for key, value in entries:
+                if key == 'FormName':
+                    form_data['FormName'] = value
+                elif key in ['InternalName', 'Types', 'Type1', 'Type2', 'BaseStats', 'Height', 'Weight', 'Moves', 'TutorMoves', 'EggMoves', 'Abilities', 'HiddenAbility', 'HiddenAbilities']:
+                    if key == 'Types':
+                        types = value.split(',')
+                        form_data['Type1'] = types[0]
+                        if len(types) > 1:
+                            form_data['Type2'] = types[1]
+                    elif key == 'Type1':
+                        form_data['Type1'] = value[0]
+                    elif key == 'Type2':
+                        form_data['Type2'] = value[1]
+                    elif key == 'BaseStats':
+                        value = value.split(',')
+                    elif key in ['Height', 'Weight']:
+                        value = float(value)
+                    elif key in ['HiddenAbility', 'HiddenAbilities']:
+                        form_data['HiddenAbility'] = value
+                    form_data[key] = value
 
             if not form_data['FormName']:
                 form_data['FormName'] = f"{form_data['BaseName']} Form {form_number or ''}".strip()
@@ -104,6 +81,12 @@ class FormsParser:
             
             forms_list.append(form_data)
         
+        return forms_list
+
+    def convert_forms_to_json(self, forms_file, output_file, base_pokemon):
+        """Convert the forms data to JSON, merging with base Pokémon data."""
+        forms_list = self.parse_forms(forms_file, base_pokemon)
+        
         with open(output_file, 'w') as json_file:
             json.dump(forms_list, json_file, indent=4)
 
@@ -1,78 +1,72 @@
 import os
 import json
 import re
+from pbs_tokenizer import iter_sections
 
 class PokemonParser:
     def __init__(self):
         pass
 
-    def convert_txt_to_json(self, input_file, output_file):
-        """Convert Pokémon data from TXT to JSON format."""
-        with open(input_file, 'r') as file:
-            data = file.read().strip().split('#-------------------------------')
+    def parse_section(self, header, entries):
+        """Parse a single tokenized Pokémon section into a record."""
+        pokemon_data = {}
         
-        pokemon_list = []
+        # Check for InternalName in brackets
+        match = re.match(r'\[(.*?)\]', header)
+        if match:
+            internal_name = match.group(1)
+            if not internal_name.isdigit():  # Ignore numeric IDs
+                pokemon_data['InternalName'] = internal_name
         
-        for entry in data:
-            if not entry.strip():
-                continue
+        # Parse key-value pairs
+        for key, value in entries:
+            if key == 'InternalName':
+                pokemon_data['InternalName'] = value
             
-            pokemon_data = {}
-            lines = entry.strip().split('\n')
+            elif key == 'Name':
+                value = value.upper()
+                pokemon_data['Name'] = value
             
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Check for InternalName in brackets
-                if line.startswith('['):
-                    match = re.match(r'\[(.*?)\]', line)
-                    if match:
-                        internal_name = match.group(1)
-                        if not internal_name.isdigit():  # Ignore numeric IDs
-                            pokemon_data['InternalName'] = internal_name
-                
-                # Parse key-value pairs
-                elif '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if key == 'InternalName':
-                        pokemon_data['InternalName'] = value
-                    
-                    elif key == 'Name':
-                        value = value.upper()
-                        pokemon_data['Name'] = value
-                    
-                    elif key == 'Types':
-                        # Split Types field into Type1 and Type2
-                        types = value.split(',')
-                        pokemon_data['Type1'] = types[0]
-                        if len(types) > 1:
-                            pokemon_data['Type2'] = types[1]
-                    
-                    elif key in ['BaseStats', 'EffortPoints', 'Moves', 'TutorMoves']:
-                        # Convert comma-separated values to lists
-                        value = value.split(',')
-                        pokemon_data[key] = value
-                    
-                    elif key in ['Height', 'Weight']:
-                        # Convert to float
-                        pokemon_data[key] = float(value)
-                    
-                    elif key in ['BaseEXP', 'Rareness', 'Happiness', 'Generation']:
-                        # Convert to int
-                        pokemon_data[key] = int(value)
-                    
-                    else:
-                        pokemon_data[key] = value
+            elif key == 'Types':
+                # Split Types field into Type1 and Type2
+                types = value.split(',')
+                pokemon_data['Type1'] = types[0]
+                if len(types) > 1:
+                    pokemon_data['Type2'] = types[1]
             
-            if 'InternalName' not in pokemon_data:
-                print(f"Warning: No InternalName found for entry: {pokemon_data.get('Name', 'UNKNOWN')}")
+            elif key in ['BaseStats', 'EffortPoints', 'Moves', 'TutorMoves']:
+                # Convert comma-separated values to lists
+                value = value.split(',')
+                pokemon_data[key] = value
             
-            pokemon_list.append(pokemon_data)
+            elif key in ['Height', 'Weight']:
+                # Convert to float
+                pokemon_data[key] = float(value)
+            
+            elif key in ['BaseEXP', 'Rareness', 'Happiness', 'Generation']:
+                # Convert to int
+                pokemon_data[key] = int(value)
+            
+            else:
+                pokemon_data[key] = value
+        
+        if 'InternalName' not in pokemon_data:
+            print(f"Warning: No InternalName found for entry: {pokemon_data.get('Name', 'UNKNOWN')}")
+        
+        return pokemon_data
+
+    def parse_pokemon(self, input_file):
+        """Parse Pokémon data from a TXT file into a list of records."""
+        pokemon_list = []
+        
+        for header, entries in iter_sections(input_file):
+            pokemon_list.append(self.parse_section(header, entries))
+        
+        return pokemon_list
+
+    def convert_txt_to_json(self, input_file, output_file):
+        """Convert Pokémon data from TXT to JSON format."""
+        pokemon_list = self.parse_pokemon(input_file)
         
         # Write to JSON file
         with open(output_file, 'w') as json_file:
@@ -0,0 +1,38 @@
+def iter_raw_sections(file_path, encoding='utf-8-sig'):
+    """Stream a PBS file and yield (header, lines) for each [header] section.
+
+    The file is read line by line, so only the section currently being built is
+    held in memory. Blank lines, separators and comment lines are dropped, and
+    anything before the first header (the usual wiki preamble) is ignored.
+    Body lines keep their leading indentation for parsers that depend on it.
+    """
+    header = None
+    lines = []
+    with open(file_path, 'r', encoding=encoding) as file:
+        for line in file:
+            line = line.rstrip()
+            stripped = line.lstrip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            if stripped.startswith('['):
+                if header is not None:
+                    yield header, lines
+                header = stripped
+                lines = []
+            elif header is not None:
+                lines.append(line)
+    if header is not None:
+        yield header, lines
+
+def split_key_value(line):
+    """Split a `Key = Value` line into a stripped (key, value) pair."""
+    key, value = line.split('=', 1)
+    return key.strip(), value.strip()
+
+def iter_sections(file_path, encoding='utf-8-sig'):
+    """Stream a PBS file and yield (header, [(key, value), ...]) for each section.
+
+    Lines without an `=` are skipped; use iter_raw_sections when they matter.
+    """
+    for header, lines in iter_raw_sections(file_path, encoding):
+        yield header, [split_key_value(line) for line in lines if '=' in line]
@@ -0,0 +1,55 @@
+import re
+
+NAME_NOISE = re.compile(r'[^a-z0-9]')
+INTEGER = re.compile(r'[-+]?\d+')
+
+def normalize_name(name):
+    """Normalize the name by stripping spaces and converting to lowercase."""
+    return NAME_NOISE.sub('', name.strip().lower())
+
+def canonical_value(value):
+    """Reduce a txt or JSON value to one comparable form.
+
+    Comma-separated strings and lists both become lists of normalized items,
+    numeric strings become integers and single-item lists collapse to the item.
+    """
+    if isinstance(value, str):
+        if ',' not in value:
+            value = value.strip()
+            if INTEGER.fullmatch(value):
+                return int(value)
+            return NAME_NOISE.sub('', value.lower())
+        value = value.split(',')
+    if isinstance(value, (list, tuple)):
+        items = [canonical_value(item) for item in value]
+        items = [item for item in items if item != '']
+        return items[0] if len(items) == 1 else items or ''
+    return value
+
+def diff_entry(entry_name, source, record):
+    """Return (name, key, txt, json) for every field the source and record disagree on.
+
+    Fields holding the same value on both sides are not canonicalized at all.
+    """
+    mismatches = []
+    for key, txt_value in source.items():
+        json_value = record.get(key)
+        if json_value == txt_value:
+            continue
+        txt_value = canonical_value(txt_value)
+        json_value = canonical_value(json_value)
+        if json_value != txt_value:
+            mismatches.append((entry_name, key, txt_value, json_value))
+    for key in record.keys() - source.keys():
+        mismatches.append((entry_name, key, None, canonical_value(record[key])))
+    return mismatches
+
+def verify_entry(entry_name, entries, record):
+    """Check a freshly built record against the (key, value) pairs it came from.
+
+    Name is left out on both sides because parsers deliberately replace it
+    with the section header.
+    """
+    source = {key: value for key, value in entries if key != 'Name'}
+    compared = {key: value for key, value in record.items() if key != 'Name'}
+    return diff_entry(normalize_name(entry_name), source, compared)
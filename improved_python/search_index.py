@@ -0,0 +1,168 @@
+import json
+import os
+import re
+
+KINDS = ['pokemon', 'form', 'move', 'ability']
+PREFIX_LENGTH = 2
+GRAM_LENGTH = 3
+
+def tokenize(value):
+    """Lowercase alphanumeric words of a name or query, accents and punctuation dropped."""
+    return re.findall(r'[a-z0-9]+', str(value or '').lower().replace('é', 'e'))
+
+def trigrams(text):
+    return {text[i:i + GRAM_LENGTH] for i in range(len(text) - GRAM_LENGTH + 1)}
+
+class SearchIndexBuilder:
+    """Builds the type-ahead search index over species, forms, moves and abilities.
+
+    Each document has a Kind, Id, display Name and normalized Tokens, plus
+    Base for forms (the InternalName of the species they belong to). Tokens
+    of up to PREFIX_LENGTH characters are answered from the prefix postings,
+    longer ones from the trigram postings of each document's tokens run
+    together; Ranks gives every document's position in alphabetical order so
+    ties sort without comparing strings.
+    """
+
+    def documents(self, pokedex_data, moves, abilities):
+        for pokemon in pokedex_data:
+            yield {'Kind': 'pokemon', 'Id': pokemon['InternalName'], 'Name': pokemon.get('Name') or pokemon['InternalName']}
+            base_tokens = tokenize(pokemon.get('Name') or pokemon['InternalName'])
+            for form in pokemon.get('Forms', []):
+                name = form.get('FormName') or form.get('Name') or form['InternalName']
+                tokens = tokenize(name)
+                # "Anomaly" alone says nothing about the species, so it is searchable by both names
+                tokens += [token for token in base_tokens if token not in tokens]
+                yield {'Kind': 'form', 'Id': form['InternalName'], 'Name': name,
+                       'Base': pokemon['InternalName'], 'Tokens': tokens}
+        for move in moves:
+            if move.get('Name'):
+                yield {'Kind': 'move', 'Id': move['Name'], 'Name': move['Name']}
+        for ability in abilities:
+            if ability.get('Name'):
+                yield {'Kind': 'ability', 'Id': ability['Name'], 'Name': ability['Name']}
+
+    def build_index(self, pokedex_data, moves, abilities):
+        documents = []
+        seen = set()
+        for document in self.documents(pokedex_data, moves, abilities):
+            # A repeated id keeps its first record, as everywhere else in the pipeline
+            if (document['Kind'], document['Id']) in seen:
+                continue
+            seen.add((document['Kind'], document['Id']))
+            document.setdefault('Tokens', tokenize(document['Name']))
+            documents.append(document)
+
+        tokens, prefixes, grams = {}, {}, {}
+
+        def post(postings, key, position):
+            entries = postings.setdefault(key, [])
+            if entries[-1:] != [position]:
+                entries.append(position)
+
+        for position, document in enumerate(documents):
+            for token in document['Tokens']:
+                post(tokens, token, position)
+                for length in range(1, min(PREFIX_LENGTH, len(token)) + 1):
+                    post(prefixes, token[:length], position)
+            for gram in sorted(trigrams(''.join(document['Tokens']))):
+                post(grams, gram, position)
+
+        order = sorted(range(len(documents)),
+                       key=lambda position: (' '.join(documents[position]['Tokens']),
+                                             KINDS.index(documents[position]['Kind'])))
+        ranks = [0] * len(documents)
+        for rank, position in enumerate(order):
+            ranks[position] = rank
+
+        return {'Documents': documents, 'Ranks': ranks,
+                'Tokens': dict(sorted(tokens.items())),
+                'Prefixes': dict(sorted(prefixes.items())),
+                'Trigrams': dict(sorted(grams.items()))}
+
+    def process_multiple_games(self, game_names, base_dir='games'):
+        for game_name in game_names:
+            data_dir = os.path.join(base_dir, game_name, 'data')
+            paths = {name: os.path.join(data_dir, f'{name}.json') for name in ['pokemon_master_evo', 'moves', 'abilities']}
+            if not os.path.exists(paths['pokemon_master_evo']):
+                print(f"Evolution Pokémon file not found for game: {game_name}")
+                continue
+            loaded = {}
+            for name, path in paths.items():
+                loaded[name] = []
+                if os.path.exists(path):
+                    with open(path, 'r') as file:
+                        loaded[name] = json.load(file)
+            index = self.build_index(loaded['pokemon_master_evo'], loaded['moves'], loaded['abilities'])
+            with open(os.path.join(data_dir, 'search_index.json'), 'w') as file:
+                json.dump(index, file, indent=4)
+            print(f"Search index written for game: {game_name}")
+
+class SearchIndex:
+    """Answers type-ahead queries from a search index built by SearchIndexBuilder.
+
+    Every word of the query must match a document: words of up to
+    PREFIX_LENGTH characters match the start of one of its tokens, longer
+    words match anywhere in its tokens run together. Results come exact
+    matches first, then names starting with the query or containing one of
+    its words whole, then the rest, each group in rank order.
+    """
+
+    def __init__(self, index):
+        self.documents = index['Documents']
+        self.ranks = index['Ranks']
+        self.tokens = index['Tokens']
+        self.prefixes = index['Prefixes']
+        self.grams = index['Trigrams']
+        self.compact = [''.join(document['Tokens']) for document in self.documents]
+
+    def _candidates(self, word):
+        if len(word) <= PREFIX_LENGTH:
+            return set(self.prefixes.get(word, []))
+        postings = [self.grams.get(gram, []) for gram in trigrams(word)]
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for entries in postings[1:]:
+            candidates.intersection_update(entries)
+            if not candidates:
+                break
+        # Trigrams can match out of order, so each candidate is checked against the text itself
+        return {position for position in candidates if word in self.compact[position]}
+
+    def lookup(self, query, kinds=None):
+        """Positions of the documents matching every word of the query, unordered."""
+        words = tokenize(query)
+        if not words:
+            return set()
+        matches = None
+        for word in sorted(words, key=len, reverse=True):
+            candidates = self._candidates(word)
+            matches = candidates if matches is None else matches & candidates
+            if not matches:
+                return set()
+        if kinds:
+            matches = {position for position in matches if self.documents[position]['Kind'] in kinds}
+        return matches
+
+    def search(self, query, kinds=None, limit=20):
+        """Best matching documents for the query, optionally restricted to some kinds."""
+        words = tokenize(query)
+        compact_query = ''.join(words)
+        whole_words = set()
+        for word in words:
+            whole_words.update(self.tokens.get(word, []))
+
+        def order(position):
+            if self.compact[position] == compact_query:
+                group = 0
+            elif position in whole_words or self.compact[position].startswith(compact_query):
+                group = 1
+            else:
+                group = 2
+            return group, self.ranks[position]
+
+        positions = sorted(self.lookup(query, kinds), key=order)
+        return [self.documents[position] for position in positions[:limit]]
+
+if __name__ == '__main__':
+    SearchIndexBuilder().process_multiple_games(['ss2'])
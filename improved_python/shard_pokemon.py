@@ -0,0 +1,62 @@
+import json
+import os
+
+# Fields the list view needs to draw and filter a card, for species and their forms;
+# Evolutions also lets the details page draw a species' evolution family. Move lists
+# are left to the full records, which the list view only loads for a move search
+CARD_FIELDS = ['InternalName', 'Name', 'Type1', 'Type2', 'BaseStats', 'Abilities', 'HiddenAbilities', 'HiddenAbility',
+               'Evolutions', 'EggGroups', 'WildItemCommon', 'WildItemUncommon', 'WildItemRare']
+FORM_CARD_FIELDS = ['InternalName', 'FormName', 'Type1', 'Type2', 'BaseStats', 'Abilities', 'HiddenAbilities', 'HiddenAbility']
+
+class PokemonSharder:
+    def build_index(self, pokedex_data):
+        """Build the lightweight list index holding only the card fields."""
+        index = []
+        for pokemon in pokedex_data:
+            entry = {key: pokemon[key] for key in CARD_FIELDS if key in pokemon}
+            forms = [
+                {key: form[key] for key in FORM_CARD_FIELDS if key in form}
+                for form in pokemon.get('Forms', [])
+            ]
+            if forms:
+                entry['Forms'] = forms
+            index.append(entry)
+        return index
+
+    def build_shards(self, pokedex_data):
+        """Map every species' InternalName to its full record, forms included."""
+        return {pokemon['InternalName']: pokemon for pokemon in pokedex_data if pokemon.get('InternalName')}
+
+    def remove_stale_shards(self, shard_dir, internal_names):
+        """Delete shard files (and compressed siblings) for species that no longer exist."""
+        if not os.path.isdir(shard_dir):
+            return
+        for file_name in os.listdir(shard_dir):
+            internal_name = file_name.split('.json', 1)[0]
+            if internal_name not in internal_names:
+                os.remove(os.path.join(shard_dir, file_name))
+
+    def process_multiple_games(self, game_names, base_dir='games'):
+        for game_name in game_names:
+            data_dir = os.path.join(base_dir, game_name, 'data')
+            json_path = os.path.join(data_dir, 'pokemon_master_evo.json')
+            if not os.path.exists(json_path):
+                print(f"Evolution Pokémon file not found for game: {game_name}")
+                continue
+            with open(json_path, 'r') as file:
+                pokedex_data = json.load(file)
+
+            with open(os.path.join(data_dir, 'pokemon_index.json'), 'w') as file:
+                json.dump(self.build_index(pokedex_data), file, indent=4)
+
+            shard_dir = os.path.join(data_dir, 'pokemon')
+            os.makedirs(shard_dir, exist_ok=True)
+            shards = self.build_shards(pokedex_data)
+            self.remove_stale_shards(shard_dir, shards)
+            for internal_name, pokemon in shards.items():
+                with open(os.path.join(shard_dir, f'{internal_name}.json'), 'w') as file:
+                    json.dump(pokemon, file, indent=4)
+            print(f"Pokémon index and {len(shards)} shards written for game: {game_name}")
+
+if __name__ == '__main__':
+    PokemonSharder().process_multiple_games(['ss2'])
@@ -0,0 +1,27 @@
+def split_field(value):
+    """Return a list field as upper-cased names, from a list or a comma-separated string."""
+    if not value:
+        return []
+    items = value.split(',') if isinstance(value, str) else value
+    return [str(item).strip().upper() for item in items if str(item).strip()]
+
+def number_species(pokedex_data):
+    """Number every species and form of the evolved Pokémon data in file order.
+
+    Returns (species, bases, records): the InternalName of each number, the
+    number of each entry's base species and (number, record, is_form) for
+    every species and form, so indexes can refer to Pokémon by integer.
+    """
+    species = []
+    bases = []
+    records = []
+    for pokemon in pokedex_data:
+        base_ref = len(species)
+        species.append(pokemon['InternalName'])
+        bases.append(base_ref)
+        records.append((base_ref, pokemon, False))
+        for form in pokemon.get('Forms', []):
+            records.append((len(species), form, True))
+            species.append(form['InternalName'])
+            bases.append(base_ref)
+    return species, bases, records
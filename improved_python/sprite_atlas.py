@@ -0,0 +1,114 @@
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:  # optional, the sprite atlas stage is skipped without it
+    Image = None
+
+# Image folders packed into atlases, and where the sheets go under images/
+ATLAS_FOLDERS = ['Icons', 'Types', 'Items']
+ATLAS_DIR = 'atlas'
+SHEET_SIZE = 2048
+
+def sprite_key(file_name):
+    """Split a sprite file name into (InternalName, form index); ABRA_1.png is form 1 of ABRA."""
+    stem = os.path.splitext(file_name)[0]
+    match = re.fullmatch(r'(.+)_(\d+)', stem)
+    return (match.group(1), match.group(2)) if match else (stem, '0')
+
+def render_sheet(output_path, width, height, placements):
+    """Paste every (source path, x, y) onto a transparent sheet and save it as a PNG."""
+    sheet = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    for source_path, x, y in placements:
+        with Image.open(source_path) as sprite:
+            sheet.paste(sprite.convert('RGBA'), (x, y))
+    sheet.save(output_path, optimize=True)
+    return output_path
+
+class SpriteAtlasPacker:
+    """Packs the PNGs of a game's image folders into a few sprite sheets.
+
+    Sprites are shelf-packed tallest first onto sheets of at most
+    sheet_size pixels a side, and the sheets are drawn on a process pool.
+    Each folder's entry lists its sheets (relative to images/) and maps every
+    InternalName and form index to [sheet, x, y, width, height].
+    """
+
+    def __init__(self, sheet_size=SHEET_SIZE, jobs=None):
+        if Image is None:
+            raise ImportError("Pillow is required to pack sprite atlases")
+        self.sheet_size = sheet_size
+        self.jobs = jobs
+
+    def layout(self, sprites):
+        """Place (name, width, height) sprites; return sheets of (name, x, y, width, height) and their sizes."""
+        sheets = []
+        sizes = []
+        x = y = shelf = 0
+        for name, width, height in sorted(sprites, key=lambda sprite: (-sprite[2], sprite[0])):
+            if not sheets or x + width > self.sheet_size:
+                x, y, shelf = 0, y + shelf, height
+            if not sheets or y + height > self.sheet_size:
+                sheets.append([])
+                sizes.append([0, 0])
+                x, y, shelf = 0, 0, height
+            sheets[-1].append((name, x, y, width, height))
+            sizes[-1] = [max(sizes[-1][0], x + width), max(sizes[-1][1], y + height)]
+            x += width
+        return sheets, sizes
+
+    def build_atlases(self, images_dir, folders=ATLAS_FOLDERS):
+        """Write the sheets of every folder present under images_dir and return the coordinate map.
+
+        A game without any of the folders gets an empty map.
+        """
+        atlas_dir = os.path.join(images_dir, ATLAS_DIR)
+        atlases = {}
+        tasks = []
+        for folder in folders:
+            folder_path = os.path.join(images_dir, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            sprites = []
+            for file_name in sorted(os.listdir(folder_path)):
+                if file_name.lower().endswith('.png'):
+                    # Opening only reads the header, so sizing every sprite stays cheap
+                    with Image.open(os.path.join(folder_path, file_name)) as sprite:
+                        sprites.append((file_name, *sprite.size))
+            sheets, sizes = self.layout(sprites)
+            entry = {'Sheets': [], 'Sprites': {}}
+            for number, (placements, (width, height)) in enumerate(zip(sheets, sizes)):
+                sheet_name = f'{folder.lower()}-{number}.png'
+                entry['Sheets'].append({'File': f'{ATLAS_DIR}/{sheet_name}', 'Width': width, 'Height': height})
+                for file_name, x, y, sprite_width, sprite_height in placements:
+                    name, form = sprite_key(file_name)
+                    entry['Sprites'].setdefault(name, {})[form] = [number, x, y, sprite_width, sprite_height]
+                tasks.append((os.path.join(atlas_dir, sheet_name), width, height,
+                              [(os.path.join(folder_path, file_name), x, y) for file_name, x, y, _, _ in placements]))
+            entry['Sprites'] = dict(sorted(entry['Sprites'].items()))
+            atlases[folder] = entry
+
+        written = set()
+        if tasks:
+            os.makedirs(atlas_dir, exist_ok=True)
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                written.update(pool.map(render_sheet, *zip(*tasks)))
+        # Sheets left over from a folder that used to need more of them, or is gone
+        if os.path.isdir(atlas_dir):
+            for file_name in os.listdir(atlas_dir):
+                if os.path.join(atlas_dir, file_name) not in written:
+                    os.remove(os.path.join(atlas_dir, file_name))
+        return atlases
+
+    def process_multiple_games(self, game_names, base_dir='games'):
+        for game_name in game_names:
+            atlases = self.build_atlases(os.path.join(base_dir, game_name, 'images'))
+            with open(os.path.join(base_dir, game_name, 'data', 'sprite_atlas.json'), 'w') as file:
+                json.dump(atlases, file, indent=4)
+            print(f"Sprite atlases written for game: {game_name}")
+
+if __name__ == '__main__':
+    SpriteAtlasPacker().process_multiple_games(['ss2'])
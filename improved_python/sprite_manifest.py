@@ -0,0 +1,116 @@
+import json
+import os
+import re
+
+# Pokémon sprite folders the site picks between, and the placeholder every folder falls back to
+POKEMON_FOLDERS = ['Front', 'Back', 'Front shiny', 'Back shiny']
+TRAINER_FOLDER = 'Trainers'
+DEFAULT_STEM = '000'
+
+def unique(names):
+    seen = set()
+    return [name for name in names if not (name in seen or seen.add(name))]
+
+def species_candidates(internal_name):
+    """File stems tried for a species, in order; some games ship only a NAMET.png."""
+    return [internal_name, f'{internal_name}T']
+
+def form_candidates(base_name, form, position, form_count):
+    """File stems tried for the form at position (1-based) among form_count forms of base_name.
+
+    Anomaly forms are drawn from the neighbouring numbered sprite; other
+    forms try their own name, their position, then every numbered sibling
+    and the base sprite.
+    """
+    name = form.get('InternalName') or base_name
+    if 'anomaly' in (form.get('FormName') or '').lower() or 'anomaly' in (form.get('InternalName') or '').lower():
+        return unique([name, f'{name[:-1]}2', f'{name[:-1]}1'])
+    match = re.fullmatch(r'(.*)_(\d+)', name)
+    root = match.group(1) if match else name
+    candidates = [name]
+    if position > 1:
+        candidates.insert(0 if match else 1, f'{root}_{position}')
+    candidates += [f'{root}_{index}' for index in range(1, form_count + 1)]
+    if match:
+        candidates.append(root)
+    return unique(candidates)
+
+class SpriteManifestBuilder:
+    """Works out which image file each Pokémon, form and trainer is drawn with.
+
+    The image folders are listed once, and every name is resolved to the
+    first candidate file that exists, or to the folder's placeholder. Each
+    folder's entry keeps only the names that differ from their own file:
+    Redirects maps a name to the stem it borrows, Missing lists the names
+    drawn with the Default placeholder.
+    """
+
+    def __init__(self):
+        self.available = {}
+
+    def scan(self, images_dir):
+        """List the PNG stems of every folder under images_dir."""
+        self.available = {}
+        if os.path.isdir(images_dir):
+            for folder in os.listdir(images_dir):
+                folder_path = os.path.join(images_dir, folder)
+                if os.path.isdir(folder_path):
+                    self.available[folder] = {os.path.splitext(file_name)[0] for file_name in os.listdir(folder_path)
+                                              if file_name.lower().endswith('.png')}
+
+    def resolve(self, folder, candidates):
+        """Return the first candidate stem with a PNG in folder, or None."""
+        files = self.available.get(folder, set())
+        return next((stem for stem in candidates if stem in files), None)
+
+    def pokemon_candidates(self, pokedex_data):
+        """Yield (InternalName, candidate stems) for every species and form."""
+        for pokemon in pokedex_data:
+            base_name = pokemon.get('InternalName')
+            if not base_name:
+                continue
+            yield base_name, species_candidates(base_name)
+            forms = pokemon.get('Forms') or []
+            for position, form in enumerate(forms, start=1):
+                if form.get('InternalName'):
+                    yield form['InternalName'], form_candidates(base_name, form, position, len(forms))
+
+    def folder_entry(self, folder, candidates):
+        files = self.available.get(folder, set())
+        entry = {'Default': DEFAULT_STEM if DEFAULT_STEM in files else None, 'Redirects': {}, 'Missing': []}
+        for name, stems in candidates:
+            stem = self.resolve(folder, stems)
+            if stem is None:
+                if name not in entry['Missing']:
+                    entry['Missing'].append(name)
+            elif stem != name:
+                entry['Redirects'][name] = stem
+        return entry
+
+    def build_manifest(self, images_dir, pokedex_data, trainers=None):
+        """Resolve every species, form and trainer type against the folders under images_dir."""
+        self.scan(images_dir)
+        pokemon = list(self.pokemon_candidates(pokedex_data))
+        folders = {folder: self.folder_entry(folder, pokemon) for folder in POKEMON_FOLDERS if folder in self.available}
+        if TRAINER_FOLDER in self.available:
+            types = unique(trainer['Type'] for trainer in trainers or [] if trainer.get('Type'))
+            folders[TRAINER_FOLDER] = self.folder_entry(TRAINER_FOLDER, [(name, [name]) for name in types])
+        return {'Folders': folders}
+
+    def process_multiple_games(self, game_names, base_dir='games'):
+        for game_name in game_names:
+            data_dir = os.path.join(base_dir, game_name, 'data')
+            with open(os.path.join(data_dir, 'pokemon_master_evo.json'), 'r', encoding='utf-8') as file:
+                pokedex_data = json.load(file)
+            trainers = None
+            trainers_path = os.path.join(data_dir, 'trainers.json')
+            if os.path.exists(trainers_path):
+                with open(trainers_path, 'r', encoding='utf-8') as file:
+                    trainers = json.load(file)
+            manifest = self.build_manifest(os.path.join(base_dir, game_name, 'images'), pokedex_data, trainers)
+            with open(os.path.join(data_dir, 'sprite_manifest.json'), 'w') as file:
+                json.dump(manifest, file, indent=4)
+            print(f"Sprite manifest written for game: {game_name}")
+
+if __name__ == '__main__':
+    SpriteManifestBuilder().process_multiple_games(['ss2'])
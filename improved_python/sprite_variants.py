@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from build_manifest import BuildManifest
+
+try:
+    from PIL import Image, features
+except ImportError:  # optional, the sprite variants stage is skipped without it
+    Image = features = None
+
+# Sprite folders transcoded for the site, the widths thumbnails are scaled down to,
+# and the encoder settings of each output format. The sprites are pixel art: lossy
+# AVIF came out two to four times larger than lossless WebP on them, so it is left out
+VARIANT_FOLDERS = ['Front', 'Back', 'Front shiny', 'Back shiny', 'Trainers', 'Items']
+VARIANT_WIDTHS = [32, 48, 64]
+VARIANT_DIR = 'variants'
+FORMATS = {
+    'webp': {'lossless': True, 'method': 6},
+}
+
+def available_formats():
+    """The output formats this Pillow build can encode, in order of preference."""
+    return [name for name in FORMATS if features.check(name)]
+
+def variant_path(folder, stem, width, extension):
+    """Path of one variant relative to images/; the site builds the same names."""
+    return f'{VARIANT_DIR}/{folder}/{stem}-{width}.{extension}'
+
+def variant_widths(width):
+    return [target for target in VARIANT_WIDTHS if target < width] + [width]
+
+def transcode(source_path, output_base, formats):
+    """Write every width and format of one sprite; return its (width, height)."""
+    with Image.open(source_path) as sprite:
+        sprite = sprite.convert('RGBA')
+        for width in variant_widths(sprite.width):
+            if width == sprite.width:
+                scaled = sprite
+            else:
+                height = max(1, round(sprite.height * width / sprite.width))
+                # Nearest-neighbour keeps the palette, so thumbnails stay crisp and compress well
+                scaled = sprite.resize((width, height), Image.NEAREST)
+            for extension in formats:
+                scaled.save(f'{output_base}-{width}.{extension}', **FORMATS[extension])
+        return sprite.size
+
+class SpriteTranscoder:
+    """Transcodes a game's sprite folders into smaller WebP variants.
+
+    Every PNG gets a variant at each of VARIANT_WIDTHS narrower than itself
+    plus one at full size, in every format Pillow can encode. The variants
+    manifest the site reads maps each folder and file stem to its widths;
+    the sources record keeps each sprite's hash for the next build, which
+    only encodes sprites whose hash or the encoder settings changed or whose
+    files went missing.
+    """
+
+    def __init__(self, jobs=None):
+        if Image is None:
+            raise ImportError("Pillow is required to transcode sprites")
+        self.jobs = jobs
+        self.formats = available_formats()
+        self.settings = {'Formats': self.formats, 'Widths': VARIANT_WIDTHS,
+                         'Encoders': {name: FORMATS[name] for name in self.formats}}
+
+    def _reusable(self, images_dir, folder, stem, digest, previous):
+        if previous.get('Settings') != self.settings:
+            return None
+        old = previous.get('Sources', {}).get(folder, {}).get(stem)
+        if not old or old['Hash'] != digest:
+            return None
+        files_exist = all(os.path.exists(os.path.join(images_dir, variant_path(folder, stem, width, extension)))
+                          for width in old['Widths'] for extension in self.formats)
+        return old if files_exist else None
+
+    def build_variants(self, images_dir, previous=None, folders=VARIANT_FOLDERS):
+        """Encode the new or changed sprites under images_dir.
+
+        Returns the variants manifest and the sources record; previous is the
+        sources record of the last build.
+        """
+        previous = previous or {}
+        sources = {'Settings': self.settings, 'Sources': {}}
+        jobs = []
+        for folder in folders:
+            folder_path = os.path.join(images_dir, folder)
+            if not os.path.isdir(folder_path):
+                continue
+            entries = sources['Sources'][folder] = {}
+            os.makedirs(os.path.join(images_dir, VARIANT_DIR, folder), exist_ok=True)
+            for file_name in sorted(os.listdir(folder_path)):
+                if not file_name.lower().endswith('.png'):
+                    continue
+                stem = os.path.splitext(file_name)[0]
+                source_path = os.path.join(folder_path, file_name)
+                with open(source_path, 'rb') as file:
+                    digest = hashlib.sha256(file.read()).hexdigest()
+                entries[stem] = self._reusable(images_dir, folder, stem, digest, previous) or {'Hash': digest}
+                if 'Widths' not in entries[stem]:
+                    jobs.append((folder, stem, source_path))
+
+        if jobs:
+            with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+                sizes = pool.map(transcode,
+                                 [source_path for _, _, source_path in jobs],
+                                 [os.path.join(images_dir, VARIANT_DIR, folder, stem) for folder, stem, _ in jobs],
+                                 [self.formats] * len(jobs), chunksize=16)
+                for (folder, stem, _), (width, _) in zip(jobs, sizes):
+                    sources['Sources'][folder][stem]['Widths'] = variant_widths(width)
+
+        self.remove_stale(images_dir, sources)
+        manifest = {'Formats': self.formats, 'Folders': {
+            folder: {stem: entry['Widths'] for stem, entry in entries.items()}
+            for folder, entries in sources['Sources'].items()
+        }}
+        return manifest, sources
+
+    def remove_stale(self, images_dir, sources):
+        """Delete variant files no source accounts for, such as those of removed sprites."""
+        variants_dir = os.path.join(images_dir, VARIANT_DIR)
+        if not os.path.isdir(variants_dir):
+            return
+        expected = {
+            os.path.normpath(os.path.join(images_dir, variant_path(folder, stem, width, extension)))
+            for folder, entries in sources['Sources'].items()
+            for stem, entry in entries.items()
+            for width in entry['Widths'] for extension in self.formats
+        }
+        for folder in os.listdir(variants_dir):
+            folder_path = os.path.join(variants_dir, folder)
+            for file_name in os.listdir(folder_path):
+                if os.path.normpath(os.path.join(folder_path, file_name)) not in expected:
+                    os.remove(os.path.join(folder_path, file_name))
+            if not os.listdir(folder_path):
+                os.rmdir(folder_path)
+
+    def process_multiple_games(self, game_names, base_dir='games'):
+        for game_name in game_names:
+            # The sources record is build state, so it lives in the build manifest rather than data/
+            build_manifest = BuildManifest(base_dir, game_name)
+            previous = build_manifest.state.get('sprite_variant_sources')
+            manifest, sources = self.build_variants(os.path.join(base_dir, game_name, 'images'), previous)
+            with open(os.path.join(base_dir, game_name, 'data', 'sprite_variants.json'), 'w') as file:
+                json.dump(manifest, file, indent=4)
+            build_manifest.state['sprite_variant_sources'] = sources
+            build_manifest.save()
+            print(f"Sprite variants written for game: {game_name}")
+
+if __name__ == '__main__':
+    SpriteTranscoder().process_multiple_games(['ss2'])
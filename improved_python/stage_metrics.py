@@ -0,0 +1,154 @@
+import cProfile
+import json
+import os
+import time
+import tracemalloc
+
+REPORT_FILE = 'build_report.json'
+
+class CallMetrics:
+    """Context manager measuring one stage call.
+
+    Wall and CPU time are always recorded. The tracemalloc peak is only
+    measured with trace_memory=True since tracing slows the call down, and a
+    cProfile dump is written to profile_path when one is given.
+    """
+
+    def __init__(self, trace_memory=False, profile_path=None):
+        self.trace_memory = trace_memory
+        self.profile_path = profile_path
+        self.wall_seconds = None
+        self.cpu_seconds = None
+        self.peak_bytes = None
+
+    def __enter__(self):
+        self._started_tracing = False
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._started_tracing = True
+            self._traced_before = tracemalloc.get_traced_memory()[0]
+        self._profiler = cProfile.Profile() if self.profile_path else None
+        if self._profiler:
+            self._profiler.enable()
+        self._wall_started = time.perf_counter()
+        self._cpu_started = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.wall_seconds = time.perf_counter() - self._wall_started
+        self.cpu_seconds = time.process_time() - self._cpu_started
+        if self._profiler:
+            self._profiler.disable()
+            os.makedirs(os.path.dirname(self.profile_path) or '.', exist_ok=True)
+            self._profiler.dump_stats(self.profile_path)
+        if self.trace_memory:
+            self.peak_bytes = tracemalloc.get_traced_memory()[1] - self._traced_before
+            if self._started_tracing:
+                tracemalloc.stop()
+        return False
+
+    def as_dict(self):
+        return {
+            'wall_seconds': round(self.wall_seconds, 6),
+            'cpu_seconds': round(self.cpu_seconds, 6),
+            'peak_bytes': self.peak_bytes,
+        }
+
+# Where the records of artifacts built as a dict are, as key paths in which '*'
+# stands for every value of a mapping; other artifacts are counted at their top level
+RECORD_PATHS = {
+    'move_learners': [('Moves',)],
+    'ability_holders': [('Abilities',)],
+    'search_index': [('Documents',)],
+    'type_chart': [('Types',)],
+    'type_matchups': [('Profiles',)],
+    'sprite_atlas': [('*', 'Sprites')],
+    'sprite_variants': [('Folders', '*')],
+    'sprite_manifest': [('Folders', '*', 'Redirects'), ('Folders', '*', 'Missing')],
+}
+
+def _count_at(data, path):
+    if not path:
+        return len(data) if isinstance(data, (list, dict)) else 0
+    if not isinstance(data, dict):
+        return 0
+    if path[0] == '*':
+        return sum(_count_at(value, path[1:]) for value in data.values())
+    return _count_at(data.get(path[0]), path[1:])
+
+def count_records(data, artifact=None):
+    """Number of records in an artifact: list items or mapping keys, or the entries under its RECORD_PATHS."""
+    if artifact in RECORD_PATHS and isinstance(data, dict):
+        return sum(_count_at(data, path) for path in RECORD_PATHS[artifact])
+    return len(data) if isinstance(data, (list, dict)) else None
+
+def file_size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+class RunReport:
+    """Collects the metrics of every stage call in a build and writes them out as JSON.
+
+    A stage's bytes_written are the sizes of the files emitted for the
+    artifacts it produced; the emit call itself counts every file it wrote.
+    """
+
+    def __init__(self, **settings):
+        self.settings = settings
+        self.started = time.time()
+        self._wall_started = time.perf_counter()
+        self.calls = []
+
+    def add(self, game, stage, status, metrics=None, bytes_read=0, bytes_written=0, records=None):
+        call = {'game': game, 'stage': stage, 'status': status}
+        call.update(metrics or {'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_bytes': None})
+        call.update({'bytes_read': bytes_read, 'bytes_written': bytes_written, 'records': records or {}})
+        self.calls.append(call)
+        return call
+
+    def add_bytes_written(self, game, stage, bytes_written):
+        """Add emitted bytes to the latest call of a game's stage."""
+        for call in reversed(self.calls):
+            if call['game'] == game and call['stage'] == stage:
+                call['bytes_written'] += bytes_written
+                return
+
+    def stage_totals(self):
+        """Sum the calls of each stage across games; peaks are the largest single call."""
+        totals = {}
+        for call in self.calls:
+            total = totals.setdefault(call['stage'], {
+                'calls': 0, 'built': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_bytes': None,
+                'bytes_read': 0, 'bytes_written': 0, 'records': 0,
+            })
+            total['calls'] += 1
+            total['built'] += call['status'] == 'built'
+            for key in ('wall_seconds', 'cpu_seconds', 'bytes_read', 'bytes_written'):
+                total[key] += call[key]
+            total['records'] += sum(count for count in call['records'].values() if count)
+            if call['peak_bytes'] is not None:
+                total['peak_bytes'] = max(total['peak_bytes'] or 0, call['peak_bytes'])
+        return totals
+
+    def as_dict(self):
+        return {
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+            'wall_seconds': round(time.perf_counter() - self._wall_started, 6),
+            'settings': self.settings,
+            'stages': self.stage_totals(),
+            'calls': self.calls,
+        }
+
+    def save(self, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.as_dict(), file, indent=4)
+
+    def print_summary(self, limit=5):
+        """Print the stages that took the most wall time."""
+        totals = sorted(self.stage_totals().items(), key=lambda item: item[1]['wall_seconds'], reverse=True)
+        print("Slowest stages:")
+        for stage, total in totals[:limit]:
+            peak = f", peak {total['peak_bytes'] / 1e6:.1f} MB" if total['peak_bytes'] is not None else ''
+            print(f"  {stage}: {total['wall_seconds']:.3f}s wall, {total['cpu_seconds']:.3f}s CPU{peak}")
@@ -0,0 +1,196 @@
+import os
+import random
+
+# Section counts of games/ss2/data, the 1x size of the synthetic corpus
+SS2_SECTION_COUNTS = {
+    'pokemon.txt': 1177,
+    'pokemon_forms.txt': 321,
+    'moves.txt': 1306,
+    'abilities.txt': 362,
+    'encounters.txt': 261,
+    'trainers.txt': 1520,
+    'types.txt': 22,
+}
+
+SEPARATOR = '#-------------------------------'
+PREAMBLE = ['# See the documentation on the wiki to learn how to edit this file.', SEPARATOR]
+STAT_NAMES = ['HP', 'ATTACK', 'DEFENSE', 'SPEED', 'SPECIAL_ATTACK', 'SPECIAL_DEFENSE']
+MOVE_FLAGS = ['Contact', 'CanProtect', 'CanMirrorMove', 'Sound', 'Punching', 'Biting', 'Slicing']
+FORM_NAMES = ['Mega {}', 'Alolan {}', 'Galarian {}', 'Hisuian {}', 'Primal {}']
+ENCOUNTER_METHODS = [('LandMorning', 4), ('LandDay', 4), ('LandNight', 4), ('Cave', 1), ('Water', 4),
+                     ('OldRod', None), ('GoodRod', None), ('SuperRod', None), ('RockSmash', 50)]
+WORDS = ['strikes', 'the', 'target', 'with', 'a', 'burst', 'of', 'energy', 'that', 'may', 'lower',
+         'its', 'defense', 'and', 'leaves', 'user', 'tired', 'after', 'battle', 'storm', 'glowing']
+
+class SyntheticCorpus:
+    """Deterministic generator of a valid PBS data directory at a multiple of the ss2 size.
+
+    Names and cross references (types, moves, abilities, evolutions, forms,
+    encounters and trainer teams) are consistent, so the whole pipeline can
+    run on the output. The same scale and seed always produce the same files.
+    """
+
+    def __init__(self, scale=1, seed=0):
+        self.scale = scale
+        self.seed = seed
+        self.counts = {name: max(1, round(count * scale)) for name, count in SS2_SECTION_COUNTS.items()}
+        self.types = [f'TYPE{i:03d}' for i in range(self.counts['types.txt'])]
+        self.species = [f'SPECIES{i:05d}' for i in range(self.counts['pokemon.txt'])]
+        self.moves = [f'MOVE{i:05d}' for i in range(self.counts['moves.txt'])]
+        self.abilities = [f'ABILITY{i:04d}' for i in range(self.counts['abilities.txt'])]
+
+    def _random(self, file_name):
+        return random.Random(f'{self.seed}:{self.scale}:{file_name}')
+
+    def _sentence(self, rng, length):
+        return ' '.join(rng.choice(WORDS) for _ in range(length)).capitalize() + '.'
+
+    def pokemon_lines(self):
+        rng = self._random('pokemon.txt')
+        yield from PREAMBLE
+        for index, species in enumerate(self.species):
+            # Species come in chains of three, the last of each chain is fully evolved
+            evolves = index % 3 != 2 and index + 1 < len(self.species)
+            level_moves = sorted(rng.randint(1, 60) for _ in range(rng.randint(12, 24)))
+            yield f'[{species}]'
+            yield f'Name = {species.capitalize()}'
+            yield f"Types = {','.join(rng.sample(self.types, min(2, len(self.types))))}"
+            yield f"BaseStats = {','.join(str(rng.randint(20, 160)) for _ in STAT_NAMES)}"
+            yield 'GenderRatio = Female50Percent'
+            yield 'GrowthRate = Medium'
+            yield f'BaseExp = {rng.randint(40, 300)}'
+            yield f'EVs = {rng.choice(STAT_NAMES)},{rng.randint(1, 3)}'
+            yield f'CatchRate = {rng.randint(3, 255)}'
+            yield 'Happiness = 70'
+            yield f"Abilities = {','.join(rng.sample(self.abilities, min(2, len(self.abilities))))}"
+            yield f'HiddenAbilities = {rng.choice(self.abilities)}'
+            yield f"Moves = {','.join(f'{level},{rng.choice(self.moves)}' for level in level_moves)}"
+            yield f"TutorMoves = {', '.join(rng.sample(self.moves, min(60, len(self.moves))))}"
+            yield f"EggMoves = {','.join(rng.sample(self.moves, min(8, len(self.moves))))}"
+            yield 'EggGroups = Field'
+            yield f'HatchSteps = {rng.randint(1000, 10000)}'
+            yield f'Height = {rng.randint(1, 50) / 10}'
+            yield f'Weight = {rng.randint(1, 5000) / 10}'
+            yield 'Color = Red'
+            yield 'Shape = Head'
+            yield f'Category = {self._sentence(rng, 2)[:-1]}'
+            yield f'Pokedex = {self._sentence(rng, 24)}'
+            yield f'Generation = {rng.randint(1, 9)}'
+            if evolves:
+                yield f'Evolutions = {self.species[index + 1]},Level,{rng.randint(10, 50)}'
+            yield SEPARATOR
+
+    def forms_lines(self):
+        rng = self._random('pokemon_forms.txt')
+        yield from PREAMBLE
+        form_numbers = {}
+        for _ in range(self.counts['pokemon_forms.txt']):
+            species = rng.choice(self.species)
+            form_numbers[species] = form_numbers.get(species, 0) + 1
+            yield f'[{species},{form_numbers[species]}]'
+            yield f'FormName = {rng.choice(FORM_NAMES).format(species.capitalize())}'
+            yield f"Types = {','.join(rng.sample(self.types, min(2, len(self.types))))}"
+            yield f"BaseStats = {','.join(str(rng.randint(20, 180)) for _ in STAT_NAMES)}"
+            yield f'Abilities = {rng.choice(self.abilities)}'
+            yield f'HiddenAbilities = {rng.choice(self.abilities)}'
+            yield f'Height = {rng.randint(1, 50) / 10}'
+            yield f'Weight = {rng.randint(1, 5000) / 10}'
+            yield SEPARATOR
+
+    def moves_lines(self):
+        rng = self._random('moves.txt')
+        yield from PREAMBLE
+        for move in self.moves:
+            yield f'[{move}]'
+            yield f'Name = {move.capitalize()}'
+            yield f'Type = {rng.choice(self.types)}'
+            yield f"Category = {rng.choice(['Physical', 'Special', 'Status'])}"
+            yield f'Power = {rng.choice([0, 40, 60, 80, 90, 120])}'
+            yield f'Accuracy = {rng.choice([0, 70, 85, 100])}'
+            yield f'TotalPP = {rng.choice([5, 10, 15, 20, 35])}'
+            yield 'Target = NearOther'
+            yield 'FunctionCode = None'
+            yield f"Flags = {','.join(rng.sample(MOVE_FLAGS, rng.randint(1, 3)))}"
+            if rng.random() < 0.3:
+                yield f'EffectChance = {rng.choice([10, 20, 30])}'
+            yield f'Description = {self._sentence(rng, 16)}'
+            yield SEPARATOR
+
+    def abilities_lines(self):
+        rng = self._random('abilities.txt')
+        yield from PREAMBLE
+        for ability in self.abilities:
+            yield f'[{ability}]'
+            yield f'Name = {ability.capitalize()}'
+            yield f'Description = {self._sentence(rng, 10)}'
+            yield SEPARATOR
+
+    def encounters_lines(self):
+        rng = self._random('encounters.txt')
+        yield from PREAMBLE
+        for map_id in range(self.counts['encounters.txt']):
+            yield f'[{map_id:03d}] # Map {map_id}'
+            for method, density in rng.sample(ENCOUNTER_METHODS, rng.randint(2, 5)):
+                yield method if density is None else f'{method},{density}'
+                for _ in range(5):
+                    level = rng.randint(2, 70)
+                    yield f'    20,{rng.choice(self.species)},{level},{level + rng.randint(0, 3)}'
+            yield SEPARATOR
+
+    def trainers_lines(self):
+        rng = self._random('trainers.txt')
+        yield from PREAMBLE
+        for index in range(self.counts['trainers.txt']):
+            yield f'[TRAINERTYPE{index % 40:02d},Trainer{index},0]'
+            yield f'LoseText = {self._sentence(rng, 4)}'
+            for _ in range(rng.randint(1, 6)):
+                yield f'Pokemon = {rng.choice(self.species)},{rng.randint(5, 70)}'
+                yield f"    Moves = {','.join(rng.sample(self.moves, min(4, len(self.moves))))}"
+                yield f'    Item = ITEM{rng.randint(0, 500):03d}'
+                yield '    IV = 20,20,20,20,20,20'
+            yield SEPARATOR
+
+    def types_lines(self):
+        rng = self._random('types.txt')
+        yield from PREAMBLE
+        for index, type_name in enumerate(self.types):
+            yield f'[{type_name}]'
+            yield f'Name = {type_name.capitalize()}'
+            yield f'IconPosition = {index}'
+            yield f"Weaknesses = {','.join(rng.sample(self.types, min(3, len(self.types))))}"
+            yield f"Resistances = {','.join(rng.sample(self.types, min(2, len(self.types))))}"
+            if rng.random() < 0.2:
+                yield f'Immunities = {rng.choice(self.types)}'
+            yield SEPARATOR
+
+    def files(self):
+        return {
+            'pokemon.txt': self.pokemon_lines,
+            'pokemon_forms.txt': self.forms_lines,
+            'moves.txt': self.moves_lines,
+            'abilities.txt': self.abilities_lines,
+            'encounters.txt': self.encounters_lines,
+            'trainers.txt': self.trainers_lines,
+            'types.txt': self.types_lines,
+        }
+
+    def write_game(self, base_dir, game_name):
+        """Write every PBS file into base_dir/game_name/data and return that directory."""
+        data_dir = os.path.join(base_dir, game_name, 'data')
+        os.makedirs(data_dir, exist_ok=True)
+        for file_name, lines in self.files().items():
+            with open(os.path.join(data_dir, file_name), 'w', encoding='utf-8', newline='\r\n') as file:
+                for line in lines():
+                    file.write(line + '\n')
+        return data_dir
+
+if __name__ == '__main__':
+    import argparse
+
+    arg_parser = argparse.ArgumentParser(description="Write a synthetic PBS corpus scaled from the ss2 data.")
+    arg_parser.add_argument('--scale', type=float, default=1, help="multiple of the ss2 section counts")
+    arg_parser.add_argument('--seed', type=int, default=0)
+    arg_parser.add_argument('--base-dir', default='synthetic_games')
+    arg_parser.add_argument('--game', default='synthetic')
+    args = arg_parser.parse_args()
+    print(f"Wrote {SyntheticCorpus(args.scale, args.seed).write_game(args.base_dir, args.game)}")
@@ -1,58 +1,51 @@
 import os
 import json
 import re
+from pbs_tokenizer import iter_raw_sections
 
 class TrainersParser:
     def __init__(self):
         pass
 
-    def convert_txt_to_json(self, input_file, output_file):
-        """Convert trainer data from TXT to JSON format."""
-        with open(input_file, 'r', encoding='utf-8') as file:
-            content = file.read()
-        
-        sections = content.strip().split('#-------------------------------')
-        
+    def load_trainers(self, input_file):
+        """Parse trainer data from a TXT file into a list."""
         trainers_list = []
         
-        for section in sections:
-            if not section.strip():
-                continue
-            
-            trainer_data = self._parse_trainer_section(section.strip())
+        for header, lines in iter_raw_sections(input_file):
+            trainer_data = self._parse_trainer_section(header, lines)
             if trainer_data:
                 trainers_list.append(trainer_data)
         
+        return trainers_list
+
+    def convert_txt_to_json(self, input_file, output_file):
+        """Convert trainer data from TXT to JSON format."""
+        trainers_list = self.load_trainers(input_file)
+        
         with open(output_file, 'w', encoding='utf-8') as json_file:
             json.dump(trainers_list, json_file, indent=4, ensure_ascii=False)
 
-    def _parse_trainer_section(self, section):
+    def _parse_trainer_section(self, header, lines):
         """Parse a single trainer section."""
-        lines = section.split('\n')
         trainer = {}
         pokemon_list = []
         current_pokemon = None
         
-        for line in lines:
-            line = line.rstrip()
-            if not line:
-                continue
+        if header.endswith(']'):
+            content = header[1:-1]  # remove [ and ]
+            parts = [p.strip() for p in content.split(',')]
             
-            if line.startswith('[') and line.endswith(']'):
-                content = line[1:-1]  # remove [ and ]
-                parts = [p.strip() for p in content.split(',')]
+            if len(parts) >= 2:
+                trainer['Type'] = parts[0]
+                trainer['Name'] = parts[1]
                 
-                if len(parts) >= 2:
-                    trainer['Type'] = parts[0]
-                    trainer['Name'] = parts[1]
-                    
-                    if len(parts) >= 3:
-                        try:
-                            trainer['Number'] = int(parts[2])
-                        except ValueError:
-                            pass  # ignore if it's not a number
-                continue
-            
+                if len(parts) >= 3:
+                    try:
+                        trainer['Number'] = int(parts[2])
+                    except ValueError:
+                        pass  # ignore if it's not a number
+        
+        for line in lines:
             if line.startswith('Pokemon = '):
                 # Save previous pokemon if exists
                 if current_pokemon:
@@ -0,0 +1,96 @@
+import json
+import os
+from species_refs import split_field
+
+try:
+    import numpy as np
+except ImportError:  # optional, the type chart stage is skipped without it
+    np = None
+
+# Multiplier each types.json list applies to the attacking types it names
+DEFENDER_FACTORS = [('Weaknesses', 2.0), ('Resistances', 0.5), ('Immunities', 0.0)]
+
+class TypeChart:
+    """Dense attacker×defender multiplier matrix compiled from types.json.
+
+    Types are indexed in types.json order, so matrix[index[attacker], index[defender]]
+    is the multiplier of one attacking type against one defending type. Missing
+    or unknown defending types count as neutral, which lets single types, dual
+    types and whole batches of type pairs share the same vectorized lookups.
+    """
+
+    def __init__(self, types, matrix):
+        if np is None:
+            raise ImportError("NumPy is required for the type chart")
+        self.types = list(types)
+        self.index = {name: position for position, name in enumerate(self.types)}
+        self.matrix = np.asarray(matrix, dtype=float)
+        # The extra all-ones column stands in for a missing or unknown defending type
+        self._columns = np.hstack([self.matrix, np.ones((len(self.types), 1))])
+
+    @classmethod
+    def from_types(cls, types_list):
+        """Compile the parsed types.json list; a type listed twice for a defender multiplies twice."""
+        entries = [entry for entry in types_list if entry.get('Name')]
+        names = [entry['Name'].strip().upper() for entry in entries]
+        index = {name: position for position, name in enumerate(names)}
+        matrix = np.ones((len(names), len(names)))
+        for defender, entry in enumerate(entries):
+            for key, factor in DEFENDER_FACTORS:
+                for attacker in split_field(entry.get(key)):
+                    if attacker in index:
+                        matrix[index[attacker], defender] *= factor
+        return cls(names, matrix)
+
+    @classmethod
+    def from_artifact(cls, artifact):
+        return cls(artifact['Types'], artifact['Matrix'])
+
+    def to_artifact(self):
+        """Type names and matrix rows (one per attacking type) as plain JSON numbers."""
+        rows = [[int(value) if value.is_integer() else value for value in row] for row in self.matrix.tolist()]
+        return {'Types': self.types, 'Matrix': rows}
+
+    def _column(self, type_name):
+        return self.index.get(str(type_name).strip().upper(), len(self.types)) if type_name else len(self.types)
+
+    def effectiveness(self, attacker, type1, type2=None):
+        """Multiplier of one attacking type against a single or dual-typed defender."""
+        if attacker not in self.index:
+            return 1.0
+        row = self._columns[self.index[attacker]]
+        return float(row[self._column(type1)] * row[self._column(type2)])
+
+    def defending(self, type1, type2=None):
+        """Multipliers of every attacking type against a single or dual-typed defender."""
+        return self._columns[:, self._column(type1)] * self._columns[:, self._column(type2)]
+
+    def defending_pairs(self, pairs):
+        """Multipliers for a batch of (type1, type2) defenders, one row per pair."""
+        first = np.fromiter((self._column(pair[0]) for pair in pairs), dtype=np.intp, count=len(pairs))
+        second = np.fromiter((self._column(pair[1] if len(pair) > 1 else None) for pair in pairs),
+                             dtype=np.intp, count=len(pairs))
+        return (self._columns[:, first] * self._columns[:, second]).T
+
+    def coverage(self, attackers):
+        """Best multiplier any of the attacking types reaches against each single defending type."""
+        rows = [self.index[attacker] for attacker in attackers if attacker in self.index]
+        if not rows:
+            return np.ones(len(self.types))
+        return self.matrix[rows].max(axis=0)
+
+def compile_games(game_names, base_dir='games'):
+    for game_name in game_names:
+        data_dir = os.path.join(base_dir, game_name, 'data')
+        types_path = os.path.join(data_dir, 'types.json')
+        if not os.path.exists(types_path):
+            print(f"Types file not found for game: {game_name}")
+            continue
+        with open(types_path, 'r') as file:
+            chart = TypeChart.from_types(json.load(file))
+        with open(os.path.join(data_dir, 'type_chart.json'), 'w') as file:
+            json.dump(chart.to_artifact(), file, indent=4)
+        print(f"Type chart of {len(chart.types)} types written for game: {game_name}")
+
+if __name__ == '__main__':
+    compile_games(['ss2'])
@@ -0,0 +1,105 @@
+import json
+import os
+from record_fingerprints import normalize_name
+from species_refs import split_field
+from type_chart import TypeChart, np
+
+# Defensive multipliers abilities apply to attacking types, keyed by normalized ability name
+ABILITY_MODIFIERS = {
+    'levitate': {'GROUND': 0.0},
+    'eartheater': {'GROUND': 0.0},
+    'flashfire': {'FIRE': 0.0},
+    'wellbakedbody': {'FIRE': 0.0},
+    'waterabsorb': {'WATER': 0.0},
+    'stormdrain': {'WATER': 0.0},
+    'dryskin': {'WATER': 0.0, 'FIRE': 1.25},
+    'voltabsorb': {'ELECTRIC': 0.0},
+    'lightningrod': {'ELECTRIC': 0.0},
+    'motordrive': {'ELECTRIC': 0.0},
+    'sapsipper': {'GRASS': 0.0},
+    'thickfat': {'FIRE': 0.5, 'ICE': 0.5},
+    'heatproof': {'FIRE': 0.5},
+    'waterbubble': {'FIRE': 0.5},
+    'purifyingsalt': {'GHOST': 0.5},
+}
+
+def plain_numbers(vector):
+    return [int(value) if value.is_integer() else value for value in vector.tolist()]
+
+class MatchupProfiler:
+    """Computes the defensive multiplier vector of every species and form in one pass.
+
+    Profiles list the multiplier of each attacking type in the chart's order.
+    When abilities.json is given, each Pokémon also gets a profile for every
+    ability it can have that changes its matchups (Levitate, Flash Fire and so
+    on); abilities missing from the game's abilities.json are never applied.
+    """
+
+    def __init__(self, chart: TypeChart, abilities=None):
+        self.chart = chart
+        self.ability_vectors = {}
+        if abilities is not None:
+            known = {normalize_name(ability['Name']) for ability in abilities if ability.get('Name')}
+            for name, factors in ABILITY_MODIFIERS.items():
+                if name not in known:
+                    continue
+                vector = np.ones(len(chart.types))
+                for type_name, factor in factors.items():
+                    if type_name in chart.index:
+                        vector[chart.index[type_name]] = factor
+                self.ability_vectors[name] = vector
+
+    def defenders(self, pokedex_data):
+        """Yield (InternalName, (type1, type2), abilities) for every species and form.
+
+        A form with its own Types has exactly those types; otherwise it keeps
+        its base species' types. Each ability slot a form leaves empty has the
+        base species' abilities; forms always inherit Abilities from
+        pokemon.txt but not HiddenAbilities.
+        """
+        for pokemon in pokedex_data:
+            types = (pokemon.get('Type1'), pokemon.get('Type2'))
+            regular = split_field(pokemon.get('Abilities'))
+            hidden = split_field(pokemon.get('HiddenAbilities'))
+            yield pokemon['InternalName'], types, regular + hidden
+            for form in pokemon.get('Forms', []):
+                form_types = (form.get('Type1'), form.get('Type2')) if form.get('Type1') else types
+                form_regular = split_field(form.get('Abilities')) or regular
+                form_hidden = split_field(form.get('HiddenAbilities')) or hidden
+                yield form['InternalName'], form_types, form_regular + form_hidden
+
+    def build_profiles(self, pokedex_data):
+        defenders = list(self.defenders(pokedex_data))
+        matrix = self.chart.defending_pairs([types for _, types, _ in defenders])
+        profiles = {}
+        ability_profiles = {}
+        for (internal_name, _, abilities), profile in zip(defenders, matrix):
+            # A repeated InternalName keeps its first record, as everywhere else in the pipeline
+            if internal_name in profiles:
+                continue
+            profiles[internal_name] = plain_numbers(profile)
+            for ability in abilities:
+                vector = self.ability_vectors.get(normalize_name(ability))
+                if vector is not None:
+                    ability_profiles.setdefault(internal_name, {})[ability] = plain_numbers(profile * vector)
+        return {'Types': self.chart.types, 'Profiles': profiles, 'AbilityProfiles': ability_profiles}
+
+def process_multiple_games(game_names, base_dir='games'):
+    for game_name in game_names:
+        data_dir = os.path.join(base_dir, game_name, 'data')
+        paths = {name: os.path.join(data_dir, f'{name}.json') for name in ['type_chart', 'pokemon_master_evo', 'abilities']}
+        if not os.path.exists(paths['type_chart']) or not os.path.exists(paths['pokemon_master_evo']):
+            print(f"Type chart or evolution Pokémon file not found for game: {game_name}")
+            continue
+        loaded = {}
+        for name, path in paths.items():
+            if os.path.exists(path):
+                with open(path, 'r') as file:
+                    loaded[name] = json.load(file)
+        profiler = MatchupProfiler(TypeChart.from_artifact(loaded['type_chart']), loaded.get('abilities'))
+        with open(os.path.join(data_dir, 'type_matchups.json'), 'w') as file:
+            json.dump(profiler.build_profiles(loaded['pokemon_master_evo']), file, indent=4)
+        print(f"Type matchups written for game: {game_name}")
+
+if __name__ == '__main__':
+    process_multiple_games(['ss2'])
@@ -1,50 +1,45 @@
 import json
+from pbs_tokenizer import iter_sections
 
 class TypesParser:
-    def parse_types(self, input_file, output_file):
-        """Parse types from a text file and save to a JSON file."""
-        with open(input_file, 'r') as file:
-            data = file.read().strip().split('#-------------------------------')
-
+    def load_types(self, input_file):
+        """Parse types from a text file into a list."""
         types_list = []
 
-        for entry in data:
-            if not entry.strip():
-                continue
-
+        for _, entries in iter_sections(input_file):
             type_data = {}
-            lines = entry.strip().split('\n')
-
-            for line in lines:
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
 
-                    if key in ['TypeID', 'Effectiveness']:
-                        value = int(value)
-                        type_data[key] = value
-                    elif key == 'Weaknesses':
-                        value = value.split(',')
-                        type_data[key] = value
-                        value = [v.strip() for v in value if v.strip()]
-                    elif key == 'Resistances':
-                        value = value.split(',')
-                        type_data[key] = value
-                        value = [v.strip() for v in value if v.strip()]
-                    elif key == 'Immunities':   
-                        value = value.split(',')
-                        type_data[key] = value
-                        value = [v.strip() for v in value if v.strip()]
-                    elif key == 'Name':
-                        value = value.upper()
-                        type_data[key] = value
-                    elif key == 'IconPosition':
-                        pass
+            for key, value in entries:
+                if key in ['TypeID', 'Effectiveness']:
+                    value = int(value)
+                    type_data[key] = value
+                elif key == 'Weaknesses':
+                    value = value.split(',')
+                    type_data[key] = value
+                    value = [v.strip() for v in value if v.strip()]
+                elif key == 'Resistances':
+                    value = value.split(',')
+                    type_data[key] = value
+                    value = [v.strip() for v in value if v.strip()]
+                elif key == 'Immunities':   
+                    value = value.split(',')
+                    type_data[key] = value
+                    value = [v.strip() for v in value if v.strip()]
+                elif key == 'Name':
+                    value = value.upper()
+                    type_data[key] = value
+                elif key == 'IconPosition':
+                    pass
                     
 
             types_list.append(type_data)
 
+        return types_list
+
+    def parse_types(self, input_file, output_file):
+        """Parse types from a text file and save to a JSON file."""
+        types_list = self.load_types(input_file)
+
         # Write the types list to a JSON file
         with open(output_file, 'w') as json_file:
             json.dump(types_list, json_file, indent=4)
@@ -1,33 +1,44 @@
 import unittest
+import unittest.mock
+import contextlib
+import gzip
+import io
 import os
 import json
 import re
+import subprocess
+import sys
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 
+from ability_holders import AbilityHoldersIndexer
+import artifact_store
+from artifact_store import ArtifactStore
+from combine_pokemon import PokemonCombiner
 from encounters_to_json import EncountersParser
+from evos import Evolution
+from shard_pokemon import PokemonSharder
+import sprite_atlas
+import sprite_variants
+from sprite_manifest import SpriteManifestBuilder
+from parse_forms import FormsParser
+from pbs_tokenizer import iter_raw_sections, iter_sections
+import pokedexcel
+from moves_to_json import MovesParser
+from move_learners import MoveLearnersIndexer
+from record_fingerprints import verify_entry
+from search_index import SearchIndex, SearchIndexBuilder
+from synthetic_pbs import SyntheticCorpus
+import type_chart
 
 def parse_txt_file(file_path):
     pokemon_data = {}
-    with open(file_path, 'r') as file:
-        content = file.read()
-        entries = content.split('#-------------------------------')
-        for entry in entries:
-            lines = [line.strip() for line in entry.strip().splitlines() if line.strip()]
-            if not lines:
-                continue
-            # Detect header: either [NAME] or just NAME
-            if lines[0].startswith('[') and lines[0].endswith(']'):
-                internal_name = lines[0][1:-1].strip()
-                lines = lines[1:]
-            else:
-                internal_name = lines[0].strip()
-                lines = lines[1:]
-            entry_dict = {'InternalName': internal_name}
-            for line in lines:
-                if '=' in line:
-                    key, value = map(str.strip, line.split('=', 1))
-                    entry_dict[key] = value
-            pokemon_data[internal_name] = entry_dict
+    for header, entries in iter_sections(file_path):
+        internal_name = header[1:-1].strip()
+        entry_dict = {'InternalName': internal_name}
+        entry_dict.update(entries)
+        pokemon_data[internal_name] = entry_dict
     return pokemon_data
 
 def normalize_field(key, json_value, txt_value):
@@ -66,7 +77,9 @@ OPTIONAL_FIELDS = ["Forms"]
 def validate_and_compare(json_file, txt_file):
     with open(json_file, 'r') as f:
         json_data = json.load(f)
-    txt_data = parse_txt_file(txt_file)
+    return compare_pokemon_records(json_data, parse_txt_file(txt_file))
+
+def compare_pokemon_records(json_data, txt_data):
     errors = []
     for pokemon in json_data:
         internal_name = pokemon.get("InternalName")
@@ -155,31 +168,17 @@ def normalize_value(value, key=None):
 # load moves from a text file
 def load_moves_txt(file_path):
     moves_dict = {}
-    with open(file_path, 'r') as file:
-        data = file.read().strip().split('#-------------------------------')
-    for entry in data:
-        if not entry.strip():
-            continue
-        move_data = {}
-        lines = entry.strip().split('\n')
-        move_name = None
-        # detect header: either [NAME] or just NAME
-        for line in lines:
-            if '[' in line and ']' in line:
-                # Remove comments after the closing bracket
-                header = line[1:-1].split('#', 1)[0].strip()
-                move_name = normalize_name(header)
-                continue
-            if '=' in line and move_name:
-                key, value = line.split('=', 1)
-                move_data[key.strip()] = value.strip()
-        if move_name:
-            moves_dict[move_name] = move_data
+    for header, entries in iter_sections(file_path):
+        # Remove comments after the closing bracket
+        move_name = normalize_name(header[1:-1].split('#', 1)[0].strip())
+        moves_dict[move_name] = dict(entries)
     return moves_dict
 
 def load_moves_json(file_path):
     with open(file_path, 'r') as json_file:
-        moves = json.load(json_file)
+        return index_moves(json.load(json_file))
+
+def index_moves(moves):
     moves_dict = {}
     for move in moves:
         move_name = normalize_name(move.get('Name', ''))
@@ -206,28 +205,16 @@ def compare_moves(moves_txt, moves_json):
 
 def load_abilities_txt(file_path):
     abilities_dict = {}
-    with open(file_path, 'r') as file:
-        data = file.read().strip().split('#-------------------------------')
-    for entry in data:
-        if not entry.strip():
-            continue
-        ability_data = {}
-        lines = entry.strip().split('\n')
-        ability_name = None
-        for line in lines:
-            if '[' in line and ']' in line:
-                ability_name = normalize_name(line[1:-1].strip())
-                continue
-            if '=' in line and ability_name:
-                key, value = line.split('=', 1)
-                ability_data[key.strip()] = value.strip()
-        if ability_name:
-            abilities_dict[ability_name] = ability_data
+    for header, entries in iter_sections(file_path):
+        ability_name = normalize_name(header[1:-1].strip())
+        abilities_dict[ability_name] = dict(entries)
     return abilities_dict
 
 def load_abilities_json(file_path):
     with open(file_path, 'r') as json_file:
-        abilities = json.load(json_file)
+        return index_abilities(json.load(json_file))
+
+def index_abilities(abilities):
     abilities_dict = {}
     if isinstance(abilities, dict):
         for ability in abilities.values():
@@ -265,6 +252,323 @@ def get_game_names(base_dir='games'):
     return [name for name in os.listdir(base_dir)
             if os.path.isdir(os.path.join(base_dir, name))]
 
+class FixtureStore:
+    """Loads each game's PBS sources and built artifacts once for every check to share.
+
+    Artifacts come from an ArtifactStore, so a store handed over by the
+    pipeline serves its in-memory records instead of re-reading the JSON.
+    """
+    SOURCES = {'pokemon': parse_txt_file, 'moves': load_moves_txt, 'abilities': load_abilities_txt}
+
+    def __init__(self, base_dir='games', store=None):
+        self.base_dir = base_dir
+        self.store = store if store is not None else ArtifactStore(base_dir)
+        self._sources = {}
+
+    def source_path(self, game, name):
+        return os.path.join(self.base_dir, game, 'data', f'{name}.txt')
+
+    def source(self, game, name):
+        """Return a parsed PBS source, or None if the game doesn't have it."""
+        key = (game, name)
+        if key not in self._sources:
+            file_path = self.source_path(game, name)
+            self._sources[key] = self.SOURCES[name](file_path) if os.path.exists(file_path) else None
+        return self._sources[key]
+
+    def artifact(self, game, name):
+        return self.store.get(game, name)
+
+# Each check returns a list of errors, or None when the game lacks its inputs
+def check_pokemon(fixtures, game):
+    json_data = fixtures.artifact(game, 'pokemon_master')
+    txt_data = fixtures.source(game, 'pokemon')
+    if json_data is None or txt_data is None:
+        return None
+    return compare_pokemon_records(json_data, txt_data)
+
+def check_forms(fixtures, game):
+    json_data = fixtures.artifact(game, 'pokemon_master')
+    if json_data is None or not os.path.exists(fixtures.source_path(game, 'pokemon_forms')):
+        return None
+    return validate_forms(json_data, fixtures.source_path(game, 'pokemon_forms'))
+
+def check_moves(fixtures, game):
+    moves_json = fixtures.artifact(game, 'moves')
+    moves_txt = fixtures.source(game, 'moves')
+    if moves_json is None or moves_txt is None:
+        return None
+    return compare_moves(moves_txt, index_moves(moves_json))
+
+def check_abilities(fixtures, game):
+    abilities_json = fixtures.artifact(game, 'abilities')
+    abilities_txt = fixtures.source(game, 'abilities')
+    if abilities_json is None or abilities_txt is None:
+        return None
+    return compare_abilities(abilities_txt, index_abilities(abilities_json))
+
+DATA_CHECKS = {'pokemon': check_pokemon, 'forms': check_forms, 'moves': check_moves, 'abilities': check_abilities}
+
+def validate_game(fixtures, game):
+    """Run every data check for a game and return {check: (errors, seconds)}."""
+    results = {}
+    for name, check in DATA_CHECKS.items():
+        started = time.perf_counter()
+        errors = check(fixtures, game)
+        results[name] = (errors, time.perf_counter() - started)
+    return results
+
+def _validate_game_task(base_dir, game):
+    return validate_game(FixtureStore(base_dir), game)
+
+def validate_games(games, base_dir='games', jobs=1, store=None):
+    """Validate several games, one worker process per game when jobs > 1.
+
+    A store is only used in-process; workers load from disk.
+    """
+    if jobs <= 1 or len(games) <= 1:
+        fixtures = FixtureStore(base_dir, store)
+        return {game: validate_game(fixtures, game) for game in games}
+    with ProcessPoolExecutor(max_workers=min(jobs, len(games))) as pool:
+        futures = {game: pool.submit(_validate_game_task, base_dir, game) for game in games}
+        return {game: future.result() for game, future in futures.items()}
+
+# Set by run_suite so the pipeline or CLI can point TestCompareData at its games and artifacts
+VALIDATION = {'base_dir': 'games', 'games': None, 'store': None, 'jobs': os.cpu_count() or 1}
+
+class TimedTextTestResult(unittest.TextTestResult):
+    """Text test result that records how long every test took."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timings = []
+
+    def startTest(self, test):
+        self._started = time.perf_counter()
+        super().startTest(test)
+
+    def stopTest(self, test):
+        self.timings.append((test.id(), time.perf_counter() - self._started))
+        super().stopTest(test)
+
+def run_suite(store=None, jobs=None, games=None, base_dir=None, tests=None, slowest=10):
+    """Run this module's tests (or the named test cases), reusing a pipeline's artifacts, and print the slowest tests."""
+    VALIDATION.update(store=store, games=games)
+    if store is not None:
+        VALIDATION['base_dir'] = store.base_dir
+    if base_dir is not None:
+        VALIDATION['base_dir'] = base_dir
+    if jobs is not None:
+        VALIDATION['jobs'] = jobs
+    module = sys.modules[__name__]
+    if tests:
+        suite = unittest.defaultTestLoader.loadTestsFromNames(tests, module)
+    else:
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+    result = unittest.TextTestRunner(resultclass=TimedTextTestResult).run(suite)
+    print("Slowest tests:")
+    for test_id, seconds in sorted(result.timings, key=lambda timing: timing[1], reverse=True)[:slowest]:
+        print(f"  {seconds:.3f}s {test_id}")
+    for game, checks in getattr(TestCompareData, 'results', {}).items():
+        timings = ', '.join(f"{name} {seconds:.3f}s" for name, (_, seconds) in checks.items())
+        print(f"  {game}: {timings}")
+    return result
+
+SAMPLE_GAME = {
+    'pokemon.txt': """#-------------------------------
+[BULBASAUR]
+Name = Bulbasaur
+Types = GRASS,POISON
+BaseStats = 45,49,49,45,65,65
+Abilities = OVERGROW
+HiddenAbilities = CHLOROPHYLL
+Moves = 1,TACKLE,3,VINEWHIP
+TutorMoves = SOLARBEAM
+EggMoves = PETALDANCE
+Evolutions = IVYSAUR,Level,16
+#-------------------------------
+[IVYSAUR]
+Name = Ivysaur
+Types = GRASS,POISON
+BaseStats = 60,62,63,60,80,80
+Abilities = OVERGROW
+HiddenAbilities = CHLOROPHYLL
+Moves = 1,TACKLE,1,VINEWHIP
+TutorMoves = SOLARBEAM
+#-------------------------------
+[ROTOM]
+Name = Rotom
+Types = ELECTRIC,GHOST
+BaseStats = 50,50,77,91,95,77
+Abilities = LEVITATE
+Moves = 1,THUNDERSHOCK
+""",
+    'pokemon_forms.txt': """#-------------------------------
+[ROTOM,1]
+FormName = Heat Rotom
+Types = ELECTRIC,FIRE
+BaseStats = 50,65,107,86,105,107
+#-------------------------------
+[ROTOM,2]
+FormName = Mega Rotom
+BaseStats = 50,85,127,106,125,127
+""",
+    'moves.txt': """#-------------------------------
+[TACKLE]
+Name = Tackle
+Type = NORMAL
+Category = Physical
+Power = 40
+Accuracy = 100
+TotalPP = 35
+Target = NearOther
+FunctionCode = None
+Flags = Contact,CanProtect
+Description = A physical attack.
+#-------------------------------
+[VINEWHIP]
+Name = Vine Whip
+Type = GRASS
+Category = Physical
+Power = 45
+Accuracy = 100
+TotalPP = 25
+Target = NearOther
+FunctionCode = None
+Description = Strikes with vines.
+#-------------------------------
+[SOLARBEAM]
+Name = Solar Beam
+Type = GRASS
+Category = Special
+Power = 120
+Accuracy = 100
+TotalPP = 10
+Target = NearOther
+FunctionCode = TwoTurnAttack
+Description = A two-turn attack.
+#-------------------------------
+[PETALDANCE]
+Name = Petal Dance
+Type = GRASS
+Category = Special
+Power = 120
+Accuracy = 100
+TotalPP = 10
+Target = RandomNearFoe
+FunctionCode = MultiTurnAttack
+Description = Attacks for two to three turns.
+#-------------------------------
+[THUNDERSHOCK]
+Name = Thunder Shock
+Type = ELECTRIC
+Category = Special
+Power = 40
+Accuracy = 100
+TotalPP = 30
+Target = NearOther
+FunctionCode = ParalyzeTarget
+EffectChance = 10
+Description = May paralyze the target.
+""",
+    'abilities.txt': """#-------------------------------
+[OVERGROW]
+Name = Overgrow
+Description = Powers up Grass-type moves in a pinch.
+#-------------------------------
+[CHLOROPHYLL]
+Name = Chlorophyll
+Description = Boosts Speed in sunshine.
+#-------------------------------
+[LEVITATE]
+Name = Levitate
+Description = Gives full immunity to Ground-type moves.
+""",
+    'encounters.txt': """#-------------------------------
+[002] # Route 1
+Land,21
+    60,BULBASAUR,3,5
+    40,ROTOM,4
+#-------------------------------
+[001] # Home
+Water,2
+    100,BULBASAUR,10,12
+""",
+    'types.txt': """#-------------------------------
+[NORMAL]
+Name = Normal
+IconPosition = 0
+Weaknesses = FIGHTING
+Immunities = GHOST
+#-------------------------------
+[FIRE]
+Name = Fire
+IconPosition = 10
+IsSpecialType = true
+Weaknesses = GROUND,WATER
+Resistances = FIRE,GRASS
+#-------------------------------
+[GRASS]
+Name = Grass
+IconPosition = 12
+IsSpecialType = true
+Weaknesses = FIRE,POISON
+Resistances = GROUND,WATER,GRASS,ELECTRIC
+#-------------------------------
+[ELECTRIC]
+Name = Electric
+IconPosition = 13
+IsSpecialType = true
+Weaknesses = GROUND
+Resistances = ELECTRIC
+#-------------------------------
+[POISON]
+Name = Poison
+IconPosition = 3
+Weaknesses = GROUND
+Resistances = GRASS,POISON
+#-------------------------------
+[GROUND]
+Name = Ground
+IconPosition = 4
+Weaknesses = WATER,GRASS
+Resistances = POISON
+Immunities = ELECTRIC
+#-------------------------------
+[WATER]
+Name = Water
+IconPosition = 11
+IsSpecialType = true
+Weaknesses = GRASS,ELECTRIC
+Resistances = FIRE,WATER
+#-------------------------------
+[FIGHTING]
+Name = Fighting
+IconPosition = 1
+#-------------------------------
+[GHOST]
+Name = Ghost
+IconPosition = 7
+Weaknesses = GHOST
+Resistances = POISON
+Immunities = NORMAL,FIGHTING
+""",
+    'trainers.txt': """#-------------------------------
+[YOUNGSTER,Ben]
+LoseText = Aww.
+Pokemon = BULBASAUR,5
+    Moves = TACKLE,VINEWHIP
+""",
+}
+
+def write_sample_game(base_dir, game_name):
+    data_dir = os.path.join(base_dir, game_name, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    for file_name, content in SAMPLE_GAME.items():
+        with open(os.path.join(data_dir, file_name), 'w', encoding='utf-8') as handle:
+            handle.write(content)
+    return data_dir
+
 class TestEncountersParser(unittest.TestCase):
     def test_parser_handles_real_encounter_formats(self):
         parser = EncountersParser()
@@ -301,57 +605,1074 @@ Water,4
             self.assertEqual(data[1]['MapID'], '022')
             self.assertEqual(data[1]['Encounters']['Water']['Pokemon'][0]['Level'], 5)
 
+    def test_species_index_lists_locations_sorted_by_map_id(self):
+        parser = EncountersParser()
+        all_maps = [
+            {'MapID': '022', 'MapName': 'Serene Village', 'Encounters': {
+                'Water': {'Rate': 4, 'Pokemon': [{'Chance': 20, 'Species': 'FINNEON', 'Level': 5}]}}},
+            {'MapID': '004', 'MapName': 'Oxyrus Lake', 'Encounters': {
+                'Land': {'Rate': 21, 'Pokemon': [{'Chance': 20, 'Species': 'Finneon', 'MinLevel': 9, 'MaxLevel': 11},
+                                                 {'Chance': 10, 'Species': 'PATRAT', 'MinLevel': 7, 'MaxLevel': 10}]},
+                'OldRod': {'Rate': None, 'Pokemon': [{'Chance': 70, 'Species': 'FINNEON', 'Level': 3}]}}},
+        ]
+
+        index = parser.build_species_index(all_maps)
 
-class TestCompareData(unittest.TestCase):
+        self.assertEqual(sorted(index), ['FINNEON', 'PATRAT'])
+        self.assertEqual([(entry['MapID'], entry['Method']) for entry in index['FINNEON']],
+                         [('004', 'Land'), ('004', 'OldRod'), ('022', 'Water')])
+        self.assertEqual(index['FINNEON'][0], {'MapID': '004', 'MapName': 'Oxyrus Lake', 'Method': 'Land', 'Rate': 21,
+                                               'Chance': 20, 'MinLevel': 9, 'MaxLevel': 11})
+        self.assertEqual((index['FINNEON'][2]['MinLevel'], index['FINNEON'][2]['MaxLevel']), (5, 5))
+
+    def test_stage_writes_index_and_per_species_slices(self):
+        from data_orchestration import DataOrchestrator, FilePaths
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = write_sample_game(tmpdir, 'sample')
+            stale_slice = os.path.join(data_dir, 'encounters', 'MISSINGNO.json')
+            os.makedirs(os.path.dirname(stale_slice))
+            with open(stale_slice, 'w', encoding='utf-8') as handle:
+                handle.write('[]')
+            paths = FilePaths(base_dir=tmpdir, games=['sample'])
+            orchestrator = DataOrchestrator(paths, debug_json=True)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                orchestrator.run_stages(['parse_encounters'])
+                orchestrator.store.emit()
+
+            with open(os.path.join(data_dir, 'encounters_by_species.json'), 'r', encoding='utf-8') as handle:
+                index = json.load(handle)
+            self.assertFalse(os.path.exists(stale_slice))
+            for species, locations in index.items():
+                with open(os.path.join(data_dir, 'encounters', f'{species}.json'), 'r', encoding='utf-8') as handle:
+                    self.assertEqual(json.load(handle), locations)
+
+
+class TestPbsTokenizer(unittest.TestCase):
+    def test_sections_stream_headers_and_pairs(self):
+        sample = """﻿# See the documentation on the wiki to learn how to edit this file.
+#-------------------------------
+[POUND]
+Name = Pound
+Power = 40
+#-------------------------------
+#-------------------------------
+# A comment between sections
+[TACKLE]
+Name = Tackle
+Description = Hits = hard.
+[EMBER]
+Name = Ember
+"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, 'moves.txt')
+            with open(input_file, 'w', encoding='utf-8', newline='\r\n') as handle:
+                handle.write(sample)
+
+            sections = list(iter_sections(input_file))
+
+        self.assertEqual([header for header, _ in sections], ['[POUND]', '[TACKLE]', '[EMBER]'])
+        self.assertEqual(sections[0][1], [('Name', 'Pound'), ('Power', '40')])
+        self.assertEqual(sections[1][1], [('Name', 'Tackle'), ('Description', 'Hits = hard.')])
+
+    def test_raw_sections_keep_indentation(self):
+        sample = """[LEADER_Brock,Brock,1]
+LoseText = Wow.
+Pokemon = ONIX,11
+    Moves = TACKLE
+\tName = Rocky
+"""
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_file = os.path.join(tmpdir, 'trainers.txt')
+            with open(input_file, 'w', encoding='utf-8') as handle:
+                handle.write(sample)
+
+            sections = list(iter_raw_sections(input_file))
+
+        self.assertEqual(len(sections), 1)
+        header, lines = sections[0]
+        self.assertEqual(header, '[LEADER_Brock,Brock,1]')
+        self.assertEqual(lines, ['LoseText = Wow.', 'Pokemon = ONIX,11', '    Moves = TACKLE', '\tName = Rocky'])
+
+
+class TestArtifactStore(unittest.TestCase):
+    def test_emit_writes_pending_artifacts_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.makedirs(os.path.join(tmpdir, 'demo', 'data'))
+            store = ArtifactStore(base_dir=tmpdir)
+            store.put('demo', 'moves', [{'Name': 'POUND'}])
+            store.put('demo', 'scratch', {'POUND': 1}, emit=False)
+
+            self.assertEqual(store.get('demo', 'moves'), [{'Name': 'POUND'}])
+            self.assertIn(('demo', 'scratch'), store)
+
+            written = store.emit()
+            self.assertEqual(written, [store.path('demo', 'moves')])
+            self.assertFalse(os.path.exists(store.path('demo', 'scratch')))
+            self.assertEqual(store.emit(), [])
+
+            # A fresh store falls back to the emitted file
+            self.assertEqual(ArtifactStore(base_dir=tmpdir).get('demo', 'moves'), [{'Name': 'POUND'}])
+            self.assertIsNone(ArtifactStore(base_dir=tmpdir).get('demo', 'scratch'))
+
+    def test_production_emit_is_minified_and_precompressed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.makedirs(os.path.join(tmpdir, 'demo', 'data'))
+            store = ArtifactStore(base_dir=tmpdir)
+            store.put('demo', 'moves', [{'Name': 'POUND', 'Power': 40}])
+            store.emit()
+            json_path = store.path('demo', 'moves')
+
+            with open(json_path, 'rb') as handle:
+                payload = handle.read()
+            self.assertEqual(payload, b'[{"Name":"POUND","Power":40}]')
+            with gzip.open(json_path + '.gz', 'rb') as handle:
+                self.assertEqual(handle.read(), payload)
+
+            # Debug output is indented and drops the stale compressed sibling
+            debug_store = ArtifactStore(base_dir=tmpdir, debug=True)
+            debug_store.put('demo', 'moves', [{'Name': 'POUND', 'Power': 40}])
+            debug_store.emit()
+            with open(json_path, 'r', encoding='utf-8') as handle:
+                self.assertEqual(handle.read(), json.dumps([{'Name': 'POUND', 'Power': 40}], indent=4))
+            self.assertFalse(os.path.exists(json_path + '.gz'))
+
+    def test_missing_brotli_is_reported_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            os.makedirs(os.path.join(tmpdir, 'demo', 'data'))
+            store = ArtifactStore(base_dir=tmpdir)
+            output = io.StringIO()
+            with unittest.mock.patch.object(artifact_store, 'brotli', None), contextlib.redirect_stdout(output):
+                self.assertEqual(store.compressed_formats, ['gz'])
+                for power in (40, 50):
+                    store.put('demo', 'moves', [{'Name': 'POUND', 'Power': power}])
+                    store.emit()
+            self.assertEqual(output.getvalue().count('brotli is not installed'), 1)
+            self.assertFalse(os.path.exists(store.path('demo', 'moves') + '.br'))
+
+
+class TestIncrementalBuild(unittest.TestCase):
+    def build(self, base_dir):
+        from data_orchestration import DataOrchestrator, FilePaths
+
+        paths = FilePaths(base_dir=base_dir)
+        paths.games = ['demo']
+        orchestrator = DataOrchestrator(paths)
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator.parse_pokemon()
+            orchestrator.parse_forms()
+            orchestrator.combine_pokemon()
+            orchestrator.parse_moves()
+            orchestrator.generate_evolutions()
+            orchestrator.generate_trainers()
+            orchestrator.emit()
+        return orchestrator.rebuilt
+
+    def test_unchanged_inputs_skip_every_stage(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'demo')
+            self.assertEqual(len(self.build(tmpdir)), 6)
+            self.assertEqual(self.build(tmpdir), [])
+
+    def test_only_changed_stages_and_dependents_rerun(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = write_sample_game(tmpdir, 'demo')
+            self.build(tmpdir)
+
+            with open(os.path.join(data_dir, 'trainers.txt'), 'a', encoding='utf-8') as handle:
+                handle.write("# a comment does not change the output\n")
+            self.assertEqual(self.build(tmpdir), [('demo', 'generate_trainers')])
+
+            # Same forms output, so the merge downstream is skipped
+            with open(os.path.join(data_dir, 'pokemon_forms.txt'), 'a', encoding='utf-8') as handle:
+                handle.write("# another comment\n")
+            self.assertEqual(self.build(tmpdir), [('demo', 'parse_forms')])
+
+            with open(os.path.join(data_dir, 'pokemon_forms.txt'), 'a', encoding='utf-8') as handle:
+                handle.write("#-------------------------------\n[IVYSAUR,1]\nFormName = Mega Ivysaur\nBaseStats = 60,82,83,80,100,100\n")
+            self.assertEqual(self.build(tmpdir), [
+                ('demo', 'parse_forms'),
+                ('demo', 'combine_pokemon'),
+                ('demo', 'generate_evolutions'),
+            ])
+
+    def test_deleted_or_edited_shards_rebuild_their_stage(self):
+        from data_orchestration import DataOrchestrator, FilePaths
+
+        def build():
+            paths = FilePaths(base_dir=tmpdir)
+            orchestrator = DataOrchestrator(paths)
+            with contextlib.redirect_stdout(io.StringIO()):
+                orchestrator.run_stages(['parse_pokemon', 'parse_forms', 'combine_pokemon', 'generate_evolutions',
+                                         'generate_pokemon_shards', 'parse_encounters'])
+                orchestrator.emit()
+            return [stage for _, stage in orchestrator.rebuilt]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = write_sample_game(tmpdir, 'demo')
+            self.assertEqual(len(build()), 6)
+            self.assertEqual(build(), [])
+
+            os.remove(os.path.join(data_dir, 'pokemon', 'ROTOM.json'))
+            self.assertEqual(build(), ['generate_pokemon_shards'])
+            self.assertTrue(os.path.exists(os.path.join(data_dir, 'pokemon', 'ROTOM.json')))
+
+            with open(os.path.join(data_dir, 'pokemon', 'IVYSAUR.json.gz'), 'wb') as handle:
+                handle.write(b'corrupt')
+            self.assertEqual(build(), ['generate_pokemon_shards'])
+
+            slice_path = os.path.join(data_dir, 'encounters', sorted(os.listdir(os.path.join(data_dir, 'encounters')))[0])
+            with open(slice_path, 'w', encoding='utf-8') as handle:
+                handle.write('[]')
+            self.assertEqual(build(), ['parse_encounters'])
+            self.assertEqual(build(), [])
+
+    def test_image_folder_hash_follows_file_contents(self):
+        from build_manifest import BuildManifest
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            icons_dir = os.path.join(tmpdir, 'demo', 'images', 'Icons')
+            os.makedirs(icons_dir)
+            for name in ['ABRA.png', 'ABRA_1.png']:
+                with open(os.path.join(icons_dir, name), 'wb') as handle:
+                    handle.write(name.encode('utf-8'))
+            manifest = BuildManifest(tmpdir, 'demo')
+            first = manifest.folder_hash(icons_dir)
+
+            self.assertEqual(sorted(manifest.files), ['images/Icons/ABRA.png', 'images/Icons/ABRA_1.png'])
+            self.assertEqual(BuildManifest(tmpdir, 'demo').folder_hash(icons_dir), first)
+            with open(os.path.join(icons_dir, 'ABRA.png'), 'ab') as handle:
+                handle.write(b'changed')
+            self.assertNotEqual(manifest.folder_hash(icons_dir), first)
+            self.assertIsNone(manifest.folder_hash(os.path.join(tmpdir, 'demo', 'images', 'Items')))
+
+
+class TestStageScheduler(unittest.TestCase):
+    def build(self, base_dir, jobs):
+        from data_orchestration import DataOrchestrator, FilePaths, STAGES
+
+        paths = FilePaths(base_dir=base_dir)
+        paths.games = ['demo', 'other']
+        orchestrator = DataOrchestrator(paths, force=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator.run_stages(list(STAGES), jobs=jobs)
+            orchestrator.emit()
+        return orchestrator
+
+    def read_outputs(self, base_dir):
+        outputs = {}
+        for game_name in ['demo', 'other']:
+            data_dir = os.path.join(base_dir, game_name, 'data')
+            for file_name in sorted(os.listdir(data_dir)):
+                if file_name.endswith('.json'):
+                    with open(os.path.join(data_dir, file_name), 'r', encoding='utf-8') as handle:
+                        outputs[(game_name, file_name)] = json.load(handle)
+        return outputs
+
+    def test_dependencies_run_before_dependents(self):
+        from data_orchestration import STAGES, missing_requirements
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'demo')
+            write_sample_game(tmpdir, 'other')
+            rebuilt = self.build(tmpdir, jobs=1).rebuilt
+            for game_name in ['demo', 'other']:
+                position = {stage: rebuilt.index((game_name, stage)) for game, stage in rebuilt if game == game_name}
+                self.assertEqual(len(position), len([stage for stage in STAGES if not missing_requirements(stage)]))
+                self.assertLess(position['parse_pokemon'], position['parse_forms'])
+                self.assertLess(position['parse_forms'], position['combine_pokemon'])
+                self.assertLess(position['combine_pokemon'], position['generate_evolutions'])
+
+    def test_process_pool_matches_serial_build(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'demo')
+            write_sample_game(tmpdir, 'other')
+            self.build(tmpdir, jobs=1)
+            serial = self.read_outputs(tmpdir)
+            self.build(tmpdir, jobs=2)
+            self.assertEqual(self.read_outputs(tmpdir), serial)
+
+
+class TestParseAndVerify(unittest.TestCase):
+    entries = [('Name', 'Vine Whip'), ('Type', 'GRASS'), ('Power', '45'), ('Priority', '-1'),
+               ('Flags', 'Contact, CanProtect'), ('Description', 'Strikes with slender, whiplike vines.')]
+
+    def test_parsed_moves_match_their_sections(self):
+        mismatches = []
+        moves = MovesParser().build_moves([('[VINEWHIP]', self.entries)], mismatches)
+        self.assertEqual(moves[0]['Flags'], ['Contact', 'CanProtect'])
+        self.assertEqual(moves[0]['Name'], 'VINEWHIP')
+        self.assertNotIn('DisplayName', moves[0])
+        self.assertEqual(mismatches, [])
+
+    def test_sections_without_a_name_line_match(self):
+        mismatches = []
+        MovesParser().build_moves([('[POUND]', [('Type', 'NORMAL'), ('Power', '40')])], mismatches)
+        self.assertEqual(mismatches, [])
+
+    def test_only_differing_fields_are_reported(self):
+        record = {'Name': 'VINEWHIP', 'Type': 'GRASS', 'Power': 40, 'Priority': -1,
+                  'Flags': ['Contact', 'CanProtect'], 'Description': 'Strikes with slender, whiplike vines.',
+                  'Target': 'NearOther'}
+        self.assertEqual(verify_entry('VINEWHIP', self.entries, record), [
+            ('vinewhip', 'Power', 45, 40),
+            ('vinewhip', 'Target', None, 'nearother'),
+        ])
+
+    def test_tuples_compare_like_lists(self):
+        record = {'Name': 'VINEWHIP', 'Type': 'GRASS', 'Power': 45, 'Priority': -1,
+                  'Flags': ('Contact', 'CanProtect'), 'Description': 'Strikes with slender, whiplike vines.'}
+        self.assertEqual(verify_entry('VINEWHIP', self.entries, record), [])
+
+
+class TestPokemonCombiner(unittest.TestCase):
+    def test_form_ids_count_up_around_megas(self):
+        base_data = [{'InternalName': 'CHARIZARD'}, {'InternalName': 'ROTOM'}]
+        form_data = [
+            {'BaseName': 'ROTOM', 'FormName': 'Heat Rotom', 'BaseStats': []},
+            {'BaseName': 'CHARIZARD', 'FormName': 'Mega Charizard X', 'BaseStats': []},
+            {'BaseName': 'CHARIZARD', 'FormName': 'Gigantamax', 'BaseStats': []},
+            {'BaseName': 'ROTOM', 'FormName': 'Wash Rotom', 'BaseStats': []},
+            {'BaseName': 'ROTOM', 'FormName': 'Broken Rotom'},
+            {'BaseName': 'MISSINGNO', 'FormName': 'Glitch', 'BaseStats': []},
+        ]
+        with contextlib.redirect_stdout(io.StringIO()):
+            merged = PokemonCombiner().merge_records('test', base_data, form_data)
+
+        form_ids = {pokemon['InternalName']: [form['InternalName'] for form in pokemon['Forms']] for pokemon in merged}
+        self.assertEqual(form_ids, {'CHARIZARD': ['CHARIZARD_1', 'CHARIZARD_2'], 'ROTOM': ['ROTOM_1', 'ROTOM_2']})
+        self.assertNotIn('Forms', base_data[0])
+
+
+class TestEvolution(unittest.TestCase):
+    def build_lines(self, pokedex_data):
+        evolution = Evolution(None, None, pokedex_data)
+        records = evolution.build_evolution_data(evolution.generate_evolution_dict())
+        return {pokemon['InternalName']: pokemon.get('EvolutionLine') for pokemon in records}
+
+    def test_branches_share_the_family_line(self):
+        lines = self.build_lines([
+            {'InternalName': 'EEVEE', 'Evolutions': 'VAPOREON,Item,WATERSTONE,JOLTEON,Item,THUNDERSTONE'},
+            {'InternalName': 'VAPOREON', 'Evolutions': ''},
+            {'InternalName': 'JOLTEON', 'Evolutions': ''},
+            {'InternalName': 'PIDGEY', 'Evolutions': 'PIDGEOTTO,Level,18'},
+            {'InternalName': 'PIDGEOTTO', 'Evolutions': 'PIDGEOT,Level,36'},
+            {'InternalName': 'PIDGEOT', 'Evolutions': ''},
+            {'InternalName': 'DITTO', 'Evolutions': ''},
+        ])
+        eevee_line = 'EEVEE, VAPOREON(WATERSTONE), JOLTEON(THUNDERSTONE)'
+        pidgey_line = 'PIDGEY, PIDGEOTTO(18), PIDGEOT(36)'
+        self.assertEqual(lines, {
+            'EEVEE': eevee_line, 'VAPOREON': eevee_line, 'JOLTEON': eevee_line,
+            'PIDGEY': pidgey_line, 'PIDGEOTTO': pidgey_line, 'PIDGEOT': pidgey_line,
+            'DITTO': None,
+        })
+
+    def test_lines_resolve_in_dex_order_and_survive_cycles(self):
+        lines = self.build_lines([
+            {'InternalName': 'IVYSAUR', 'Evolutions': 'VENUSAUR,Level,32'},
+            {'InternalName': 'BULBASAUR', 'Evolutions': 'IVYSAUR,Level,16'},
+            {'InternalName': 'VENUSAUR', 'Evolutions': 'BULBASAUR,Level,1'},
+        ])
+        self.assertEqual(lines['IVYSAUR'], 'IVYSAUR(16), VENUSAUR(32), BULBASAUR(1)')
+        self.assertEqual(lines['BULBASAUR'], 'IVYSAUR(16), VENUSAUR(32), BULBASAUR(1)')
+        self.assertEqual(lines['VENUSAUR'], 'IVYSAUR(16), VENUSAUR(32), BULBASAUR(1)')
+
+    def test_last_parsed_parent_names_a_shared_evolution(self):
+        # The walks from SLOWPOKE, then SHELLDER and last PRIMEAPE all parse
+        # SLOWPOKE's row, so its method wins although SHELLDER comes later in the dex
+        lines = self.build_lines([
+            {'InternalName': 'SLOWPOKE', 'Evolutions': 'SLOWBRO,Level,37'},
+            {'InternalName': 'SHELLDER', 'Evolutions': 'SLOWBRO,Trade,'},
+            {'InternalName': 'PRIMEAPE', 'Evolutions': 'SLOWPOKE,Level,1'},
+            {'InternalName': 'SLOWBRO', 'Evolutions': ''},
+        ])
+        self.assertEqual(lines['SLOWPOKE'], 'SLOWPOKE(1), SLOWBRO(37)')
+        self.assertEqual(lines['SHELLDER'], 'SHELLDER, SLOWBRO(37)')
+
+    def test_egg_moves_are_inherited_from_every_prevolution(self):
+        evolution = Evolution(None, None, [
+            {'InternalName': 'NIDORANfE', 'Evolutions': 'NIDORINA,Level,16', 'EggMoves': 'COUNTER,DISABLE'},
+            {'InternalName': 'NIDORINA', 'Evolutions': 'NIDOQUEEN,Item,MOONSTONE', 'EggMoves': 'DISABLE,SUPERFANG'},
+            {'InternalName': 'NIDOQUEEN', 'Evolutions': '',
+             'Forms': [{'InternalName': 'NIDOQUEEN_1', 'EggMoves': ['COUNTER']}, {'InternalName': 'NIDOQUEEN_2'}]},
+            {'InternalName': 'EEVEE', 'Evolutions': 'ESPEON,HappinessDay,,UMBREON,HappinessNight,', 'EggMoves': 'CURSE'},
+            {'InternalName': 'UMBREON', 'Evolutions': ''},
+        ])
+        records = {pokemon['InternalName']: pokemon
+                   for pokemon in evolution.build_evolution_data(evolution.generate_evolution_dict())}
+
+        self.assertNotIn('InheritedEggMoves', records['NIDORANfE'])
+        self.assertEqual(records['NIDORINA']['InheritedEggMoves'], ['COUNTER'])
+        self.assertEqual(records['NIDOQUEEN']['InheritedEggMoves'], ['DISABLE', 'SUPERFANG', 'COUNTER'])
+        self.assertEqual(records['NIDOQUEEN']['Forms'], [
+            {'InternalName': 'NIDOQUEEN_1', 'EggMoves': ['COUNTER'], 'InheritedEggMoves': ['DISABLE', 'SUPERFANG']},
+            {'InternalName': 'NIDOQUEEN_2'},
+        ])
+        self.assertEqual(records['UMBREON']['InheritedEggMoves'], ['CURSE'])
+
+
+class TestPokemonSharder(unittest.TestCase):
+    def test_index_keeps_card_fields_and_shards_keep_full_records(self):
+        pokedex_data = [{
+            'InternalName': 'ROTOM', 'Name': 'ROTOM', 'Type1': 'ELECTRIC', 'Type2': 'GHOST',
+            'BaseStats': ['50', '50', '77', '91', '95', '77'], 'Abilities': 'LEVITATE',
+            'Moves': ['1', 'THUNDERSHOCK'], 'Pokedex': 'A plasma creature.', 'WildItemRare': 'ELECTIRIZER',
+            'Forms': [{'InternalName': 'ROTOM_1', 'FormName': 'Heat Rotom', 'Type1': 'ELECTRIC', 'Type2': 'FIRE',
+                       'BaseStats': ['50', '65', '107', '86', '105', '107'], 'Moves': 'OVERHEAT'}],
+        }]
+        sharder = PokemonSharder()
+
+        index = sharder.build_index(pokedex_data)
+        self.assertEqual(index, [{
+            'InternalName': 'ROTOM', 'Name': 'ROTOM', 'Type1': 'ELECTRIC', 'Type2': 'GHOST',
+            'BaseStats': ['50', '50', '77', '91', '95', '77'], 'Abilities': 'LEVITATE', 'WildItemRare': 'ELECTIRIZER',
+            'Forms': [{'InternalName': 'ROTOM_1', 'FormName': 'Heat Rotom', 'Type1': 'ELECTRIC', 'Type2': 'FIRE',
+                       'BaseStats': ['50', '65', '107', '86', '105', '107']}],
+        }])
+        self.assertEqual(sharder.build_shards(pokedex_data), {'ROTOM': pokedex_data[0]})
+
+    def test_stale_shards_are_removed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for file_name in ['ROTOM.json', 'ROTOM.json.gz', 'MISSINGNO.json', 'MISSINGNO.json.gz']:
+                open(os.path.join(tmpdir, file_name), 'w').close()
+            PokemonSharder().remove_stale_shards(tmpdir, {'ROTOM'})
+            self.assertEqual(sorted(os.listdir(tmpdir)), ['ROTOM.json', 'ROTOM.json.gz'])
+
+
+
+class TestMoveLearnersIndexer(unittest.TestCase):
+    def test_index_numbers_species_and_lists_learners_per_method(self):
+        pokedex_data = [
+            {'InternalName': 'BULBASAUR', 'Moves': ['1', 'TACKLE', '7', 'VINEWHIP', '7', 'VINEWHIP'],
+             'TutorMoves': ['CUT', ' TACKLE'], 'EggMoves': 'PETALDANCE, CURSE'},
+            {'InternalName': 'ROTOM', 'Moves': ['1', 'THUNDERSHOCK'], 'TutorMoves': None, 'EggMoves': None,
+             'Forms': [{'InternalName': 'ROTOM_1', 'Moves': '1,OVERHEAT,1,THUNDERSHOCK', 'TutorMoves': None},
+                       {'InternalName': 'ROTOM_2', 'TutorMoves': 'CUT'}]},
+        ]
+
+        index = MoveLearnersIndexer().build_index(pokedex_data)
+
+        self.assertEqual(index['Species'], ['BULBASAUR', 'ROTOM', 'ROTOM_1', 'ROTOM_2'])
+        self.assertEqual(index['Base'], [0, 1, 1, 1])
+        self.assertEqual(list(index['Moves']), ['CURSE', 'CUT', 'OVERHEAT', 'PETALDANCE', 'TACKLE', 'THUNDERSHOCK', 'VINEWHIP'])
+        self.assertEqual(index['Moves']['TACKLE'], {'Level': [[0, 1]], 'Tutor': [0]})
+        self.assertEqual(index['Moves']['VINEWHIP'], {'Level': [[0, 7]]})
+        self.assertEqual(index['Moves']['THUNDERSHOCK'], {'Level': [[1, 1], [2, 1]]})
+        self.assertEqual(index['Moves']['CUT'], {'Tutor': [0, 3]})
+        self.assertEqual(index['Moves']['CURSE'], {'Egg': [0]})
+
+
+class TestAbilityHoldersIndexer(unittest.TestCase):
+    def test_regular_and_hidden_holders_respect_form_overrides(self):
+        abilities = [{'Name': 'Levitate'}, {'Name': 'Overgrow'}, {'Name': 'Chlorophyll'}, {'Name': 'Flash Fire'}]
+        pokedex_data = [
+            {'InternalName': 'BULBASAUR', 'Abilities': 'OVERGROW', 'HiddenAbilities': 'CHLOROPHYLL'},
+            {'InternalName': 'ROTOM', 'Abilities': 'LEVITATE', 'HiddenAbilities': None, 'HiddenAbility': 'LEVITATE',
+             'Forms': [{'InternalName': 'ROTOM_1', 'Abilities': 'FLASHFIRE,LEVITATE',
+                        'HiddenAbility': '1,OVERHEAT,1,THUNDERSHOCK'},
+                       {'InternalName': 'ROTOM_2', 'Abilities': 'MADEUPABILITY'}]},
+        ]
+
+        index = AbilityHoldersIndexer().build_index(abilities, pokedex_data)
+
+        self.assertEqual(index['Species'], ['BULBASAUR', 'ROTOM', 'ROTOM_1', 'ROTOM_2'])
+        self.assertEqual(index['Base'], [0, 1, 1, 1])
+        self.assertEqual(index['Abilities'], {
+            'Levitate': {'Regular': [1, 2], 'Hidden': [1]},
+            'Overgrow': {'Regular': [0], 'Hidden': []},
+            'Chlorophyll': {'Regular': [], 'Hidden': [0]},
+            'Flash Fire': {'Regular': [2], 'Hidden': []},
+        })
+
+
+    def test_forms_overriding_only_abilities_have_no_hidden_holders(self):
+        abilities = [{'Name': 'Blaze'}, {'Name': 'Speed Boost'}]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            forms_path = os.path.join(tmpdir, 'pokemon_forms.txt')
+            with open(forms_path, 'w', encoding='utf-8') as handle:
+                handle.write("[BLAZIKEN,1]\nFormName = Mega Blaziken\nAbilities = SPEEDBOOST\n")
+            forms = FormsParser().parse_forms(forms_path, {'BLAZIKEN': {'InternalName': 'BLAZIKEN', 'Abilities': 'BLAZE'}})
+        self.assertNotIn('HiddenAbility', forms[0])
+
+        # Forms emitted by the old parser carry their last field under HiddenAbility
+        stale = dict(forms[0], InternalName='BLAZIKEN_1', HiddenAbility='SPEEDBOOST')
+        pokedex_data = [{'InternalName': 'BLAZIKEN', 'Abilities': 'BLAZE', 'HiddenAbilities': 'SPEEDBOOST', 'Forms': [stale]}]
+        index = AbilityHoldersIndexer().build_index(abilities, pokedex_data)
+        self.assertEqual(index['Abilities'], {
+            'Blaze': {'Regular': [0], 'Hidden': []},
+            'Speed Boost': {'Regular': [1], 'Hidden': [0]},
+        })
+
+
+class TestSearchIndex(unittest.TestCase):
     def setUp(self):
-        self.base_dir = 'games'
-        self.games = get_game_names(self.base_dir)
+        pokedex_data = [
+            {'InternalName': 'GENGAR', 'Name': 'Gengar', 'Forms': [{'InternalName': 'GENGAR_1', 'FormName': 'Mega Gengar'}]},
+            {'InternalName': 'KOFFING', 'Name': 'Koffing', 'Forms': [{'InternalName': 'KOFFING_1', 'FormName': 'Anomaly'}]},
+            {'InternalName': 'RHYHORN', 'Name': 'Rhyhorn'},
+            {'InternalName': 'RHYHORN', 'Name': 'Rhyhorn again'},
+        ]
+        moves = [{'Name': 'MEGAHORN'}, {'Name': 'HORNATTACK'}, {}]
+        abilities = [{'Name': 'Dry Skin'}]
+        self.index = SearchIndexBuilder().build_index(pokedex_data, moves, abilities)
+        self.search = SearchIndex(self.index)
 
-    def test_pokemon_compare(self):
+    def names(self, query, **options):
+        return [document['Name'] for document in self.search.search(query, **options)]
+
+    def test_documents_postings_and_ranks(self):
+        documents = self.index['Documents']
+        self.assertEqual([(document['Kind'], document['Id']) for document in documents], [
+            ('pokemon', 'GENGAR'), ('form', 'GENGAR_1'), ('pokemon', 'KOFFING'), ('form', 'KOFFING_1'),
+            ('pokemon', 'RHYHORN'), ('move', 'MEGAHORN'), ('move', 'HORNATTACK'), ('ability', 'Dry Skin'),
+        ])
+        self.assertEqual(documents[3], {'Kind': 'form', 'Id': 'KOFFING_1', 'Name': 'Anomaly',
+                                        'Base': 'KOFFING', 'Tokens': ['anomaly', 'koffing']})
+        self.assertEqual(self.index['Tokens']['gengar'], [0, 1])
+        self.assertEqual(self.index['Prefixes']['me'], [1, 5])
+        self.assertEqual(self.index['Trigrams']['ysk'], [7])
+        self.assertEqual(sorted(self.index['Ranks']), list(range(len(documents))))
+        self.assertLess(self.index['Ranks'][6], self.index['Ranks'][5])
+
+    def test_search_ranks_exact_then_prefix_then_substring(self):
+        self.assertEqual(self.names('gengar'), ['Gengar', 'Mega Gengar'])
+        self.assertEqual(self.names('horn'), ['HORNATTACK', 'MEGAHORN', 'Rhyhorn'])
+        self.assertEqual(self.names('koffing anomaly'), ['Anomaly'])
+        self.assertEqual(self.names('DrySkin'), ['Dry Skin'])
+        self.assertEqual(self.names('me', kinds=['form']), ['Mega Gengar'])
+        self.assertEqual(self.names('horn', limit=1), ['HORNATTACK'])
+
+    def test_short_words_match_token_starts_only(self):
+        self.assertEqual(self.names('sk'), ['Dry Skin'])
+        self.assertEqual(self.names('ng'), [])
+        self.assertEqual(self.names('zzz'), [])
+        self.assertEqual(self.names(' - '), [])
+
+
+@unittest.skipIf(sprite_atlas.Image is None, "Pillow is not installed")
+class TestSpriteAtlas(unittest.TestCase):
+    def write_sprites(self, folder, sizes):
+        os.makedirs(folder, exist_ok=True)
+        for index, (name, size) in enumerate(sizes.items()):
+            sprite_atlas.Image.new('RGBA', size, (index * 40, 0, 0, 255)).save(os.path.join(folder, name))
+
+    def test_sprites_pack_onto_sheets_keyed_by_name_and_form(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            images_dir = os.path.join(tmpdir, 'images')
+            self.write_sprites(os.path.join(images_dir, 'Icons'), {
+                'ABRA.png': (32, 16), 'ABRA_1.png': (32, 16), 'KADABRA.png': (32, 16), 'BIBAREL_female.png': (16, 16),
+            })
+            self.write_sprites(os.path.join(images_dir, 'Types'), {'FIRE.png': (20, 8)})
+            packer = sprite_atlas.SpriteAtlasPacker(sheet_size=32, jobs=2)
+
+            atlases = packer.build_atlases(images_dir)
+
+            icons = atlases['Icons']
+            self.assertEqual(icons['Sheets'], [
+                {'File': 'atlas/icons-0.png', 'Width': 32, 'Height': 32},
+                {'File': 'atlas/icons-1.png', 'Width': 32, 'Height': 32},
+            ])
+            self.assertEqual(icons['Sprites'], {
+                'ABRA': {'0': [0, 0, 0, 32, 16], '1': [0, 0, 16, 32, 16]},
+                'BIBAREL_female': {'0': [1, 0, 0, 16, 16]},
+                'KADABRA': {'0': [1, 0, 16, 32, 16]},
+            })
+            self.assertEqual(atlases['Types']['Sprites'], {'FIRE': {'0': [0, 0, 0, 20, 8]}})
+            self.assertNotIn('Items', atlases)
+            with sprite_atlas.Image.open(os.path.join(images_dir, 'atlas', 'icons-0.png')) as sheet:
+                self.assertEqual(sheet.getpixel((4, 20)), (40, 0, 0, 255))
+
+            os.remove(os.path.join(images_dir, 'Icons', 'KADABRA.png'))
+            os.remove(os.path.join(images_dir, 'Icons', 'BIBAREL_female.png'))
+            packer.build_atlases(images_dir)
+            self.assertEqual(sorted(os.listdir(os.path.join(images_dir, 'atlas'))), ['icons-0.png', 'types-0.png'])
+
+    def test_stage_reruns_only_when_images_change(self):
+        from data_orchestration import DataOrchestrator, FilePaths
+
+        def build():
+            paths = FilePaths(base_dir=tmpdir)
+            paths.games = ['demo']
+            orchestrator = DataOrchestrator(paths)
+            with contextlib.redirect_stdout(io.StringIO()):
+                orchestrator.generate_sprite_atlas()
+                orchestrator.emit()
+            return orchestrator.rebuilt
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'demo')
+            self.write_sprites(os.path.join(tmpdir, 'demo', 'images', 'Items'), {'POTION.png': (24, 24)})
+            self.assertEqual(build(), [('demo', 'generate_sprite_atlas')])
+            self.assertEqual(build(), [])
+            self.write_sprites(os.path.join(tmpdir, 'demo', 'images', 'Items'), {'REPEL.png': (24, 24)})
+            self.assertEqual(build(), [('demo', 'generate_sprite_atlas')])
+
+
+@unittest.skipIf(sprite_variants.Image is None, "Pillow is not installed")
+class TestSpriteVariants(unittest.TestCase):
+    def write_sprite(self, path, size, color):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        sprite_variants.Image.new('RGBA', size, color).save(path)
+
+    def test_variants_are_only_encoded_for_new_or_changed_sprites(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            images_dir = os.path.join(tmpdir, 'images')
+            self.write_sprite(os.path.join(images_dir, 'Front', 'ABRA.png'), (96, 96), (255, 0, 0, 255))
+            self.write_sprite(os.path.join(images_dir, 'Front', 'ABRA_1.png'), (40, 40), (0, 255, 0, 255))
+            self.write_sprite(os.path.join(images_dir, 'Front shiny', 'ABRA.png'), (96, 96), (0, 0, 255, 255))
+            transcoder = sprite_variants.SpriteTranscoder(jobs=2)
+            formats = transcoder.formats
+
+            manifest, sources = transcoder.build_variants(images_dir)
+
+            self.assertEqual(manifest, {'Formats': formats, 'Folders': {
+                'Front': {'ABRA': [32, 48, 64, 96], 'ABRA_1': [32, 40]},
+                'Front shiny': {'ABRA': [32, 48, 64, 96]},
+            }})
+            variant = os.path.join(images_dir, sprite_variants.variant_path('Front', 'ABRA', 48, formats[0]))
+            with sprite_variants.Image.open(variant) as image:
+                self.assertEqual(image.size, (48, 48))
+                self.assertEqual(image.convert('RGBA').getpixel((0, 0)), (255, 0, 0, 255))
+
+            unchanged = os.stat(variant).st_mtime_ns
+            os.remove(os.path.join(images_dir, 'Front', 'ABRA_1.png'))
+            self.write_sprite(os.path.join(images_dir, 'Front shiny', 'ABRA.png'), (64, 64), (0, 0, 255, 255))
+            manifest, sources = transcoder.build_variants(images_dir, sources)
+
+            self.assertEqual(manifest['Folders'], {'Front': {'ABRA': [32, 48, 64, 96]},
+                                                   'Front shiny': {'ABRA': [32, 48, 64]}})
+            self.assertEqual(os.stat(variant).st_mtime_ns, unchanged)
+            self.assertEqual(sorted(os.listdir(os.path.join(images_dir, 'variants', 'Front'))),
+                             [f'ABRA-{width}.{formats[0]}' for width in (32, 48, 64, 96)])
+            self.assertFalse(os.path.exists(os.path.join(images_dir, sprite_variants.variant_path(
+                'Front shiny', 'ABRA', 96, formats[0]))))
+
+    def test_sources_record_is_kept_in_the_build_manifest(self):
+        from build_manifest import BuildManifest
+        from data_orchestration import DataOrchestrator, FilePaths
+
+        def build(jobs):
+            paths = FilePaths(base_dir=tmpdir)
+            orchestrator = DataOrchestrator(paths, force=True)
+            with contextlib.redirect_stdout(io.StringIO()):
+                orchestrator.run_stages(['generate_sprite_variants'], jobs=jobs)
+                orchestrator.emit()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = write_sample_game(tmpdir, 'demo')
+            self.write_sprite(os.path.join(tmpdir, 'demo', 'images', 'Front', 'ABRA.png'), (40, 40), (255, 0, 0, 255))
+            for jobs in (1, 2):
+                build(jobs)
+                sources = BuildManifest(tmpdir, 'demo').state['sprite_variant_sources']
+                self.assertEqual(sources['Sources']['Front']['ABRA']['Widths'], [32, 40])
+                self.assertEqual(sorted(name for name in os.listdir(data_dir) if name.startswith('sprite')),
+                                 ['sprite_variants.json', 'sprite_variants.json.br', 'sprite_variants.json.gz'])
+
+
+class TestSpriteManifest(unittest.TestCase):
+    def test_each_name_resolves_to_an_existing_file(self):
+        pokedex_data = [
+            {'InternalName': 'ABRA', 'Forms': []},
+            {'InternalName': 'WEEZING', 'Forms': [
+                {'InternalName': 'WEEZING_1', 'FormName': 'Anomaly Weezing'},
+                {'InternalName': 'WEEZING_2', 'FormName': 'Galarian'},
+            ]},
+            {'InternalName': 'SUDOWOODO', 'Forms': [
+                {'InternalName': 'SUDOWOODO_3', 'FormName': 'Mega'},
+            ]},
+            {'InternalName': 'DARKRAI', 'Forms': []},
+        ]
+        trainers = [{'Type': 'YOUNGSTER'}, {'Type': 'LASS'}, {'Type': 'YOUNGSTER'}]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            images_dir = os.path.join(tmpdir, 'images')
+            files = {'Front': ['000', 'ABRA', 'WEEZING', 'WEEZING_2', 'SUDOWOODOT', 'SUDOWOODO_1'],
+                     'Back': ['ABRA'], 'Trainers': ['000', 'YOUNGSTER']}
+            for folder, stems in files.items():
+                os.makedirs(os.path.join(images_dir, folder))
+                for stem in stems:
+                    open(os.path.join(images_dir, folder, f'{stem}.png'), 'wb').close()
+
+            manifest = SpriteManifestBuilder().build_manifest(images_dir, pokedex_data, trainers)
+
+        self.assertEqual(manifest, {'Folders': {
+            'Front': {'Default': '000',
+                      'Redirects': {'WEEZING_1': 'WEEZING_2', 'SUDOWOODO': 'SUDOWOODOT', 'SUDOWOODO_3': 'SUDOWOODO_1'},
+                      'Missing': ['DARKRAI']},
+            'Back': {'Default': None, 'Redirects': {},
+                     'Missing': ['WEEZING', 'WEEZING_1', 'WEEZING_2', 'SUDOWOODO', 'SUDOWOODO_3', 'DARKRAI']},
+            'Trainers': {'Default': '000', 'Redirects': {}, 'Missing': ['LASS']},
+        }})
+
+
+@unittest.skipIf(pokedexcel.Workbook is None, "openpyxl is not installed")
+class TestPokedexWorkbook(unittest.TestCase):
+    def test_workbook_is_streamed_from_the_artifacts(self):
+        from openpyxl import load_workbook
+
+        moves = [{'Name': 'TACKLE', 'Type': 'NORMAL', 'Category': 'Physical', 'Power': 40, 'Accuracy': 100},
+                 {'Name': 'GROWL', 'Type': 'NORMAL', 'Category': 'Status', 'Accuracy': 100}]
+        abilities = [{'Name': 'Run Away', 'Description': 'Enables a sure getaway.'}]
+        encounters = {'EEVEE': [{'MapName': 'Route 1', 'MinLevel': 3, 'MaxLevel': 5}]}
+        pokemon = [{'InternalName': 'EEVEE', 'Name': 'EEVEE', 'Type1': 'NORMAL',
+                    'BaseStats': ['55', '55', '50', '55', '45', '65'], 'Abilities': 'RUNAWAY,ADAPTABILITY',
+                    'HiddenAbilities': 'ANTICIPATION', 'Moves': ['1', 'TACKLE', '5', 'GROWL', '9', 'UNKNOWNMOVE'],
+                    'TutorMoves': ['GROWL', ' TACKLE'], 'EggMoves': 'GROWL,', 'Evolutions': 'VAPOREON,Item,WATERSTONE'}]
+        pokemon_names = pokedexcel.display_names([('[EEVEE]', [('Name', 'Eevee'), ('Types', 'NORMAL')])])
+        move_names = pokedexcel.display_names([('[TACKLE]', [('Name', 'Tackle')]), ('[GROWL]', [('Name', 'Growl')]),
+                                               ('[POUND]', [('Power', '40')])])
+        self.assertEqual(move_names, {'TACKLE': 'Tackle', 'GROWL': 'Growl'})
+        writer = pokedexcel.PokedexWorkbookWriter(moves, abilities, encounters, pokemon_names, move_names)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = os.path.join(tmpdir, pokedexcel.WORKBOOK_FILE)
+            rows = writer.write_workbook(pokemon, output_path)
+            workbook = load_workbook(output_path, read_only=True)
+            sheets = {sheet.title: list(sheet.iter_rows(values_only=True)) for sheet in workbook.worksheets}
+            workbook.close()
+
+        self.assertEqual(rows, dict.fromkeys(pokedexcel.SHEETS, 1))
+        self.assertEqual(list(sheets), list(pokedexcel.SHEETS))
+        main = dict(zip(sheets['Main'][0], sheets['Main'][1]))
+        self.assertEqual((main['Name'], main['UniqueID']), ('Eevee', 'Eevee_EEVEE'))
+        self.assertEqual([main[stat] for stat in pokedexcel.STAT_COLUMNS], ['55', '55', '50', '55', '45', '65'])
+        self.assertEqual(main['Abilities'], 'Run Away - "Enables a sure getaway."')
+        self.assertEqual(main['HiddenAbility'], None)
+        self.assertEqual(main['Evolutions'], 'VAPOREON,Item,WATERSTONE(32)')
+        self.assertEqual(main['Location Found'], 'Route 1: 3-5')
+        tackle = 'Tackle - Type: NORMAL - Power: 40 - Accuracy: 100 - Category: Physical'
+        growl = 'Growl - Type: NORMAL - Power: N/A - Accuracy: 100 - Category: Status'
+        self.assertEqual(sheets['Moves'][1], ('EEVEE', f'1 - {tackle}, 5 - {growl}', f'{growl}, {tackle}', growl))
+
+    def test_missing_workbook_is_rebuilt(self):
+        from openpyxl import load_workbook
+        from data_orchestration import DataOrchestrator, FilePaths
+
+        def build(base_dir):
+            paths = FilePaths(base_dir=base_dir)
+            paths.games = ['demo']
+            orchestrator = DataOrchestrator(paths)
+            with contextlib.redirect_stdout(io.StringIO()):
+                orchestrator.run_stages(['parse_pokemon', 'parse_moves', 'parse_abilities', 'parse_encounters',
+                                         'export_excel'])
+                orchestrator.emit()
+            return [stage for _, stage in orchestrator.rebuilt]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'demo')
+            self.assertIn('export_excel', build(tmpdir))
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, 'demo', 'data', 'pokedex_workbook.json')))
+            workbook = load_workbook(os.path.join(tmpdir, 'demo', pokedexcel.WORKBOOK_FILE), read_only=True)
+            names = [row[1] for row in workbook['Main'].iter_rows(min_row=2, values_only=True)]
+            workbook.close()
+            self.assertEqual(names, ['Bulbasaur', 'Ivysaur', 'Rotom'])
+            self.assertEqual(build(tmpdir), [])
+            os.remove(os.path.join(tmpdir, 'demo', pokedexcel.WORKBOOK_FILE))
+            self.assertEqual(build(tmpdir), ['export_excel'])
+
+
+@unittest.skipIf(type_chart.np is None, "NumPy is not installed")
+class TestTypeChart(unittest.TestCase):
+    TYPES = [
+        {'Name': 'NORMAL', 'Weaknesses': ['FIGHTING'], 'Immunities': ['GHOST']},
+        {'Name': 'FIGHTING', 'Weaknesses': ['FLYING', ' '], 'Resistances': ['ROCK']},
+        {'Name': 'FLYING', 'Weaknesses': ['ROCK'], 'Resistances': ['FIGHTING'], 'Immunities': ['GROUND']},
+        {'Name': 'ROCK', 'Weaknesses': ['FIGHTING', 'GROUND'], 'Resistances': ['NORMAL', 'FLYING']},
+        {'Name': 'GROUND', 'Weaknesses': ['FLYING', 'GHOST']},
+    ]
+
+    def test_matrix_is_attacker_by_defender(self):
+        chart = type_chart.TypeChart.from_types(self.TYPES)
+
+        self.assertEqual(chart.types, ['NORMAL', 'FIGHTING', 'FLYING', 'ROCK', 'GROUND'])
+        self.assertEqual(chart.index['ROCK'], 3)
+        self.assertEqual(chart.effectiveness('FIGHTING', 'NORMAL'), 2.0)
+        self.assertEqual(chart.effectiveness('GROUND', 'FLYING'), 0.0)
+        self.assertEqual(chart.effectiveness('FIGHTING', 'FLYING'), 0.5)
+        # Attackers named in types.json without a section of their own are ignored
+        self.assertEqual(chart.effectiveness('GHOST', 'NORMAL'), 1.0)
+
+    def test_single_dual_and_batched_defenders_agree(self):
+        chart = type_chart.TypeChart.from_types(self.TYPES)
+
+        self.assertEqual(chart.defending('ROCK', 'FLYING').tolist(), [0.5, 1.0, 0.5, 2.0, 0.0])
+        self.assertEqual(chart.defending('ROCK').tolist(), chart.defending('ROCK', None).tolist())
+        self.assertEqual(chart.defending('ROCK', 'QMARKS').tolist(), chart.defending('ROCK').tolist())
+        batch = chart.defending_pairs([('ROCK', 'FLYING'), ('NORMAL', None), ('GROUND',)])
+        self.assertEqual(batch.shape, (3, 5))
+        self.assertEqual(batch[0].tolist(), chart.defending('ROCK', 'FLYING').tolist())
+        self.assertEqual(batch[1].tolist(), chart.defending('NORMAL').tolist())
+        self.assertEqual(batch[2].tolist(), chart.defending('GROUND').tolist())
+        self.assertEqual(chart.coverage(['FIGHTING', 'GROUND']).tolist(), [2.0, 1.0, 0.5, 2.0, 1.0])
+
+    def test_artifact_round_trips_as_plain_json(self):
+        chart = type_chart.TypeChart.from_types(self.TYPES)
+        artifact = json.loads(json.dumps(chart.to_artifact()))
+
+        self.assertEqual(artifact['Matrix'][1], [2, 1, 0.5, 2, 1])
+        restored = type_chart.TypeChart.from_artifact(artifact)
+        self.assertEqual(restored.types, chart.types)
+        self.assertEqual(restored.matrix.tolist(), chart.matrix.tolist())
+
+    def test_matchup_profiles_cover_forms_and_ability_immunities(self):
+        from type_matchups import MatchupProfiler
+
+        chart = type_chart.TypeChart.from_types(self.TYPES)
+        pokedex_data = [
+            {'InternalName': 'AERODACTYL', 'Type1': 'ROCK', 'Type2': 'FLYING', 'Abilities': 'ROCKHEAD',
+             'HiddenAbilities': 'LEVITATE',
+             'Forms': [{'InternalName': 'AERODACTYL_1', 'Type1': 'GROUND', 'Type2': None},
+                       {'InternalName': 'AERODACTYL_2', 'Abilities': 'LEVITATE'}]},
+            {'InternalName': 'SANDSHREW', 'Type1': 'GROUND', 'Abilities': 'LEVITATE'},
+        ]
+
+        matchups = MatchupProfiler(chart, [{'Name': 'Levitate'}]).build_profiles(pokedex_data)
+
+        self.assertEqual(matchups['Types'], chart.types)
+        self.assertEqual(matchups['Profiles'], {
+            'AERODACTYL': [0.5, 1, 0.5, 2, 0],
+            'AERODACTYL_1': [1, 1, 2, 1, 1],
+            'AERODACTYL_2': [0.5, 1, 0.5, 2, 0],
+            'SANDSHREW': [1, 1, 2, 1, 1],
+        })
+        self.assertEqual(matchups['AbilityProfiles'], {
+            'AERODACTYL': {'LEVITATE': [0.5, 1, 0.5, 2, 0]},
+            'AERODACTYL_1': {'LEVITATE': [1, 1, 2, 1, 0]},
+            'AERODACTYL_2': {'LEVITATE': [0.5, 1, 0.5, 2, 0]},
+            'SANDSHREW': {'LEVITATE': [1, 1, 2, 1, 0]},
+        })
+        # Without abilities.json, or with an ability the game lacks, only type profiles are built
+        self.assertEqual(MatchupProfiler(chart).build_profiles(pokedex_data)['AbilityProfiles'], {})
+        self.assertEqual(MatchupProfiler(chart, [{'Name': 'Flash Fire'}]).build_profiles(pokedex_data)['AbilityProfiles'], {})
+
+    def test_forms_keep_their_base_hidden_ability(self):
+        from type_matchups import MatchupProfiler
+
+        chart = type_chart.TypeChart.from_types(self.TYPES)
+        # Forms carry the Abilities they inherit, but never the base's HiddenAbilities
+        pokedex_data = [{'InternalName': 'GEODUDE', 'Type1': 'ROCK', 'Type2': 'GROUND', 'Abilities': 'ROCKHEAD',
+                         'HiddenAbilities': 'LEVITATE',
+                         'Forms': [{'InternalName': 'GEODUDE_1', 'Type1': 'ROCK', 'Type2': 'FLYING', 'Abilities': 'ROCKHEAD'},
+                                   {'InternalName': 'GEODUDE_2', 'Abilities': 'ROCKHEAD', 'HiddenAbilities': 'STURDY'}]}]
+
+        matchups = MatchupProfiler(chart, [{'Name': 'Levitate'}]).build_profiles(pokedex_data)
+
+        self.assertEqual(sorted(matchups['AbilityProfiles']), ['GEODUDE', 'GEODUDE_1'])
+        self.assertEqual(matchups['AbilityProfiles']['GEODUDE_1'], {'LEVITATE': [0.5, 1, 0.5, 2, 0]})
+
+class TestValidationSuite(unittest.TestCase):
+    def test_checks_share_fixtures_and_match_across_workers(self):
+        from data_orchestration import DataOrchestrator, FilePaths, STAGES
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = FilePaths(base_dir=tmpdir)
+            paths.games = ['demo', 'demo2']
+            for game in paths.games:
+                write_sample_game(tmpdir, game)
+            orchestrator = DataOrchestrator(paths)
+            with contextlib.redirect_stdout(io.StringIO()):
+                orchestrator.run_stages(list(STAGES))
+                orchestrator.emit()
+
+            fixtures = FixtureStore(tmpdir, orchestrator.store)
+            self.assertIs(fixtures.source('demo', 'moves'), fixtures.source('demo', 'moves'))
+            self.assertIs(fixtures.artifact('demo', 'moves'), orchestrator.store.get('demo', 'moves'))
+
+            in_process = validate_games(paths.games, tmpdir, jobs=1, store=orchestrator.store)
+            pooled = validate_games(paths.games, tmpdir, jobs=2)
+            errors = {game: {check: result[0] for check, result in checks.items()} for game, checks in in_process.items()}
+            self.assertEqual(errors['demo'], {'pokemon': [], 'forms': [], 'moves': [], 'abilities': []})
+            self.assertEqual({game: {check: result[0] for check, result in checks.items()} for game, checks in pooled.items()}, errors)
+
+
+class TestBenchmarkCorpus(unittest.TestCase):
+    def read_game(self, base_dir):
+        data_dir = os.path.join(base_dir, 'synthetic', 'data')
+        contents = {}
+        for file_name in sorted(os.listdir(data_dir)):
+            with open(os.path.join(data_dir, file_name), 'rb') as handle:
+                contents[file_name] = handle.read()
+        return contents
+
+    def test_corpus_is_deterministic_and_builds_cleanly(self):
+        from data_orchestration import DataOrchestrator, FilePaths, STAGES, missing_requirements
+
+        with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+            SyntheticCorpus(scale=0.02).write_game(first, 'synthetic')
+            SyntheticCorpus(scale=0.02).write_game(second, 'synthetic')
+            self.assertEqual(self.read_game(first), self.read_game(second))
+
+            paths = FilePaths(base_dir=first)
+            paths.games = ['synthetic']
+            orchestrator = DataOrchestrator(paths)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                orchestrator.run_stages(list(STAGES))
+            self.assertEqual(len(orchestrator.rebuilt), len([stage for stage in STAGES if not missing_requirements(stage)]))
+            self.assertNotIn('Warning', output.getvalue())
+            self.assertNotIn('Mismatches found', output.getvalue())
+            self.assertEqual(len(orchestrator.store.get('synthetic', 'pokemon_master_evo')), 24)
+
+    def test_every_stage_is_benchmarked(self):
+        from benchmark import Benchmark
+        from data_orchestration import STAGES, missing_requirements
+
+        with tempfile.TemporaryDirectory() as base_dir:
+            SyntheticCorpus(scale=0.02).write_game(base_dir, 'synthetic')
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = Benchmark(base_dir).run_stages()
+        expected = [f'stage:{stage}' for stage in STAGES if not missing_requirements(stage)] + ['stage:emit']
+        self.assertEqual(list(results), expected)
+        if 'stage:export_excel' in results:
+            self.assertEqual(results['stage:export_excel']['sections'], 1)
+
+    def test_regressions_are_measured_against_the_baseline(self):
+        from benchmark import compare_to_baseline
+
+        baseline = {'1x': {'stage:parse_moves': {'seconds': 0.2, 'peak_mb': 4.0},
+                           'stage:generate_types': {'seconds': 0.001, 'peak_mb': 0.05}}}
+        report = {'1x': {'stage:parse_moves': {'seconds': 0.3, 'peak_mb': 4.1},
+                         'stage:generate_types': {'seconds': 0.004, 'peak_mb': 0.05},
+                         'stage:emit': {'seconds': 2.0, 'peak_mb': 1.0}}}
+        self.assertEqual(compare_to_baseline(report, baseline), [('1x', 'stage:parse_moves', 'seconds', 0.2, 0.3)])
+
+
+class TestRunReport(unittest.TestCase):
+    def build(self, base_dir, **options):
+        from data_orchestration import DataOrchestrator, FilePaths
+
+        paths = FilePaths(base_dir=base_dir)
+        paths.games = ['demo']
+        orchestrator = DataOrchestrator(paths, **options)
+        with contextlib.redirect_stdout(io.StringIO()):
+            orchestrator.run_stages(['parse_moves', 'generate_trainers'])
+            orchestrator.emit()
+            orchestrator.write_report()
+        with open(os.path.join(base_dir, 'build_report.json'), 'r', encoding='utf-8') as handle:
+            return json.load(handle)
+
+    def test_stage_calls_are_measured_and_reported(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            data_dir = write_sample_game(tmpdir, 'demo')
+            profile_dir = os.path.join(tmpdir, 'profiles')
+            report = self.build(tmpdir, trace_memory=True, profile_dir=profile_dir)
+
+            calls = {call['stage']: call for call in report['calls']}
+            self.assertEqual(list(calls), ['parse_moves', 'generate_trainers', 'emit'])
+            moves = calls['parse_moves']
+            self.assertEqual(moves['status'], 'built')
+            self.assertEqual(moves['records'], {'moves': 5})
+            self.assertEqual(moves['bytes_read'], os.path.getsize(os.path.join(data_dir, 'moves.txt')))
+            self.assertGreater(moves['peak_bytes'], 0)
+            self.assertGreater(moves['bytes_written'], 0)
+            self.assertEqual(moves['bytes_written'] + calls['generate_trainers']['bytes_written'],
+                             calls['emit']['bytes_written'])
+            self.assertEqual(report['stages']['parse_moves']['records'], 5)
+            self.assertIn('parse_moves-demo.prof', os.listdir(profile_dir))
+
+            report = self.build(tmpdir)
+            self.assertEqual([call['status'] for call in report['calls']], ['skipped', 'skipped', 'built'])
+            self.assertIsNone(report['calls'][0]['peak_bytes'])
+
+    def test_dict_artifacts_count_their_entries(self):
+        from stage_metrics import count_records
+
+        move_learners = {'Species': ['BULBASAUR', 'IVYSAUR', 'VENUSAUR'], 'Base': [0, 0, 0],
+                         'Moves': {'TACKLE': [[0, 1]], 'VINEWHIP': [[0, 2]]}}
+        self.assertEqual(count_records(move_learners, 'move_learners'), 2)
+        sprite_manifest = {'Folders': {
+            'Front': {'Default': '000', 'Redirects': {'ROTOM_1': 'ROTOM'}, 'Missing': ['MISSINGNO']},
+            'Back': {'Default': None, 'Redirects': {}, 'Missing': []},
+        }}
+        self.assertEqual(count_records(sprite_manifest, 'sprite_manifest'), 2)
+        self.assertEqual(count_records([{'Name': 'TACKLE'}], 'moves'), 1)
+        self.assertEqual(count_records({'BULBASAUR': [], 'IVYSAUR': []}, 'encounters_by_species'), 2)
+
+
+class TestCli(unittest.TestCase):
+    def test_games_are_discovered_from_data_folders(self):
+        from data_orchestration import FilePaths, discover_games
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'zeta')
+            write_sample_game(tmpdir, 'alpha')
+            os.makedirs(os.path.join(tmpdir, 'shared', 'images'))
+            self.assertEqual(discover_games(tmpdir), ['alpha', 'zeta'])
+            self.assertEqual(FilePaths(tmpdir, games=['zeta']).games, ['zeta'])
+
+    def test_build_runs_only_the_selected_games_and_stages(self):
+        from cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'demo')
+            write_sample_game(tmpdir, 'other')
+            with contextlib.redirect_stdout(io.StringIO()):
+                status = main(['--base-dir', tmpdir, 'build', '--games', 'demo', '--stages', 'parse_moves', '--no-validate'])
+            self.assertEqual(status, 0)
+            self.assertTrue(os.path.exists(os.path.join(tmpdir, 'demo', 'data', 'moves.json')))
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, 'demo', 'data', 'pokemon.json')))
+            self.assertFalse(os.path.exists(os.path.join(tmpdir, 'other', 'data', 'moves.json')))
+
+    def test_build_fails_when_validation_fails(self):
+        from cli import main
+
+        failing = unittest.TestResult()
+        failing.failures.append((self, 'moves.json differs from moves.txt'))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'demo')
+            with unittest.mock.patch('data_orchestration.DataOrchestrator.run_tests', return_value=failing), \
+                    contextlib.redirect_stdout(io.StringIO()):
+                status = main(['--base-dir', tmpdir, 'build', '--stages', 'parse_moves'])
+            self.assertEqual(status, 1)
+
+    def test_build_validates_only_the_data_checks(self):
+        from cli import main
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            write_sample_game(tmpdir, 'demo')
+            with unittest.mock.patch('unit_tests.run_suite', return_value=unittest.TestResult()) as run_suite, \
+                    contextlib.redirect_stdout(io.StringIO()):
+                status = main(['--base-dir', tmpdir, 'build', '--stages', 'parse_moves'])
+            self.assertEqual(status, 0)
+            self.assertEqual(run_suite.call_args.kwargs['tests'], ['TestCompareData'])
+
+    def test_importing_the_pipeline_loads_no_stage_modules(self):
+        script = ("import sys, cli, data_orchestration; "
+                  "print(sorted(m for m in ('parse_pokemon', 'moves_to_json', 'evos', 'unit_tests', 'pokedexcel') if m in sys.modules))")
+        output = subprocess.run([sys.executable, '-c', script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), '[]')
+
+
+class TestCompareData(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.base_dir = VALIDATION['base_dir']
+        cls.games = VALIDATION['games'] or get_game_names(cls.base_dir)
+        # Every game's sources and artifacts are loaded and checked once, up front
+        cls.results = validate_games(cls.games, cls.base_dir, VALIDATION['jobs'], VALIDATION['store'])
+
+    def assert_check(self, check, message):
         for game in self.games:
             with self.subTest(game=game):
-                json_file = os.path.join(self.base_dir, game, 'data', 'pokemon_master.json')
-                txt_file = os.path.join(self.base_dir, game, 'data', 'pokemon.txt')
-                if not (os.path.exists(json_file) and os.path.exists(txt_file)):
+                errors, _ = self.results[game][check]
+                if errors is None:
                     self.skipTest(f"Missing files for {game}")
-                errors = validate_and_compare(json_file, txt_file)
-                self.assertEqual(errors, [], f"Pokemon compare errors for {game}: {errors}")
+                self.assertEqual(errors, [], f"{message} for {game}: {errors}")
+
+    def test_pokemon_compare(self):
+        self.assert_check('pokemon', "Pokemon compare errors")
 
     def test_pokemon_forms(self):
-        for game in self.games:
-            with self.subTest(game=game):
-                json_file = os.path.join(self.base_dir, game, 'data', 'pokemon_master.json')
-                forms_file = os.path.join(self.base_dir, game, 'data', 'pokemon_forms.txt')
-                if not (os.path.exists(json_file) and os.path.exists(forms_file)):
-                    self.skipTest(f"Missing files for {game}")
-                with open(json_file, 'r') as f:
-                    pokemon_data = json.load(f)
-                errors = validate_forms(pokemon_data, forms_file)
-                self.assertEqual(errors, [], f"Pokemon forms errors for {game}: {errors}")
+        self.assert_check('forms', "Pokemon forms errors")
 
     def test_moves_compare(self):
-        for game in self.games:
-            with self.subTest(game=game):
-                txt_file = os.path.join(self.base_dir, game, 'data', 'moves.txt')
-                json_file = os.path.join(self.base_dir, game, 'data', 'moves.json')
-                if not (os.path.exists(json_file) and os.path.exists(txt_file)):
-                    self.skipTest(f"Missing files for {game}")
-                moves_txt = load_moves_txt(txt_file)
-                moves_json = load_moves_json(json_file)
-                mismatches = compare_moves(moves_txt, moves_json)
-                self.assertEqual(mismatches, [], f"Move compare mismatches for {game}: {mismatches}")
+        self.assert_check('moves', "Move compare mismatches")
 
     def test_abilities_compare(self):
-        for game in self.games:
-            with self.subTest(game=game):
-                txt_file = os.path.join(self.base_dir, game, 'data', 'abilities.txt')
-                json_file = os.path.join(self.base_dir, game, 'data', 'abilities.json')
-                if not (os.path.exists(json_file) and os.path.exists(txt_file)):
-                    self.skipTest(f"Missing files for {game}")
-                abilities_txt = load_abilities_txt(txt_file)
-                abilities_json = load_abilities_json(json_file)
-                mismatches = compare_abilities(abilities_txt, abilities_json)
-                self.assertEqual(mismatches, [], f"Ability compare mismatches for {game}: {mismatches}")
+        self.assert_check('abilities', "Ability compare mismatches")
 
 if __name__ == '__main__':
     result = unittest.main(exit=False)
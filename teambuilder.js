@@ -1,4 +1,4 @@
-import { normalizePokemon, findMatchingOriginal } from './utils.js';
+import { normalizePokemon, findMatchingOriginal, searchIndexLookup, searchIndexSpecies } from './utils.js';
 
 const params = new URLSearchParams(window.location.search);
 const game = params.get('game') || 'ss2';
@@ -140,6 +140,12 @@ async function init() {
     ]);
     allPokemon = await pResp.json();
     allMoves = await mResp.json();
+    // The game's compiled type chart; the built-in chart below is used when it is missing
+    [compiledTypeChart, typeMatchups, nameSearchIndex] = await Promise.all([
+      fetch(`./games/${game}/data/type_chart.json`).then(res => res.ok ? res.json() : null).catch(() => null),
+      fetch(`./games/${game}/data/type_matchups.json`).then(res => res.ok ? res.json() : null).catch(() => null),
+      fetch(`./games/${game}/data/search_index.json`).then(res => res.ok ? res.json() : null).catch(() => null)
+    ]);
     normalizedList = allPokemon.map(p => normalizePokemon(p));
 
     createTeamSlots();
@@ -613,8 +619,9 @@ function performSearch() {
     return;
   }
 
+  const nameHits = nameQ && nameSearchIndex ? searchIndexSpecies(nameSearchIndex, nameQ) : null;
   const filtered = normalizedList.filter(p => {
-    const nameMatch = !nameQ || p.Name.includes(nameQ) || (p.Forms||[]).some(f => f.name.includes(nameQ));
+    const nameMatch = !nameQ || (nameHits ? nameHits.has(p.InternalName) : p.Name.includes(nameQ) || (p.Forms||[]).some(f => f.name.includes(nameQ)));
     const typeMatch = !typeQ || (p.Types||[]).some(t => t.includes(typeQ)) || (p.Forms||[]).some(f => (f.types||[]).some(t=>t.includes(typeQ)));
     const abilityMatch = !abilityQ || (p.Abilities||[]).some(a => a.includes(abilityQ)) || (p.Forms||[]).some(f => (f.abilities||[]).some(a=>a.includes(abilityQ)));
     const freeText = !q || p.Name.includes(q) || (p.Types||[]).some(t=>t.includes(q)) || (p.Abilities||[]).some(a=>a.includes(q)) || (p.Moves||[]).some(m=>m.includes(q)) || (p.Forms||[]).some(f=> f.name.includes(q) || (f.abilities||[]).some(a=>a.includes(q)));
@@ -965,10 +972,13 @@ function renderMoveResults(query) {
   }
   const targetTypesUpper = targetTypes.map(t => t.toUpperCase());
 
+  const moveHits = q && nameSearchIndex
+    ? new Set(searchIndexLookup(nameSearchIndex, q, ['move']).map(d => d.Id.toLowerCase()))
+    : null;
   const results = allMoves.filter(m => {
     if (!m.Name) return false;
     if (allowedSet && allowedSet.size && !allowedSet.has(m.Name.toLowerCase())) return false;
-    const nameMatch = m.Name.toLowerCase().includes(q);
+    const nameMatch = moveHits ? moveHits.has(m.Name.toLowerCase()) : m.Name.toLowerCase().includes(q);
     const typeMatch = (m.Type || '').toLowerCase().includes(q);
     return !q || nameMatch || typeMatch;
   }).slice(0,200);
@@ -1088,9 +1098,38 @@ function validateEVTotals() {
   }
 }
 
+let compiledTypeChart = null;
+let typeMatchups = null;
+// Prebuilt search index (search_index.json); name searches fall back to substring matching without it
+let nameSearchIndex = null;
+
+// Precomputed defensive multipliers of a species or form, with its ability applied when that changes them
+function profileMultipliers(internalName, ability) {
+  if (!typeMatchups) return null;
+  const abilityProfiles = typeMatchups.AbilityProfiles[internalName] || {};
+  const profile = abilityProfiles[String(ability || '').toUpperCase()] || typeMatchups.Profiles[internalName];
+  if (!profile) return null;
+  const result = {};
+  typeMatchups.Types.forEach((type, i) => { result[type] = profile[i]; });
+  return result;
+}
+
+function chartTypes() {
+  return compiledTypeChart ? compiledTypeChart.Types.slice() : Object.keys(typeChart);
+}
+
 function computeDefensiveMultipliers(defTypes) {
-  const attackTypes = Object.keys(typeChart);
   const result = {};
+  if (compiledTypeChart) {
+    // Matrix rows are attacking types, columns defending types; unknown defenders are neutral
+    const { Types, Matrix } = compiledTypeChart;
+    const columns = defTypes.map(d => Types.indexOf(d)).filter(i => i >= 0);
+    Types.forEach((a, row) => {
+      result[a] = columns.reduce((mul, column) => mul * Matrix[row][column], 1);
+    });
+    return result;
+  }
+  const attackTypes = Object.keys(typeChart);
   attackTypes.forEach(a => {
     let mul = 1;
     defTypes.forEach(d => {
@@ -1125,17 +1164,19 @@ function openTypeChart() {
   if (!source) return;
 
   let types = [];
+  let profileName = source.data.InternalName;
   if (source.form !== null && source.form !== undefined && source.form !== 'base') {
     const f = source.data.Forms[Number(source.form)];
     types = (f && (f.Type1 || f.Type2)) ? [f.Type1, f.Type2].filter(Boolean) : [];
+    if (f && f.InternalName) profileName = f.InternalName;
   }
   if (!types.length) types = [source.data.Type1, source.data.Type2].filter(Boolean);
 
   const moveTypes = (source.moves && source.moves.length) ? source.moves.map(mn=> { const mv = getMoveByName(mn); return (mv && mv.Type) ? mv.Type.toUpperCase() : null }).filter(Boolean) : types;
 
   types = types.map(t => t.toUpperCase());
-  const defensive = computeDefensiveMultipliers(types);
-  const defenderTypes = Object.keys(typeChart).slice();
+  const defensive = profileMultipliers(profileName, source.ability) || computeDefensiveMultipliers(types);
+  const defenderTypes = chartTypes();
   const offensiveCoverage = computeOffensiveCoverage(moveTypes, defenderTypes);
 
   const body = document.getElementById('type-chart-body');
@@ -1143,9 +1184,9 @@ function openTypeChart() {
 
   // Defensive table
   const defTable = document.createElement('table'); defTable.className = 'type-table';
-  defTable.innerHTML = `<thead><tr><th>Attack\\Def</th>${types.map(t=>`<th>${t}</th>`).join('')}</tr></thead>`;
+  defTable.innerHTML = `<thead><tr><th>Attack\\Def</th>${types.map(t=>`<th>${t}</th>`).join('')}<th>Total</th></tr></thead>`;
   const tbody = document.createElement('tbody');
-  Object.keys(typeChart).forEach(a => {
+  chartTypes().forEach(a => {
     const row = document.createElement('tr');
     const first = document.createElement('th'); first.textContent = a;
     row.appendChild(first);
@@ -1156,6 +1197,11 @@ function openTypeChart() {
       td.className = m>1 ? 'type-strong' : (m<1 ? 'type-weak' : 'type-neutral');
       row.appendChild(td);
     });
+    const total = document.createElement('td');
+    const m = defensive[a] ?? 1;
+    total.textContent = m === 0.5 ? '½' : (m === 0.25 ? '¼' : m);
+    total.className = m>1 ? 'type-strong' : (m<1 ? 'type-weak' : 'type-neutral');
+    row.appendChild(total);
     tbody.appendChild(row);
   });
   defTable.appendChild(tbody);
@@ -1,18 +1,22 @@
 // trainer_viewer.js
 
+import { spriteUrl } from './utils.js';
+
 // Use page-specified game if available, otherwise fall back to ss2.
 const game = window.game || 'ss2';
 
 let allTrainers = [];
 let allTypes = [];
 let allPokemon = [];
+let spriteManifest = null;
 
 window.addEventListener('DOMContentLoaded', async () => {
   try {
-    [allTrainers, allTypes, allPokemon] = await Promise.all([
+    [allTrainers, allTypes, allPokemon, spriteManifest] = await Promise.all([
       fetch(`./games/${game}/data/trainers.json`).then(res => res.json()),
       fetch(`./games/${game}/data/types.json`).then(res => res.json()),
-      fetch(`./games/${game}/data/pokemon_master_evo.json`).then(res => res.json())
+      fetch(`./games/${game}/data/pokemon_master_evo.json`).then(res => res.json()),
+      fetch(`./games/${game}/data/sprite_manifest.json`).then(res => res.ok ? res.json() : null).catch(() => null)
     ]);
 
     renderTrainers(allTrainers);
@@ -42,15 +46,18 @@ function renderTrainers(trainers) {
     card.className = 'trainer-card';
 
     const trainerTypeKey = trainer.Type || '000';
-    const imageUrl = `./games/${game}/images/Trainers/${trainerTypeKey}.png`;
+    const resolvedUrl = spriteUrl(spriteManifest, game, 'Trainers', trainerTypeKey);
+    const imageUrl = resolvedUrl || `./games/${game}/images/Trainers/${trainerTypeKey}.png`;
     const trainerImage = document.createElement('img');
     trainerImage.className = 'trainer-avatar';
     trainerImage.src = imageUrl;
     trainerImage.alt = trainerTypeKey;
-    trainerImage.onerror = function () {
-      this.onerror = null;
-      this.src = `./games/${game}/images/Trainers/000.png`;
-    };
+    if (!resolvedUrl) {
+      trainerImage.onerror = function () {
+        this.onerror = null;
+        this.src = `./games/${game}/images/Trainers/000.png`;
+      };
+    }
 
     const detailsPanel = document.createElement('div');
     detailsPanel.className = 'trainer-expanded-details';
@@ -92,15 +99,18 @@ function populateTrainerDetails(detailsPanel, trainer) {
   leftPanel.className = 'trainer-left-panel';
 
   const trainerTypeKey = trainer.Type || '000';
-  const imageUrl = `./games/${game}/images/Trainers/${trainerTypeKey}.png`;
+  const resolvedUrl = spriteUrl(spriteManifest, game, 'Trainers', trainerTypeKey);
+  const imageUrl = resolvedUrl || `./games/${game}/images/Trainers/${trainerTypeKey}.png`;
   const trainerImage = document.createElement('img');
   trainerImage.className = 'trainer-avatar-expanded';
   trainerImage.src = imageUrl;
   trainerImage.alt = trainerTypeKey;
-  trainerImage.onerror = function () {
-    this.onerror = null;
-    this.src = `./games/${game}/images/Trainers/000.png`; // Default fallback
-  };
+  if (!resolvedUrl) {
+    trainerImage.onerror = function () {
+      this.onerror = null;
+      this.src = `./games/${game}/images/Trainers/000.png`; // Default fallback
+    };
+  }
 
   const trainerName = document.createElement('div');
   trainerName.className = 'trainer-name-expanded';
@@ -136,12 +146,15 @@ function populateTrainerDetails(detailsPanel, trainer) {
       // Pokémon details HTML
       const pokemonImage = document.createElement('img');
       pokemonImage.className = 'pokemon-image';
-      pokemonImage.src = `./games/${game}/images/Front/${pokemon.Species}.png`;
+      const resolvedUrl = spriteUrl(spriteManifest, game, 'Front', pokemon.Species);
+      pokemonImage.src = resolvedUrl || `./games/${game}/images/Front/${pokemon.Species}.png`;
       pokemonImage.alt = pokemon.Species;
-      pokemonImage.onerror = function () {
-        this.onerror = null;
-        this.src = `./games/${game}/images/Front/${pokemon.Species}T.png`; // Fallback
-      };
+      if (!resolvedUrl) {
+        pokemonImage.onerror = function () {
+          this.onerror = null;
+          this.src = `./games/${game}/images/Front/${pokemon.Species}T.png`; // Fallback
+        };
+      }
 
       const pokemonData = allPokemon.find(p => p.InternalName === pokemon.Species);
       if (!pokemonData) {
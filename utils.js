@@ -45,8 +45,7 @@ export function extractEggMoves(pokemon) {
   return [];
 }
 
-export function getInheritedEggMoves(pokemon, allPokemon) {
-  const parentMap = buildEvolutionParentMap(allPokemon);
+export function getInheritedEggMoves(pokemon, allPokemon, parentMap = buildEvolutionParentMap(allPokemon)) {
   const pokemonMap = new Map(allPokemon.map(p => [ (p.InternalName || '').toUpperCase(), p ]));
   const visited = new Set();
   const stack = [ (pokemon.InternalName || '').toUpperCase() ];
@@ -68,6 +67,15 @@ export function getInheritedEggMoves(pokemon, allPokemon) {
   return [...inherited];
 }
 
+// The pipeline stores each species' inherited egg moves as InheritedEggMoves, leaving
+// the field out when there are none; data built before that has none at all, so the
+// prevolutions are walked here instead
+export function inheritedEggMovesResolver(pokemons) {
+  if (pokemons.some(p => p.InheritedEggMoves)) return p => p.InheritedEggMoves || [];
+  const parentMap = buildEvolutionParentMap(pokemons);
+  return p => getInheritedEggMoves(p, pokemons, parentMap);
+}
+
 export function normalizePokemon(pokemon, extraEggMoves = []) {
   const levelUpMoves = [];
   if (Array.isArray(pokemon.Moves)) {
@@ -141,3 +149,92 @@ export function findMatchingOriginal(n, list) {
   );
 }
 
+
+function searchTokens(value) {
+  return String(value || '').toLowerCase().replace(/é/g, 'e').match(/[a-z0-9]+/g) || [];
+}
+
+// Same matching as SearchIndex.lookup in improved_python/search_index.py: words of up
+// to two characters match the start of a token, longer ones anywhere in the name
+export function searchIndexLookup(index, query, kinds = null) {
+  const words = searchTokens(query).sort((a, b) => b.length - a.length);
+  if (!words.length) return [];
+  if (!index._compact) index._compact = index.Documents.map(d => d.Tokens.join(''));
+  let matches = null;
+  for (const word of words) {
+    let candidates;
+    if (word.length <= 2) {
+      candidates = new Set(index.Prefixes[word] || []);
+    } else {
+      const postings = [];
+      for (let i = 0; i + 3 <= word.length; i++) postings.push(index.Trigrams[word.slice(i, i + 3)] || []);
+      postings.sort((a, b) => a.length - b.length);
+      const others = postings.slice(1).map(entries => new Set(entries));
+      candidates = new Set(postings[0].filter(position =>
+        others.every(entries => entries.has(position)) && index._compact[position].includes(word)));
+    }
+    matches = matches ? new Set([...matches].filter(position => candidates.has(position))) : candidates;
+    if (!matches.size) return [];
+  }
+  return [...matches]
+    .filter(position => !kinds || kinds.includes(index.Documents[position].Kind))
+    .sort((a, b) => index.Ranks[a] - index.Ranks[b])
+    .map(position => index.Documents[position]);
+}
+
+// Lowercased InternalNames of the species whose name or one of whose forms matches
+export function searchIndexSpecies(index, query) {
+  return new Set(searchIndexLookup(index, query, ['pokemon', 'form'])
+    .map(d => (d.Base || d.Id).toLowerCase()));
+}
+
+// URL of the smallest transcoded variant (sprite_variants.json) at least displayWidth
+// CSS pixels wide on this screen, or null when the build made none for the sprite
+export function spriteVariantUrl(variants, game, folder, stem, displayWidth) {
+  const widths = variants && variants.Folders[folder] && variants.Folders[folder][stem];
+  if (!widths || !variants.Formats.length) return null;
+  const needed = displayWidth * (window.devicePixelRatio || 1);
+  const width = widths.find(w => w >= needed) || widths[widths.length - 1];
+  return `./games/${game}/images/variants/${encodeURIComponent(folder)}/${encodeURIComponent(stem)}-${width}.${variants.Formats[0]}`;
+}
+
+// Builds encounters_by_species from encounters.json for games built before the
+// pipeline emitted it: every species' locations, sorted by MapID
+export function encountersBySpecies(encounterMaps) {
+  const mapOrder = map => /^\d+$/.test(map.MapID) ? Number(map.MapID) : Infinity;
+  const index = {};
+  [...encounterMaps].sort((a, b) => mapOrder(a) - mapOrder(b)).forEach(map => {
+    Object.entries(map.Encounters || {}).forEach(([method, details]) => {
+      (details.Pokemon || []).forEach(slot => {
+        const speciesName = String(slot.Species || '').toUpperCase();
+        if (!speciesName) return;
+        (index[speciesName] = index[speciesName] || []).push({
+          MapID: map.MapID,
+          MapName: map.MapName,
+          Method: method,
+          Rate: details.Rate,
+          Chance: slot.Chance,
+          MinLevel: slot.MinLevel ?? slot.Level,
+          MaxLevel: slot.MaxLevel ?? slot.Level
+        });
+      });
+    });
+  });
+  return index;
+}
+
+// File stem a folder draws name with, per sprite_manifest.json: the name itself,
+// the sprite it borrows, or the placeholder. Null when the build made no manifest
+// for the folder, so callers keep their own fallbacks
+export function spriteStem(manifest, folder, name) {
+  const entry = manifest && manifest.Folders[folder];
+  if (!entry) return null;
+  if (!entry.missingSet) entry.missingSet = new Set(entry.Missing);
+  if (entry.missingSet.has(name)) return entry.Default || '000';
+  return entry.Redirects[name] || name;
+}
+
+export function spriteUrl(manifest, game, folder, name) {
+  const stem = spriteStem(manifest, folder, name);
+  return stem === null ? null : `./games/${game}/images/${folder}/${stem}.png`;
+}
@@ -2,7 +2,7 @@ const params = new URLSearchParams(window.location.search);
 const game = params.get('game');
 const notice = document.getElementById('notice');
 const pokedexWrapper = document.getElementById('pokedex-wrapper');
-import { normalizePokemon, findMatchingOriginal, getInheritedEggMoves } from './utils.js';
+import { normalizePokemon, findMatchingOriginal, inheritedEggMovesResolver, searchIndexSpecies, encountersBySpecies, spriteVariantUrl, spriteStem, spriteUrl } from './utils.js';
 if (game) {
   loadPokedex(game, pokedexWrapper);
 } else {
@@ -11,6 +11,9 @@ if (game) {
 
 
 let normalizedList = [];
+let searchIndex = null;
+let spriteVariants = null;
+let spriteManifest = null;
 
 let config = { excludedPokemon: [], AllowsForms: "Y" };
 
@@ -38,53 +41,44 @@ async function loadPokedex(game, container = document.getElementById('pokedex-co
   }
 
   try {
-    const response = await fetch(`./games/${game}/data/pokemon_master_evo.json`);
+    // The card index is enough to draw and filter the list; move lists come from the
+    // full records, fetched on the first move search. Without an index the full records are used
+    const masterPath = `./games/${game}/data/pokemon_master_evo.json`;
+    const indexResp = await fetch(`./games/${game}/data/pokemon_index.json`).catch(() => null);
+    const usingIndex = Boolean(indexResp && indexResp.ok);
+    const response = usingIndex ? indexResp : await fetch(masterPath);
     console.log('Fetch response:', response);
     const pokemons = await response.json();
     console.log('Pokemons data:', pokemons);
-
-    const pokemonsWithInheritedEggMoves = pokemons.map(pokemon => {
-      const inheritedEggMoves = getInheritedEggMoves(pokemon, pokemons);
-      const ownEggMoves = Array.isArray(pokemon.EggMoves)
-        ? pokemon.EggMoves.map(m => m.trim()).filter(Boolean)
-        : typeof pokemon.EggMoves === 'string'
-          ? pokemon.EggMoves.split(',').map(m => m.trim()).filter(Boolean)
-          : [];
-      return {
-        ...pokemon,
-        EggMoves: [...new Set([...ownEggMoves, ...inheritedEggMoves])]
-      };
-    });
-
-    normalizedList = pokemonsWithInheritedEggMoves.map(p => normalizePokemon(p));
+    let moveListsPromise = usingIndex ? null : Promise.resolve();
+    [searchIndex, spriteVariants, spriteManifest] = await Promise.all([
+      fetch(`./games/${game}/data/search_index.json`).then(res => res.ok ? res.json() : null).catch(() => null),
+      fetch(`./games/${game}/data/sprite_variants.json`).then(res => res.ok ? res.json() : null).catch(() => null),
+      fetch(`./games/${game}/data/sprite_manifest.json`).then(res => res.ok ? res.json() : null).catch(() => null)
+    ]);
+
+    // Egg moves inherited from prevolutions are resolved by the pipeline; the card
+    // index has no move lists, which loadMoveLists fills in with their egg moves
+    const inheritedEggMoves = usingIndex ? () => [] : inheritedEggMovesResolver(pokemons);
+    normalizedList = pokemons.map(p => normalizePokemon(p, inheritedEggMoves(p)));
     console.log('Normalized list:', normalizedList);
 
     try {
-      const encounterResp = await fetch(`./games/${game}/data/encounters.json`);
-      if (encounterResp.ok) {
-        const encounterData = await encounterResp.json();
+      const encounterResp = await fetch(`./games/${game}/data/encounters_by_species.json`);
+      const tableResp = encounterResp.ok ? null : await fetch(`./games/${game}/data/encounters.json`);
+      if (encounterResp.ok || tableResp.ok) {
+        const speciesEncounters = encounterResp.ok
+          ? await encounterResp.json()
+          : encountersBySpecies(await tableResp.json());
         const encounterLocations = new Map();
 
-        encounterData.forEach(map => {
-          const mapName = map.MapName || map.MapID || 'Unknown Location';
-          const encounters = map.Encounters || {};
-
-          Object.entries(encounters).forEach(([encounterType, details]) => {
-            const locationLabel = encounterType
-              ? `${mapName} (${encounterType})`
-              : mapName;
-            const pokemonEntries = Array.isArray(details?.Pokemon) ? details.Pokemon : [];
-
-            pokemonEntries.forEach(entry => {
-              const speciesName = String(entry?.Species || '').toUpperCase();
-              if (!speciesName) return;
-
-              if (!encounterLocations.has(speciesName)) {
-                encounterLocations.set(speciesName, new Set());
-              }
-              encounterLocations.get(speciesName).add(locationLabel);
-            });
+        Object.entries(speciesEncounters).forEach(([speciesName, locations]) => {
+          const labels = new Set();
+          locations.forEach(location => {
+            const mapName = location.MapName || location.MapID || 'Unknown Location';
+            labels.add(location.Method ? `${mapName} (${location.Method})` : mapName);
           });
+          encounterLocations.set(speciesName, labels);
         });
 
         normalizedList = normalizedList.map(p => ({
@@ -145,6 +139,20 @@ async function loadPokedex(game, container = document.getElementById('pokedex-co
       matchingOriginal.filter(p => p).forEach(p => renderPokemonCard(p));
     }
     
+    function loadMoveLists() {
+      if (!moveListsPromise) {
+        moveListsPromise = fetch(masterPath).then(res => res.json()).then(records => {
+          const byName = new Map(records.map(r => [(r.InternalName || '').toLowerCase(), r]));
+          const inheritedEggMoves = inheritedEggMovesResolver(records);
+          normalizedList.forEach(p => {
+            const record = byName.get(p.InternalName);
+            if (record) p.Moves = normalizePokemon(record, inheritedEggMoves(record)).Moves;
+          });
+        });
+      }
+      return moveListsPromise;
+    }
+
     function applyFilters() {
       const generalQuery = document.getElementById('search-bar').value.toLowerCase().trim();
       const nameQuery = document.getElementById('name-search').value.toLowerCase().trim();
@@ -153,6 +161,10 @@ async function loadPokedex(game, container = document.getElementById('pokedex-co
       const moveQuery = document.getElementById('move-search').value.toLowerCase().trim();
       const itemQuery = document.getElementById('item-search').value.toLowerCase().trim();
       const locationQuery = document.getElementById('location-search').value.toLowerCase().trim();
+      const nameHits = nameQuery && searchIndex ? searchIndexSpecies(searchIndex, nameQuery) : null;
+      if (moveQuery && !moveListsPromise) {
+        loadMoveLists().then(applyFilters).catch(e => console.warn('Unable to load move lists for', game, e));
+      }
 
       const filtered = normalizedList.filter(p => {
         const generalMatch =
@@ -170,8 +182,9 @@ async function loadPokedex(game, container = document.getElementById('pokedex-co
 
         const nameMatch =
           !nameQuery ||
-          p.Name.includes(nameQuery) ||
-          (p.Forms || []).some(f => f.name.includes(nameQuery));
+          (nameHits
+            ? nameHits.has(p.InternalName)
+            : p.Name.includes(nameQuery) || (p.Forms || []).some(f => f.name.includes(nameQuery)));
 
         const typeMatch =
           !typeQuery ||
@@ -341,11 +354,17 @@ async function loadPokedex(game, container = document.getElementById('pokedex-co
       }
 
       const image = document.createElement('img');
-      image.src = `./games/${game}/images/Front/${pokemon.InternalName}.png`;
-      image.onerror = function () {
-        this.onerror = null;
-        this.src = `./games/${game}/images/Front/${pokemon.InternalName}T.png`; // Fallback image
-      };
+      // The sprite manifest names the file that exists; without it the T sprite is tried on error
+      const stem = spriteStem(spriteManifest, 'Front', pokemon.InternalName);
+      // Cards are 80px wide, so a transcoded variant of about that width is enough
+      image.src = spriteVariantUrl(spriteVariants, game, 'Front', stem || pokemon.InternalName, 80)
+        || `./games/${game}/images/Front/${stem || pokemon.InternalName}.png`;
+      if (stem === null) {
+        image.onerror = function () {
+          this.onerror = null;
+          this.src = `./games/${game}/images/Front/${pokemon.InternalName}T.png`; // Fallback image
+        };
+      }
       image.alt = pokemon.Name;
       image.className = 'pokemon-image';
 
@@ -410,7 +429,10 @@ async function loadPokedex(game, container = document.getElementById('pokedex-co
             (form.FormName && form.FormName.toLowerCase().includes('anomaly')) ||
             (form.InternalName && form.InternalName.toLowerCase().includes('anomaly'));
 
-          if (isAnomaly) {
+          const resolvedUrl = form.InternalName && spriteUrl(spriteManifest, game, 'Front', form.InternalName);
+          if (resolvedUrl) {
+            formImage.src = resolvedUrl;
+          } else if (isAnomaly) {
             const trimmedName = baseInternalName.slice(0, -1);
             applyImageFallback(formImage, [
               `./games/${game}/images/Front/${baseInternalName}.png`,